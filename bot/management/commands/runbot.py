@@ -76,11 +76,11 @@ class Command(BaseCommand):
     def handle_goals_command(self, tg_user: TgUser, message: Message) -> None:
 
         goals: List[Goal] = Goal.objects.select_related('user').filter(
-            category__board__participants__user=tg_user.user
+            board__participants__user=tg_user.user
             ).exclude(is_deleted=True
                       ).exclude(status=Goal.Status.archived
                                 ).exclude(category__is_deleted=True
-                                          ).exclude(category__board__is_deleted=True)
+                                          ).exclude(board__is_deleted=True)
 
         if goals:
             text: str = 'Your goals:\n' + '\n'.join(f'{goal.id}) {goal.title}' for goal in goals)
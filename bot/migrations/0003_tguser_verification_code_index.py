@@ -0,0 +1,18 @@
+# Generated by Django 4.2 on 2026-10-18 06:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('bot', '0002_alter_tguser_user_ud'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='tguser',
+            name='verification_code',
+            field=models.CharField(blank=True, db_index=True, max_length=20, null=True),
+        ),
+    ]
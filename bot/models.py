@@ -10,7 +10,7 @@ class TgUser(models.Model):
     user = models.OneToOneField(User, on_delete=models.CASCADE, null=True, blank=True)
     user_ud = models.BigIntegerField(null=True, blank=True, default=None)
     username = models.CharField(max_length=150, verbose_name='tg username', null=True, blank=True, default=None)
-    verification_code = models.CharField(max_length=20, null=True, blank=True)
+    verification_code = models.CharField(max_length=20, null=True, blank=True, db_index=True)
 
     def __str__(self) -> str:
 
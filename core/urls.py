@@ -3,9 +3,11 @@ from django.urls import path
 
 from core.views import UserCreateView, LoginView, ProfileView, UpdatePasswordView
 
+app_name = 'core'
+
 urlpatterns = [
-    path('signup', UserCreateView.as_view()),
-    path('login', LoginView.as_view()),
-    path('profile', ProfileView.as_view()),
-    path('update_password', UpdatePasswordView.as_view()),
+    path('signup', UserCreateView.as_view(), name='signup'),
+    path('login', LoginView.as_view(), name='login'),
+    path('profile', ProfileView.as_view(), name='profile'),
+    path('update_password', UpdatePasswordView.as_view(), name='update_password'),
 ]
@@ -0,0 +1,81 @@
+import datetime
+from typing import List, Set, Tuple, Type
+
+from django.db import connection, models, transaction
+from django.utils import timezone
+from rest_framework import permissions
+
+from goals import events
+from goals.cache import bump_board_generation
+from goals.models import (ArchivedGoal, ArchivedGoalComment, Goal, GoalComment, GoalCommentWithArchived,
+                          GoalWithArchived)
+
+
+INCLUDE_ARCHIVED_PARAM: str = "include_archived"
+
+
+def include_archived(request) -> bool:
+    """
+    True for reads that asked for ``?include_archived=true``; writes only ever reach live rows.
+    """
+    return (request.method in permissions.SAFE_METHODS
+            and request.query_params.get(INCLUDE_ARCHIVED_PARAM, "").lower() in ("1", "true"))
+
+
+def goal_model(request) -> Type[models.Model]:
+
+    return GoalWithArchived if include_archived(request) else Goal
+
+
+def comment_model(request) -> Type[models.Model]:
+
+    return GoalCommentWithArchived if include_archived(request) else GoalComment
+
+
+def archivable_goals(before: datetime.datetime) -> models.QuerySet:
+    """
+    Goals archived or soft deleted, and untouched since ``before``.
+    """
+    return Goal.objects.filter(models.Q(status=Goal.Status.archived) | models.Q(is_deleted=True), updated__lt=before)
+
+
+def _copy_rows(cursor, source: Type[models.Model], target: Type[models.Model], key: str, ids: List[int],
+               archived: datetime.datetime) -> int:
+
+    columns: str = ", ".join(field.column for field in target._meta.concrete_fields if field.name != "archived")
+    cursor.execute(
+        f"INSERT INTO {target._meta.db_table} ({columns}, archived) "
+        f"SELECT {columns}, %s FROM {source._meta.db_table} WHERE {key} = ANY(%s)",
+        [archived, ids],
+    )
+    return cursor.rowcount
+
+
+def archive_batch(before: datetime.datetime, batch_size: int) -> Tuple[int, int]:
+    """
+    Moves up to ``batch_size`` archivable goals, lowest ids first, and their comments to the archive
+    tables in one short transaction. Returns the number of goals and comments moved.
+
+    Rows are copied and deleted with plain SQL: the delete triggers keep the board counters and the sync
+    tombstones right, the cache generations and board events are bumped here.
+    """
+    with transaction.atomic():
+        rows: List[Tuple[int, int]] = list(
+            archivable_goals(before).order_by("id").select_for_update(skip_locked=True).values_list(
+                "id", "board_id")[:batch_size]
+        )
+        if not rows:
+            return 0, 0
+        ids: List[int] = [goal_id for goal_id, _ in rows]
+        boards: Set[int] = {board_id for _, board_id in rows}
+        archived: datetime.datetime = timezone.now()
+
+        with connection.cursor() as cursor:
+            goals: int = _copy_rows(cursor, Goal, ArchivedGoal, "id", ids, archived)
+            comments: int = _copy_rows(cursor, GoalComment, ArchivedGoalComment, "goal_id", ids, archived)
+            cursor.execute(f"DELETE FROM {GoalComment._meta.db_table} WHERE goal_id = ANY(%s)", [ids])
+            cursor.execute(f"DELETE FROM {Goal._meta.db_table} WHERE id = ANY(%s)", [ids])
+
+        bump_board_generation(*boards)
+        events.board_changed(*boards)
+    return goals, comments
@@ -0,0 +1,191 @@
+from typing import Dict, List, Optional, Tuple, Type
+
+from asgiref.sync import sync_to_async
+from django.core.exceptions import ValidationError
+from django.db import models
+from django.http import Http404, HttpRequest, HttpResponse
+from django.utils.decorators import classonlymethod
+from django.views import View
+from django.views.decorators.csrf import csrf_exempt
+from rest_framework import status
+from rest_framework.generics import GenericAPIView
+from rest_framework.request import Request
+from rest_framework.response import Response
+
+from goals import views
+from goals.mixins import ConditionalListMixin, RowListMixin
+from goals.roles import get_board_roles
+from goals.row_serializers import RowSerializer, get_row_serializer
+
+
+class AsyncAPIView(View):
+    """
+    Async GET front of a DRF generic view.
+
+    The DRF view still owns the queryset, filters, permissions, pagination and serializers; only
+    the database reads of a GET go through the async ORM. Board roles are loaded up front, so the
+    permission checks run in memory. Every other method is handed to the sync view.
+    """
+
+    view_class: Type[GenericAPIView]
+
+    @classonlymethod
+    def as_view(cls, **initkwargs):
+
+        # the DRF view enforces CSRF for session authentication itself
+        return csrf_exempt(super().as_view(**initkwargs))
+
+    def get_drf_view(self, request: HttpRequest, *args, **kwargs) -> Tuple[GenericAPIView, Request]:
+
+        view: GenericAPIView = self.view_class()
+        view.args, view.kwargs = args, kwargs
+        view.headers = view.default_response_headers
+        view.request = view.initialize_request(request, *args, **kwargs)
+        return view, view.request
+
+    async def get(self, request: HttpRequest, *args, **kwargs) -> HttpResponse:
+
+        view, drf_request = self.get_drf_view(request, *args, **kwargs)
+        try:
+            # authentication may read the session, the rest of initial() is query free once roles are loaded
+            await sync_to_async(lambda: drf_request.user)()
+            await get_board_roles(drf_request).aload()
+            view.initial(drf_request, *args, **kwargs)
+            response: HttpResponse = await self.handle(view, drf_request)
+        except Exception as exc:
+            response = view.handle_exception(exc)
+
+        response = view.finalize_response(drf_request, response, *args, **kwargs)
+        if hasattr(response, "render"):
+            response.render()
+        return response
+
+    async def handle(self, view: GenericAPIView, request: Request) -> HttpResponse:
+
+        raise NotImplementedError
+
+    async def delegate(self, request: HttpRequest, *args, **kwargs) -> HttpResponse:
+
+        response: HttpResponse = await sync_to_async(self.view_class.as_view())(request, *args, **kwargs)
+        if hasattr(response, "render"):
+            response.render()
+        return response
+
+    options = delegate
+
+
+class AsyncListView(AsyncAPIView):
+    """
+    Async list GET: filtering, the conditional GET validators, the page, its count and sideloads are
+    read with the async ORM and serialized like the sync view does. The response cache of the sync
+    view is not consulted.
+    """
+
+    async def handle(self, view: GenericAPIView, request: Request) -> HttpResponse:
+
+        # filter backends may query (ModelChoiceFilter), so they run in the request's sync thread
+        queryset: models.QuerySet = await sync_to_async(view.filter_queryset)(view.get_queryset())
+
+        validators: Optional[dict] = None
+        if isinstance(view, ConditionalListMixin):
+            validators = await sync_to_async(view.get_list_validators)(queryset)
+            etag: str = view.make_etag(request, validators)
+            if view.is_not_modified(request, etag):
+                response: HttpResponse = Response(status=status.HTTP_304_NOT_MODIFIED)
+            else:
+                response = await self.list(view, request, queryset)
+            response["ETag"] = etag
+            return response
+
+        return await self.list(view, request, queryset)
+
+    async def list(self, view: GenericAPIView, request: Request, queryset: models.QuerySet) -> Response:
+
+        row_serializer: Optional[RowSerializer] = None
+        if isinstance(view, RowListMixin) and view.row_serializer_class is not None:
+            row_serializer = get_row_serializer(view.row_serializer_class, view.get_sideload(request))
+            queryset = row_serializer.values(queryset)
+
+        page: Optional[list] = None
+        if view.paginator is not None:
+            page = await view.paginator.apaginate_queryset(queryset, request, view=view)
+        rows: list = page if page is not None else [row async for row in queryset]
+
+        if row_serializer is None:
+            data: List[dict] = view.get_serializer(rows, many=True).data
+            return view.get_paginated_response(data) if page is not None else Response(data)
+
+        data = row_serializer.serialize(rows)
+        sideloads: Dict[str, dict] = await row_serializer.aload_sideloads(data)
+        return view.get_list_response(data, page is not None, sideloads)
+
+
+class AsyncRetrieveView(AsyncAPIView):
+    """
+    Async retrieve GET, the object is read with ``afirst()``; PUT, PATCH and DELETE go to the sync view.
+    """
+
+    select_related: Tuple[str, ...] = ()
+
+    async def handle(self, view: GenericAPIView, request: Request) -> HttpResponse:
+
+        lookup_url_kwarg: str = view.lookup_url_kwarg or view.lookup_field
+        queryset: models.QuerySet = view.filter_queryset(view.get_queryset())
+        if self.select_related:
+            queryset = queryset.select_related(*self.select_related)
+        try:
+            obj: Optional[models.Model] = await queryset.filter(
+                **{view.lookup_field: view.kwargs[lookup_url_kwarg]}).afirst()
+        except (TypeError, ValueError, ValidationError):
+            obj = None
+        if obj is None:
+            raise Http404
+
+        view.check_object_permissions(request, obj)
+        return Response(view.get_serializer(obj).data)
+
+    put = AsyncAPIView.delegate
+    patch = AsyncAPIView.delegate
+    delete = AsyncAPIView.delegate
+
+
+class GoalCategoryListAsyncView(AsyncListView):
+
+    view_class = views.GoalCategoryListView
+
+
+class GoalCategoryAsyncView(AsyncRetrieveView):
+
+    view_class = views.GoalCategoryView
+
+
+class GoalListAsyncView(AsyncListView):
+
+    view_class = views.GoalListView
+
+
+class GoalAsyncView(AsyncRetrieveView):
+
+    view_class = views.GoalView
+    select_related = ("user",)
+
+
+class GoalCommentListAsyncView(AsyncListView):
+
+    view_class = views.GoalCommentListView
+
+
+class GoalCommentAsyncView(AsyncRetrieveView):
+
+    view_class = views.GoalCommentView
+    select_related = ("user",)
+
+
+class BoardListAsyncView(AsyncListView):
+
+    view_class = views.BoardListView
+
+
+class BoardAsyncView(AsyncRetrieveView):
+
+    view_class = views.BoardView
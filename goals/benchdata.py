@@ -0,0 +1,34 @@
+import datetime
+from typing import List, Tuple
+
+from django.utils import timezone
+
+from core.models import User
+from goals.models import Board, BoardParticipant, Goal, GoalCategory, GoalComment
+
+
+def seed_board(size: int, categories: int = 1, comments: bool = True) -> Tuple[User, Board]:
+    """
+    A board owned by a fresh ``bench-<timestamp>`` user with ``size`` goals spread over ``categories``
+    categories, statuses, priorities and due dates, and one comment per goal when ``comments`` is set.
+    The benchmark commands roll it back or delete the board when done.
+    """
+    now: datetime.datetime = timezone.now()
+    user: User = User.objects.create(username=f"bench-{now.timestamp()}", email="bench@example.com")
+    board: Board = Board.objects.create(title="bench")
+    BoardParticipant.objects.create(board=board, user=user)
+    board_categories: List[GoalCategory] = [
+        GoalCategory.objects.create(board=board, user=user, title=f"category {i}") for i in range(categories)
+    ]
+    goals: List[Goal] = Goal.objects.bulk_create(
+        Goal(user=user, category=board_categories[i % categories], board=board, title=f"goal {i}",
+             description="description", status=i % 3 + 1, priority=i % 4 + 1,
+             due_date=now.date() + datetime.timedelta(days=i % 60 - 30), created=now, updated=now)
+        for i in range(size)
+    )
+    if comments:
+        GoalComment.objects.bulk_create(
+            GoalComment(user=user, goal=goal, board=board, text="comment", created=now, updated=now)
+            for goal in goals
+        )
+    return user, board
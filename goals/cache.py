@@ -0,0 +1,77 @@
+import hashlib
+import time
+from typing import Dict, Iterable
+
+from django.core.cache import BaseCache, caches
+from django.db import transaction
+
+
+CACHE_ALIAS: str = "goals"
+HITS_KEY: str = "goals:response_cache:hits"
+MISSES_KEY: str = "goals:response_cache:misses"
+
+
+def get_cache() -> BaseCache:
+
+    return caches[CACHE_ALIAS]
+
+
+def _generation_key(board_id: int) -> str:
+
+    return f"goals:board_generation:{board_id}"
+
+
+def board_generations(board_ids: Iterable[int]) -> Dict[int, int]:
+    """
+    Returns the current generation of every board. A generation that is missing (never set or
+    evicted) is started from a fresh unique value, so entries cached under an older one never match.
+    """
+    cache: BaseCache = get_cache()
+    keys: Dict[str, int] = {_generation_key(board_id): board_id for board_id in board_ids}
+    found: dict = cache.get_many(keys)
+    generations: Dict[int, int] = {keys[key]: value for key, value in found.items()}
+
+    missing: Dict[str, int] = {key: time.time_ns() for key in keys if key not in found}
+    if missing:
+        cache.set_many(missing, timeout=None)
+        generations.update({keys[key]: value for key, value in missing.items()})
+    return generations
+
+
+def bump_board_generation(*board_ids: int) -> None:
+    """
+    Invalidates every cached response that covers one of the boards, once the current
+    transaction commits.
+    """
+    board_ids = tuple({board_id for board_id in board_ids if board_id is not None})
+    if not board_ids:
+        return
+
+    def bump() -> None:
+        get_cache().set_many({_generation_key(board_id): time.time_ns() for board_id in board_ids}, timeout=None)
+
+    transaction.on_commit(bump)
+
+
+def make_response_key(scope: str, user_id: int, generations: Dict[int, int], params: Iterable[tuple]) -> str:
+
+    boards: str = ",".join(f"{board_id}.{generation}" for board_id, generation in sorted(generations.items()))
+    query: str = "&".join(f"{key}={value}" for key, value in sorted(params))
+    digest: str = hashlib.md5(f"{scope}|{user_id}|{boards}|{query}".encode()).hexdigest()
+    return f"goals:response:{digest}"
+
+
+def count(key: str) -> None:
+
+    cache: BaseCache = get_cache()
+    if not cache.add(key, 1, timeout=None):
+        try:
+            cache.incr(key)
+        except ValueError:
+            cache.set(key, 1, timeout=None)
+
+
+def response_cache_stats() -> Dict[str, int]:
+
+    stats: dict = get_cache().get_many([HITS_KEY, MISSES_KEY])
+    return {"hits": stats.get(HITS_KEY, 0), "misses": stats.get(MISSES_KEY, 0)}
@@ -0,0 +1,146 @@
+import logging
+import threading
+import time
+from typing import Iterable, List, Optional
+
+from django.conf import settings
+from django.db import close_old_connections, connection, models, transaction
+from django.utils import timezone
+
+from goals import events
+from goals.cache import bump_board_generation
+from goals.models import Board, CascadeDeletion, Goal, GoalCategory
+
+
+logger = logging.getLogger(__name__)
+
+
+def _stage_queryset(job: CascadeDeletion) -> models.QuerySet:
+
+    if job.stage == CascadeDeletion.Stage.categories:
+        return GoalCategory.objects.filter(board_id=job.board_id)
+    if job.category_id is not None:
+        return Goal.objects.filter(category_id=job.category_id)
+    return Goal.objects.filter(board_id=job.board_id)
+
+
+def _stage_changes(job: CascadeDeletion) -> dict:
+
+    if job.stage == CascadeDeletion.Stage.categories:
+        return {"is_deleted": True, "updated": timezone.now()}
+    return {"status": Goal.Status.archived, "updated": timezone.now()}
+
+
+def _exceeds_sync_limit(goals: models.QuerySet) -> bool:
+
+    limit: int = settings.GOALS_CASCADE_SYNC_LIMIT
+    return goals.order_by()[:limit + 1].count() > limit
+
+
+def delete_board(board: Board) -> Optional[CascadeDeletion]:
+    """
+    Marks the board deleted. Boards with up to GOALS_CASCADE_SYNC_LIMIT goals have their categories
+    and goals archived right away, larger ones get a CascadeDeletion job that works through them in chunks.
+    """
+    with transaction.atomic():
+        board.is_deleted = True
+        board.save()
+        bump_board_generation(board.id)
+
+        goals: models.QuerySet = Goal.objects.filter(board=board)
+        if not _exceeds_sync_limit(goals):
+            board.categories.update(is_deleted=True, updated=timezone.now())
+            goals.update(status=Goal.Status.archived, updated=timezone.now())
+            events.board_changed(board.id)
+            return None
+
+        job: CascadeDeletion = CascadeDeletion.objects.create(
+            board=board, total=board.categories.count() + goals.count())
+        transaction.on_commit(lambda: start_cascade(job.id))
+        return job
+
+
+def delete_category(category: GoalCategory) -> Optional[CascadeDeletion]:
+    """
+    Marks the category deleted and archives its goals, in chunks when there are more than
+    GOALS_CASCADE_SYNC_LIMIT of them.
+    """
+    with transaction.atomic():
+        category.is_deleted = True
+        category.save(update_fields=("is_deleted",))
+        bump_board_generation(category.board_id)
+
+        goals: models.QuerySet = category.goal_set.all()
+        if not _exceeds_sync_limit(goals):
+            goals.update(status=Goal.Status.archived, updated=timezone.now())
+            events.board_changed(category.board_id)
+            return None
+
+        job: CascadeDeletion = CascadeDeletion.objects.create(
+            board_id=category.board_id, category=category, stage=CascadeDeletion.Stage.goals, total=goals.count())
+        transaction.on_commit(lambda: start_cascade(job.id))
+        return job
+
+
+def process_chunk(job_id: int) -> Optional[CascadeDeletion]:
+    """
+    Archives the next id range of the job in its own transaction and records how far it got.
+    Returns None when another worker holds the job.
+    """
+    chunk_size: int = settings.GOALS_CASCADE_CHUNK_SIZE
+
+    with transaction.atomic():
+        job: Optional[CascadeDeletion] = CascadeDeletion.objects.select_for_update(skip_locked=True).filter(
+            pk=job_id).first()
+        if job is None or job.stage == CascadeDeletion.Stage.finished:
+            return job
+
+        pending: models.QuerySet = _stage_queryset(job).filter(id__gt=job.last_id)
+        ids: List[int] = list(pending.order_by("id").values_list("id", flat=True)[:chunk_size])
+        if ids:
+            pending.filter(id__lte=ids[-1]).update(**_stage_changes(job))
+            job.last_id = ids[-1]
+            job.processed += len(ids)
+            bump_board_generation(job.board_id)
+            events.board_changed(job.board_id)
+        if len(ids) < chunk_size:
+            job.stage += 1
+            job.last_id = 0
+        job.save()
+        return job
+
+
+def run_cascade(job_id: int) -> Optional[CascadeDeletion]:
+
+    pause: float = settings.GOALS_CASCADE_CHUNK_PAUSE
+    job: Optional[CascadeDeletion] = process_chunk(job_id)
+    while job is not None and job.stage != CascadeDeletion.Stage.finished:
+        if pause:
+            time.sleep(pause)
+        job = process_chunk(job_id)
+    return job
+
+
+def _run_in_thread(job_id: int) -> None:
+
+    close_old_connections()
+    try:
+        run_cascade(job_id)
+    except Exception:
+        logger.exception("cascade deletion %s stopped, resume it with manage.py cascade", job_id)
+    finally:
+        connection.close()
+
+
+def start_cascade(job_id: int) -> None:
+    """
+    Runs the job in a background thread, unless GOALS_CASCADE_BACKGROUND is off and it is left
+    to the cascade management command.
+    """
+    if settings.GOALS_CASCADE_BACKGROUND:
+        threading.Thread(target=_run_in_thread, args=(job_id,), name=f"cascade-{job_id}", daemon=True).start()
+
+
+def pending_cascades() -> Iterable[CascadeDeletion]:
+
+    return CascadeDeletion.objects.exclude(stage=CascadeDeletion.Stage.finished).order_by("id")
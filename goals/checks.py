@@ -0,0 +1,42 @@
+from typing import List
+
+from django.conf import settings
+from django.core.cache import DEFAULT_CACHE_ALIAS
+from django.core.checks import Error, register
+
+from goals.cache import CACHE_ALIAS
+
+
+PER_PROCESS_BACKENDS = ("django.core.cache.backends.locmem.LocMemCache",)
+
+
+@register()
+def check_response_cache_backend(app_configs, **kwargs) -> List[Error]:
+    """
+    Board generations are bumped in the cache of the writing process only, so with a per-process
+    backend every other worker keeps serving its cached lists until they expire.
+    """
+    backend: str = settings.CACHES.get(CACHE_ALIAS, {}).get("BACKEND", "")
+    if settings.GOALS_RESPONSE_CACHE and backend in PER_PROCESS_BACKENDS:
+        return [Error(
+            f"GOALS_RESPONSE_CACHE needs a cache shared by all workers, the {CACHE_ALIAS!r} cache uses {backend}.",
+            hint="Set GOALS_CACHE_BACKEND (and GOALS_CACHE_LOCATION) to Redis or Memcached.",
+            id="goals.E001",
+        )]
+    return []
+
+
+@register()
+def check_board_roles_cache_backend(app_configs, **kwargs) -> List[Error]:
+    """
+    A participant change drops the cached roles in the writing process only, so with a per-process
+    backend other workers keep granting the old roles until BOARD_ROLES_CACHE_TIMEOUT.
+    """
+    backend: str = settings.CACHES.get(DEFAULT_CACHE_ALIAS, {}).get("BACKEND", "")
+    if settings.BOARD_ROLES_CACHE_TIMEOUT and backend in PER_PROCESS_BACKENDS:
+        return [Error(
+            f"BOARD_ROLES_CACHE_TIMEOUT needs a cache shared by all workers, the default cache uses {backend}.",
+            hint="Point the default cache at Redis or Memcached, or leave BOARD_ROLES_CACHE_TIMEOUT at 0.",
+            id="goals.E002",
+        )]
+    return []
@@ -0,0 +1,162 @@
+import asyncio
+import json
+import logging
+import select
+import threading
+import time
+from collections import defaultdict
+from typing import Dict, Optional, Set
+
+import psycopg2
+from django.conf import settings
+from django.db import connection, connections, transaction
+from psycopg2.extensions import ISOLATION_LEVEL_AUTOCOMMIT
+
+
+logger = logging.getLogger(__name__)
+
+CHANNEL: str = "goals_events"
+# Queued instead of the events a slow subscriber could not keep up with; its stream ends with a reset.
+OVERFLOW: object = object()
+
+
+class Subscription:
+    """
+    One connected client: an asyncio queue owned by the event loop that serves the stream.
+    """
+
+    def __init__(self, board_id: int, queue_size: int) -> None:
+
+        self.board_id: int = board_id
+        self.loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+
+    def push(self, event: dict) -> None:
+
+        self.loop.call_soon_threadsafe(self._put, event)
+
+    def _put(self, event: dict) -> None:
+
+        if self.queue.full():
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            event = OVERFLOW
+        self.queue.put_nowait(event)
+
+    async def get(self) -> object:
+
+        return await self.queue.get()
+
+
+class EventBus:
+    """
+    Fans board events out to the subscriptions of this process. Delivery is thread safe, so events
+    can come from request threads (local backend) or from the LISTEN thread (postgres backend).
+    """
+
+    def __init__(self) -> None:
+
+        self.subscriptions: Dict[int, Set[Subscription]] = defaultdict(set)
+        self.lock: threading.Lock = threading.Lock()
+        self.listener: Optional[threading.Thread] = None
+        self.listening: threading.Event = threading.Event()
+        self.stopping: threading.Event = threading.Event()
+
+    def subscribe(self, board_id: int) -> Subscription:
+
+        if settings.GOALS_EVENTS_BACKEND == "postgres":
+            self.start_listener()
+        subscription: Subscription = Subscription(board_id, settings.GOALS_EVENTS_QUEUE_SIZE)
+        with self.lock:
+            self.subscriptions[board_id].add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+
+        with self.lock:
+            subscriptions: Set[Subscription] = self.subscriptions.get(subscription.board_id, set())
+            subscriptions.discard(subscription)
+            if not subscriptions:
+                self.subscriptions.pop(subscription.board_id, None)
+
+    def deliver(self, event: dict) -> None:
+
+        with self.lock:
+            subscriptions: list = list(self.subscriptions.get(event["board"], ()))
+        for subscription in subscriptions:
+            try:
+                subscription.push(event)
+            except RuntimeError:
+                # the loop serving the stream is gone
+                self.unsubscribe(subscription)
+
+    def start_listener(self) -> None:
+
+        with self.lock:
+            if self.listener is None or not self.listener.is_alive():
+                self.stopping.clear()
+                self.listener = threading.Thread(target=self.listen, name="goals-events", daemon=True)
+                self.listener.start()
+
+    def stop_listener(self) -> None:
+
+        self.stopping.set()
+        if self.listener is not None:
+            self.listener.join()
+            self.listener = None
+
+    def listen(self) -> None:
+        """
+        Forwards NOTIFY payloads of every process to the local subscriptions, reconnecting on errors.
+        """
+        params: dict = connections["default"].get_connection_params()
+        while not self.stopping.is_set():
+            listener = None
+            try:
+                listener = psycopg2.connect(**params)
+                listener.set_isolation_level(ISOLATION_LEVEL_AUTOCOMMIT)
+                with listener.cursor() as cursor:
+                    cursor.execute(f"LISTEN {CHANNEL}")
+                self.listening.set()
+                while not self.stopping.is_set():
+                    if select.select([listener], [], [], 1) == ([], [], []):
+                        continue
+                    listener.poll()
+                    while listener.notifies:
+                        self.deliver(json.loads(listener.notifies.pop(0).payload))
+            except psycopg2.Error:
+                logger.exception("goals events listener lost its connection, reconnecting")
+                time.sleep(1)
+            finally:
+                self.listening.clear()
+                if listener is not None:
+                    listener.close()
+
+
+bus: EventBus = EventBus()
+
+
+def send(event: dict) -> None:
+
+    if settings.GOALS_EVENTS_BACKEND == "postgres":
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT pg_notify(%s, %s)", [CHANNEL, json.dumps(event)])
+    else:
+        bus.deliver(event)
+
+
+def publish(event_type: str, action: str, object_id: Optional[int], *board_ids: Optional[int]) -> None:
+    """
+    Sends a change event to the subscribers of the boards once the current transaction commits.
+    Events only name the changed row; clients fetch it through the sync feed.
+    """
+    for board_id in {board_id for board_id in board_ids if board_id is not None}:
+        event: dict = {"type": event_type, "action": action, "id": object_id, "board": board_id}
+        transaction.on_commit(lambda event=event: send(event))
+
+
+def board_changed(*board_ids: Optional[int]) -> None:
+    """
+    Event for writes that bypass model signals (bulk and queryset updates).
+    """
+    publish("board", "changed", None, *board_ids)
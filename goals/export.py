@@ -0,0 +1,173 @@
+import csv
+import datetime
+import json
+from typing import Any, AsyncIterator, Dict, Iterable, Iterator, List, Tuple
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import models
+from rest_framework.renderers import BaseRenderer
+
+from goals.models import GoalComment
+
+
+# exported column: queryset field
+GOAL_FIELDS: Dict[str, str] = {
+    "id": "id",
+    "category": "category_id",
+    "title": "title",
+    "description": "description",
+    "status": "status",
+    "priority": "priority",
+    "due_date": "due_date",
+    "user": "user__username",
+    "created": "created",
+    "updated": "updated",
+}
+COMMENT_FIELDS: Dict[str, str] = {
+    "id": "id",
+    "goal": "goal_id",
+    "text": "text",
+    "user": "user__username",
+    "created": "created",
+    "updated": "updated",
+}
+# CSV rows share one header; a column that does not apply to the row type stays empty
+CSV_COLUMNS: List[str] = ["type", *GOAL_FIELDS, *(name for name in COMMENT_FIELDS if name not in GOAL_FIELDS)]
+# spreadsheets run a cell starting with one of these as a formula
+CSV_FORMULA_PREFIXES: Tuple[str, ...] = ("=", "+", "-", "@")
+
+
+class NDJSONRenderer(BaseRenderer):
+    """
+    Picks the export format by content negotiation; only error responses are rendered through it.
+    """
+    media_type: str = "application/x-ndjson"
+    format: str = "ndjson"
+    charset: str = "utf-8"
+
+    def render(self, data: Any, accepted_media_type=None, renderer_context=None) -> bytes:
+
+        return encode_ndjson([data]).encode()
+
+
+class CSVRenderer(BaseRenderer):
+
+    media_type: str = "text/csv"
+    format: str = "csv"
+    charset: str = "utf-8"
+
+    def render(self, data: Any, accepted_media_type=None, renderer_context=None) -> bytes:
+
+        if not isinstance(data, dict):
+            data = {"detail": data}
+        return encode_csv([list(data), [str(value) for value in data.values()]]).encode()
+
+
+class Echo:
+    """
+    File-like object for csv.writer that hands the written line back instead of storing it.
+    """
+
+    def write(self, value: str) -> str:
+
+        return value
+
+
+CSV_WRITER = csv.writer(Echo())
+
+
+def encode_csv(rows: Iterable[Iterable[Any]]) -> str:
+
+    return "".join(CSV_WRITER.writerow(row) for row in rows)
+
+
+def escape_formula(value: Any) -> Any:
+    """
+    Prefixes a text cell that a spreadsheet would evaluate with ``'``, so it is shown as text.
+    """
+    if isinstance(value, str) and value.startswith(CSV_FORMULA_PREFIXES):
+        return "'" + value
+    return value
+
+
+def encode_ndjson(records: Iterable[Any]) -> str:
+
+    return "".join(json.dumps(record, cls=DjangoJSONEncoder, ensure_ascii=False) + "\n" for record in records)
+
+
+def to_record(record_type: str, fields: Dict[str, str], row: Dict[str, Any]) -> Dict[str, Any]:
+
+    record: Dict[str, Any] = {"type": record_type}
+    for name, field in fields.items():
+        value: Any = row[field]
+        if isinstance(value, (datetime.date, datetime.datetime)):
+            value = value.isoformat()
+        record[name] = value
+    return record
+
+
+def export_querysets(goals: models.QuerySet, with_comments: bool) -> List[Tuple[str, Dict[str, str], models.QuerySet]]:
+    """
+    The goals, then their comments, each read in primary key order through its own server-side cursor.
+    Rows are dicts: in Django 4.2 aiterator() runs the query of a values_list() outside the worker thread.
+    """
+    querysets: List[Tuple[str, Dict[str, str], models.QuerySet]] = [
+        ("goal", GOAL_FIELDS, goals.order_by("id").values(*GOAL_FIELDS.values())),
+    ]
+    if with_comments:
+        comments: models.QuerySet = GoalComment.objects.filter(goal__in=goals.order_by().values("id"))
+        querysets.append(("comment", COMMENT_FIELDS, comments.order_by("id").values(*COMMENT_FIELDS.values())))
+    return querysets
+
+
+class Exporter:
+    """
+    Turns the board's goals (and comments) into text chunks of ``chunk_size`` records; memory stays
+    bounded by one chunk whatever the size of the board.
+    """
+
+    def __init__(self, goals: models.QuerySet, export_format: str, with_comments: bool, chunk_size: int) -> None:
+
+        self.querysets: List[Tuple[str, Dict[str, str], models.QuerySet]] = export_querysets(goals, with_comments)
+        self.export_format: str = export_format
+        self.chunk_size: int = chunk_size
+
+    def header(self) -> List[str]:
+
+        return [encode_csv([CSV_COLUMNS])] if self.export_format == CSVRenderer.format else []
+
+    def encode(self, records: List[Dict[str, Any]]) -> str:
+
+        if self.export_format == CSVRenderer.format:
+            return encode_csv([escape_formula(record.get(column, "")) for column in CSV_COLUMNS] for record in records)
+        return encode_ndjson(records)
+
+    def chunks(self) -> Iterator[str]:
+
+        yield from self.header()
+        for record_type, fields, queryset in self.querysets:
+            chunk: List[Dict[str, Any]] = []
+            for row in queryset.iterator(chunk_size=self.chunk_size):
+                chunk.append(to_record(record_type, fields, row))
+                if len(chunk) == self.chunk_size:
+                    yield self.encode(chunk)
+                    chunk = []
+            if chunk:
+                yield self.encode(chunk)
+
+    async def achunks(self) -> AsyncIterator[str]:
+        """
+        The same chunks through the async ORM, for responses streamed by an ASGI server.
+        """
+        for header in self.header():
+            yield header
+        for record_type, fields, queryset in self.querysets:
+            chunk: List[Dict[str, Any]] = []
+            async for row in queryset.aiterator(chunk_size=self.chunk_size):
+                chunk.append(to_record(record_type, fields, row))
+                if len(chunk) == self.chunk_size:
+                    yield self.encode(chunk)
+                    chunk = []
+            if chunk:
+                yield self.encode(chunk)
+
@@ -1,10 +1,13 @@
-from typing import Dict, Tuple
+from typing import Dict, List, Tuple
 
 import django_filters
+from django.conf import settings
+from django.contrib.postgres.search import SearchQuery, SearchRank
 from django.db import models
 from django_filters import rest_framework
+from rest_framework import filters
 
-from goals.models import Goal
+from goals.models import Goal, GoalComment, GoalWithArchived
 
 
 class GoalDateFilter(rest_framework.FilterSet):
@@ -22,3 +25,54 @@ class GoalDateFilter(rest_framework.FilterSet):
     filter_overrides = {
         models.DateTimeField: {"filter_class": django_filters.IsoDateTimeFilter},
     }
+
+
+class GoalWithArchivedDateFilter(GoalDateFilter):
+
+    class Meta(GoalDateFilter.Meta):
+
+        model: models.Model = GoalWithArchived
+
+
+class GoalSearchFilter(filters.SearchFilter):
+    """
+    Full-text ?search= over the trigger-maintained Goal.search_vector (GIN indexed).
+
+    Title and description always match; comment text, kept in GoalComment.search_vector, only with
+    GOALS_SEARCH_INCLUDE_COMMENTS or ?search_comments=true. The rank scores title and description only, so
+    goals matched by a comment alone come last. Results are ranked unless the client asks for an explicit
+    ordering or pages with a keyset cursor: the float rank cannot round-trip through a cursor, so those keep
+    the view's column ordering.
+    """
+    search_config: str = "russian"
+    search_comments_param: str = "search_comments"
+
+    def filter_queryset(self, request, queryset: models.QuerySet, view) -> models.QuerySet:
+
+        terms: List[str] = self.get_search_terms(request)
+        if not terms:
+            return queryset
+
+        query: SearchQuery = SearchQuery(" ".join(terms), config=self.search_config, search_type="websearch")
+        match: models.Q = models.Q(search_vector=query)
+        if self.include_comments(request):
+            match |= models.Q(id__in=GoalComment.objects.filter(search_vector=query).values("goal_id"))
+
+        queryset = queryset.filter(match).annotate(search_rank=SearchRank(models.F("search_vector"), query))
+        if not self.keeps_ordering(request, view):
+            queryset = queryset.order_by("-search_rank", *queryset.query.order_by)
+        return queryset
+
+    @staticmethod
+    def keeps_ordering(request, view) -> bool:
+
+        cursor_param: str = getattr(getattr(view, "pagination_class", None), "cursor_query_param", "")
+        return (filters.OrderingFilter.ordering_param in request.query_params
+                or bool(cursor_param) and cursor_param in request.query_params)
+
+    def include_comments(self, request) -> bool:
+
+        param: str = request.query_params.get(self.search_comments_param, "")
+        if param:
+            return param.lower() in ("1", "true")
+        return settings.GOALS_SEARCH_INCLUDE_COMMENTS
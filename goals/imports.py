@@ -0,0 +1,147 @@
+import csv
+import io
+import json
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from django.db import connection, transaction
+from django.utils import timezone
+from rest_framework import exceptions, serializers
+
+from core.models import User
+from goals import events
+from goals.cache import bump_board_generation
+from goals.models import Goal, GoalCategory
+from goals.roles import BoardRoles
+from goals.serializers import GoalImportSerializer
+
+
+FORMATS: Tuple[str, ...] = ("csv", "ndjson")
+# columns written by COPY; search_vector is filled by the goals_goal_search_vector trigger
+COPY_COLUMNS: Tuple[str, ...] = (
+    "user_id", "category_id", "board_id", "title", "description", "status", "priority", "due_date", "is_deleted",
+    "created", "updated",
+)
+# CSV cells left empty fall back to the model default
+OPTIONAL_FIELDS: Tuple[str, ...] = ("description", "status", "priority", "due_date")
+MAX_REPORTED_ERRORS: int = 1000
+
+
+def read_rows(lines: Iterable[str], import_format: str) -> Iterator[Tuple[Optional[dict], Optional[str]]]:
+    """
+    Yields (row, None) for every data line, or (None, message) for a line that cannot be parsed.
+    """
+    if import_format == "csv":
+        for row in csv.DictReader(lines):
+            yield {
+                key: value for key, value in row.items() if key and not (key in OPTIONAL_FIELDS and value == "")
+            }, None
+        return
+
+    for line in lines:
+        if not line.strip():
+            continue
+        try:
+            row: Any = json.loads(line)
+        except ValueError:
+            yield None, "invalid JSON"
+            continue
+        if isinstance(row, dict):
+            yield row, None
+        else:
+            yield None, "expected a JSON object"
+
+
+def copy_value(value: Any) -> str:
+    """
+    Formats a value for COPY's text format.
+    """
+    if value is None:
+        return "\\N"
+    if isinstance(value, bool):
+        return "t" if value else "f"
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    return str(value).replace("\\", "\\\\").replace("\t", "\\t").replace("\n", "\\n").replace("\r", "\\r")
+
+
+class GoalImporter:
+    """
+    Loads goals into one category with PostgreSQL COPY.
+
+    Rows are validated with GoalImportSerializer and copied in batches, the whole import runs in one
+    transaction. Invalid rows are skipped and reported, or with ``strict`` they abort the import
+    after the whole input has been checked. The board role of the user is checked once, for the category.
+    """
+
+    def __init__(self, category: GoalCategory, user: User, board_roles: BoardRoles, strict: bool = False,
+                 batch_size: int = 5000) -> None:
+
+        if category.is_deleted:
+            raise serializers.ValidationError({"category": ["not allowed in deleted category"]})
+        if not board_roles.can_write(category.board_id):
+            raise exceptions.PermissionDenied("The user can import goals only into categories of boards where "
+                                              "he has the role of Owner or Editor")
+
+        self.category: GoalCategory = category
+        self.user: User = user
+        self.strict: bool = strict
+        self.batch_size: int = batch_size
+        self.serializer: GoalImportSerializer = GoalImportSerializer()
+        self.defaults: Dict[str, Any] = {name: Goal._meta.get_field(name).get_default() for name in OPTIONAL_FIELDS}
+        # created and updated as DatesModelMixin.save sets them on insert, once for the whole import
+        self.now = timezone.now()
+
+    def run(self, rows: Iterable[Tuple[Optional[dict], Optional[str]]]) -> dict:
+
+        report: dict = {"imported": 0, "failed": 0, "errors": []}
+        batch: List[Tuple[Any, ...]] = []
+
+        with transaction.atomic():
+            for number, (row, error) in enumerate(rows, start=1):
+                record: Optional[Tuple[Any, ...]] = None
+                errors: Any = {"non_field_errors": [error]} if error else None
+                if row is not None:
+                    try:
+                        record = self.to_record(self.serializer.run_validation(row))
+                    except serializers.ValidationError as exc:
+                        errors = exc.detail
+                if errors is not None:
+                    report["failed"] += 1
+                    if len(report["errors"]) < MAX_REPORTED_ERRORS:
+                        report["errors"].append({"row": number, "errors": errors})
+                    continue
+
+                batch.append(record)
+                if len(batch) == self.batch_size:
+                    report["imported"] += self.copy(batch, report)
+                    batch = []
+            report["imported"] += self.copy(batch, report)
+
+            if self.strict and report["failed"]:
+                transaction.set_rollback(True)
+                report["imported"] = 0
+            elif report["imported"]:
+                bump_board_generation(self.category.board_id)
+                events.board_changed(self.category.board_id)
+        return report
+
+    def to_record(self, data: dict) -> Tuple[Any, ...]:
+
+        values: Dict[str, Any] = {**self.defaults, **data}
+        return (
+            self.user.id, self.category.id, self.category.board_id, values["title"], values["description"],
+            values["status"], values["priority"], values["due_date"], False, self.now, self.now,
+        )
+
+    def copy(self, batch: List[Tuple[Any, ...]], report: dict) -> int:
+
+        if not batch or (self.strict and report["failed"]):
+            return 0
+
+        buffer: io.StringIO = io.StringIO()
+        for record in batch:
+            buffer.write("\t".join(copy_value(value) for value in record) + "\n")
+        buffer.seek(0)
+        with connection.cursor() as cursor:
+            cursor.copy_expert(f"COPY {Goal._meta.db_table} ({', '.join(COPY_COLUMNS)}) FROM STDIN", buffer)
+        return len(batch)
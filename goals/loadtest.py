@@ -0,0 +1,114 @@
+"""
+The worker side of the load_test command. It runs in spawned processes, so it imports neither Django
+nor the models: everything it needs comes in the job arguments.
+"""
+import random
+import time
+from typing import Dict, List, Optional, Tuple
+
+import requests
+
+
+# endpoint: relative weight in the traffic mix
+MIX: Dict[str, int] = {
+    'board snapshot': 15,
+    'board list': 5,
+    'goal list': 30,
+    'goal search': 5,
+    'goal detail': 10,
+    'comment list': 10,
+    'goal create': 10,
+    'comment create': 15,
+}
+
+Sample = Tuple[str, int, float]
+
+
+class Client:
+    """
+    One simulated user: a logged in requests session and the ids it may read and write.
+    """
+
+    def __init__(self, base_url: str, profile: dict, rng: random.Random, timeout: float) -> None:
+
+        self.base_url: str = base_url.rstrip('/')
+        self.profile: dict = profile
+        self.rng: random.Random = rng
+        self.timeout: float = timeout
+        self.session: requests.Session = requests.Session()
+
+    def login(self, password: str) -> None:
+
+        response = self.session.post(f'{self.base_url}/core/login', timeout=self.timeout,
+                                     json={'username': self.profile['username'], 'password': password})
+        response.raise_for_status()
+        self.session.headers['X-CSRFToken'] = self.session.cookies.get('csrftoken', '')
+
+    def request(self, endpoint: str) -> Optional[requests.Response]:
+
+        profile: dict = self.profile
+        choice = self.rng.choice
+        if endpoint == 'board snapshot':
+            return self.get(f'/goals/board/{choice(profile["boards"])}/snapshot')
+        if endpoint == 'board list':
+            return self.get('/goals/board/list', {'limit': 20})
+        if endpoint == 'goal list':
+            return self.get('/goals/goal/list', {
+                'category__in': ','.join(map(str, self.rng.sample(profile['categories'],
+                                                                  min(3, len(profile['categories']))))),
+                'status__in': '1,2', 'ordering': choice(['title', '-created']), 'limit': 50, 'cursor': '',
+            })
+        if endpoint == 'goal search':
+            return self.get('/goals/goal/list', {'search': choice(['plan', 'review release', 'budget']),
+                                                 'limit': 20, 'cursor': ''})
+        if endpoint == 'goal detail':
+            return self.get(f'/goals/goal/{choice(profile["goals"])}')
+        if endpoint == 'comment list':
+            return self.get('/goals/goal_comment/list', {'goal': choice(profile['goals']), 'limit': 20})
+        if endpoint == 'goal create' and profile['writable_categories']:
+            return self.post('/goals/goal/create', {'title': 'load test goal',
+                                                    'category': choice(profile['writable_categories'])})
+        if endpoint == 'comment create' and profile['writable_goals']:
+            return self.post('/goals/goal_comment/create', {'text': 'load test comment',
+                                                            'goal': choice(profile['writable_goals'])})
+        return None
+
+    def get(self, path: str, params: Optional[dict] = None) -> requests.Response:
+
+        return self.session.get(self.base_url + path, params=params, timeout=self.timeout)
+
+    def post(self, path: str, data: dict) -> requests.Response:
+
+        return self.session.post(self.base_url + path, json=data, timeout=self.timeout)
+
+
+def run_worker(args: Tuple[int, str, List[dict], str, float, float, float]) -> List[Sample]:
+    """
+    Runs in its own process: logs its users in, then sends the weighted mix of requests, round robin
+    over its users, until the deadline. Returns (endpoint, status, seconds) per request; status 0 is a
+    connection error or timeout.
+    """
+    worker, base_url, profiles, password, duration, think, timeout = args
+    rng: random.Random = random.Random(worker)
+    clients: List[Client] = [Client(base_url, profile, rng, timeout) for profile in profiles]
+    for client in clients:
+        client.login(password)
+
+    endpoints: List[str] = list(MIX)
+    weights: List[int] = list(MIX.values())
+    samples: List[Sample] = []
+    deadline: float = time.monotonic() + duration
+    while time.monotonic() < deadline:
+        for client in clients:
+            endpoint: str = rng.choices(endpoints, weights)[0]
+            started: float = time.perf_counter()
+            try:
+                response: Optional[requests.Response] = client.request(endpoint)
+            except requests.RequestException:
+                samples.append((endpoint, 0, time.perf_counter() - started))
+                continue
+            if response is not None:
+                samples.append((endpoint, response.status_code, time.perf_counter() - started))
+            if think:
+                time.sleep(rng.uniform(0, 2 * think))
+    return samples
@@ -0,0 +1,45 @@
+import datetime
+import time
+
+from django.conf import settings
+from django.core.management import BaseCommand
+from django.utils import timezone
+
+from goals.archive import archivable_goals, archive_batch
+
+
+class Command(BaseCommand):
+
+    help = ('Moves goals archived or soft deleted for longer than GOALS_ARCHIVE_AFTER_DAYS, with their comments, '
+            'to the archive tables in batches. Archived goals leave the board statistics; list endpoints still '
+            'return them with ?include_archived=true.')
+
+    def add_arguments(self, parser) -> None:
+
+        parser.add_argument('--days', type=int, default=settings.GOALS_ARCHIVE_AFTER_DAYS,
+                            help='archive goals untouched for this many days')
+        parser.add_argument('--batch-size', type=int, default=settings.GOALS_ARCHIVE_BATCH_SIZE,
+                            help='goals moved per transaction')
+        parser.add_argument('--pause', type=float, default=0, help='seconds to sleep between batches')
+        parser.add_argument('--dry-run', action='store_true', help='only count the goals that would be moved')
+
+    def handle(self, *args, **options) -> None:
+
+        before: datetime.datetime = timezone.now() - datetime.timedelta(days=options['days'])
+        if options['dry_run']:
+            self.stdout.write(f'{archivable_goals(before).count()} goals would be archived')
+            return
+
+        total_goals: int = 0
+        total_comments: int = 0
+        while True:
+            goals, comments = archive_batch(before, options['batch_size'])
+            if not goals:
+                break
+            total_goals += goals
+            total_comments += comments
+            self.stdout.write(f'archived {total_goals} goals, {total_comments} comments')
+            if options['pause']:
+                time.sleep(options['pause'])
+
+        self.stdout.write(self.style.SUCCESS(f'done: {total_goals} goals, {total_comments} comments archived'))
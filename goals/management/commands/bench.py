@@ -0,0 +1,193 @@
+import datetime
+import gc
+import json
+import platform
+import statistics
+import time
+import tracemalloc
+from typing import Callable, Dict, List, Optional, Tuple
+
+import django
+from django.core.management import BaseCommand, CommandError
+from django.db import DEFAULT_DB_ALIAS, models, transaction
+from django.utils import timezone
+from rest_framework import filters, permissions
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from goals.benchdata import seed_board
+from goals.filters import GoalDateFilter, GoalSearchFilter
+from goals.models import Goal, GoalCategory, GoalComment
+from goals.permissions import BoardPermissions, CategoryPermissions, CommentPermissions, GoalPermissions
+from goals.serializers import GoalActivitySerializer, GoalCommentSerializer, GoalSerializer
+from goals.stats import with_comment_activity
+from goals.views import GoalListView
+
+
+Operation = Callable[[], object]
+
+# a timing sample runs the operation enough times to last about this long
+SAMPLE_SECONDS: float = 0.002
+
+
+def compile_sql(queryset: models.QuerySet) -> Tuple[str, tuple]:
+
+    return queryset.query.get_compiler(using=DEFAULT_DB_ALIAS).as_sql()
+
+
+class Command(BaseCommand):
+
+    help = ('Times the hot building blocks of the goals API in isolation over seeded data: serializer rendering, '
+            'the filter backends (up to the compiled SQL, not its execution) and the object permission checks. '
+            'Reports ops/sec, p50/p99 per operation and the peak memory one operation allocates. --output saves '
+            'the results as JSON, --compare prints the change against a saved run. The seed data is rolled back.')
+
+    def add_arguments(self, parser) -> None:
+
+        parser.add_argument('cases', nargs='*', help='only run the cases whose name starts with one of these')
+        parser.add_argument('--goals', type=int, default=200, help='goals (and comments) to seed')
+        parser.add_argument('--page', type=int, default=50, help='objects rendered per serializer operation')
+        parser.add_argument('--samples', type=int, default=200, help='timing samples per case')
+        parser.add_argument('--warmup', type=int, default=20, help='untimed runs before sampling')
+        parser.add_argument('--output', help='write the results to this JSON file')
+        parser.add_argument('--compare', help='JSON file of an earlier run to compare against')
+
+    def handle(self, *args, **options) -> None:
+
+        baseline: Optional[dict] = None
+        if options['compare']:
+            try:
+                with open(options['compare']) as file:
+                    baseline = json.load(file)['results']
+            except (OSError, ValueError, KeyError) as error:
+                raise CommandError(f'cannot read {options["compare"]}: {error}')
+
+        results: Dict[str, dict] = {}
+        with transaction.atomic():
+            cases: Dict[str, Operation] = self.cases(options['goals'], options['page'])
+            if options['cases']:
+                cases = {name: op for name, op in cases.items() if name.startswith(tuple(options['cases']))}
+                if not cases:
+                    raise CommandError('no case matches ' + ', '.join(options['cases']))
+
+            self.stdout.write(f'{"case":<24}{"ops/s":>12}{"p50 us":>10}{"p99 us":>10}{"alloc KiB":>11}'
+                              + (f'{"ops/s change":>14}' if baseline is not None else ''))
+            for name, op in cases.items():
+                results[name] = self.measure(op, options['samples'], options['warmup'])
+                self.report(name, results[name], (baseline or {}).get(name), baseline is not None)
+            transaction.set_rollback(True)
+
+        if options['output']:
+            with open(options['output'], 'w') as file:
+                json.dump({
+                    'created': timezone.now().isoformat(),
+                    'python': platform.python_version(),
+                    'django': django.get_version(),
+                    'options': {key: options[key] for key in ('goals', 'page', 'samples', 'warmup')},
+                    'results': results,
+                }, file, indent=2)
+
+    def cases(self, size: int, page: int) -> Dict[str, Operation]:
+
+        user, board = seed_board(size, categories=5)
+        factory: APIRequestFactory = APIRequestFactory()
+
+        def request(method: str = 'get', **params) -> Request:
+            drf_request: Request = Request(getattr(factory, method)('/goals/goal/list', params))
+            drf_request.user = user
+            return drf_request
+
+        goals: List[Goal] = list(Goal.objects.select_related('user').filter(board=board).order_by('id')[:page])
+        annotated: List[Goal] = list(with_comment_activity(
+            Goal.objects.select_related('user').filter(board=board)).order_by('id')[:page])
+        comments: List[GoalComment] = list(
+            GoalComment.objects.select_related('user').filter(board=board).order_by('id')[:page])
+        category: GoalCategory = GoalCategory.objects.filter(board=board).first()
+
+        goal_queryset: models.QuerySet = Goal.objects.select_related('user').filter(
+            board__participants__user=user).exclude(is_deleted=True)
+        date_params: dict = {'status__in': '1,2', 'priority': '2', 'category__in': str(category.id),
+                             'due_date__gte': (timezone.localdate() - datetime.timedelta(days=30)).isoformat()}
+        date_request: Request = request(**date_params)
+        search_request: Request = request(search='goal description')
+        ordering_request: Request = request(ordering='-created')
+        view: GoalListView = GoalListView()
+        view.request, view.kwargs, view.format_kwarg = search_request, {}, None
+
+        write_request: Request = request('patch')
+        checks: List[Tuple[str, permissions.BasePermission, models.Model]] = [
+            ('board', BoardPermissions(), board),
+            ('category', CategoryPermissions(), category),
+            ('goal', GoalPermissions(), goals[0]),
+            ('comment', CommentPermissions(), comments[0]),
+        ]
+
+        cases: Dict[str, Operation] = {
+            'serializer.goal': lambda: GoalSerializer(goals, many=True).data,
+            'serializer.goal_activity': lambda: GoalActivitySerializer(annotated, many=True).data,
+            'serializer.comment': lambda: GoalCommentSerializer(comments, many=True).data,
+            'filter.goal_date': lambda: compile_sql(
+                GoalDateFilter(date_request.query_params, queryset=goal_queryset, request=date_request).qs),
+            'filter.search': lambda: compile_sql(
+                GoalSearchFilter().filter_queryset(search_request, goal_queryset, view)),
+            'filter.ordering': lambda: compile_sql(
+                filters.OrderingFilter().filter_queryset(ordering_request, goal_queryset, view)),
+        }
+        for name, permission, obj in checks:
+            permission.has_object_permission(write_request, view, obj)
+            cases[f'permission.{name}'] = (
+                lambda permission=permission, obj=obj: permission.has_object_permission(write_request, view, obj))
+        return cases
+
+    @staticmethod
+    def measure(op: Operation, samples: int, warmup: int) -> dict:
+        """
+        Times ``samples`` batches of the operation with the garbage collector off (as timeit does),
+        then runs it once more under tracemalloc for its peak allocation.
+        """
+        for _ in range(warmup):
+            op()
+        started: float = time.perf_counter()
+        op()
+        number: int = max(1, int(SAMPLE_SECONDS / max(time.perf_counter() - started, 1e-9)))
+
+        timings: List[float] = []
+        gc_enabled: bool = gc.isenabled()
+        gc.disable()
+        try:
+            for _ in range(samples):
+                started = time.perf_counter()
+                for _ in range(number):
+                    op()
+                timings.append((time.perf_counter() - started) / number)
+        finally:
+            if gc_enabled:
+                gc.enable()
+
+        tracemalloc.start()
+        try:
+            before: int = tracemalloc.get_traced_memory()[0]
+            op()
+            peak: int = tracemalloc.get_traced_memory()[1] - before
+        finally:
+            tracemalloc.stop()
+
+        timings.sort()
+        return {
+            'ops_per_sec': round(1 / statistics.fmean(timings), 1),
+            'p50_us': round(timings[len(timings) // 2] * 1e6, 2),
+            'p99_us': round(timings[min(len(timings) - 1, int(len(timings) * 0.99))] * 1e6, 2),
+            'alloc_bytes': peak,
+            'ops': number * samples,
+        }
+
+    def report(self, name: str, result: dict, previous: Optional[dict], comparing: bool) -> None:
+
+        line: str = (f'{name:<24}{result["ops_per_sec"]:>12.0f}{result["p50_us"]:>10.1f}{result["p99_us"]:>10.1f}'
+                     f'{result["alloc_bytes"] / 1024:>11.1f}')
+        if previous is not None:
+            change: float = (result['ops_per_sec'] / previous['ops_per_sec'] - 1) * 100
+            line += f'{change:>+13.1f}%'
+        elif comparing:
+            line += f'{"new":>14}'
+        self.stdout.write(line)
@@ -0,0 +1,132 @@
+import asyncio
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Awaitable, Callable, List, Tuple
+
+from asgiref.sync import ThreadSensitiveContext, sync_to_async
+from django.core.management import BaseCommand, CommandError
+from django.db import connections
+from django.http import HttpRequest, HttpResponse
+from django.test import AsyncRequestFactory, RequestFactory
+from django.urls import reverse
+
+from core.models import User
+from goals import async_views, views
+from goals.benchdata import seed_board
+from goals.models import BoardParticipant, Goal, GoalCategory
+
+
+class Command(BaseCommand):
+
+    help = ('Compares the concurrent throughput of the sync and async list and detail views with the same '
+            'number of workers: sync views on a thread pool (WSGI), sync views under ASGI and async views '
+            'under ASGI. Runs against the configured database with committed, then removed, seed data.')
+
+    def add_arguments(self, parser) -> None:
+
+        parser.add_argument('--workers', type=int, default=8, help='threads, or concurrent requests under ASGI')
+        parser.add_argument('--requests', type=int, default=400, help='requests per case')
+        parser.add_argument('--goals', type=int, default=200, help='goals on the seeded board')
+        parser.add_argument('--limit', type=int, default=50, help='page size of the list requests')
+
+    def handle(self, *args, **options) -> None:
+
+        user, board = seed_board(options['goals'], comments=False)
+        try:
+            goal: Goal = Goal.objects.filter(board=board).first()
+            cases: List[Tuple[str, type, type, str, dict, dict]] = [
+                ('goal list', views.GoalListView, async_views.GoalListAsyncView, reverse('goals:goal_list'),
+                 {'cursor': '', 'limit': options['limit']}, {}),
+                ('goal detail', views.GoalView, async_views.GoalAsyncView,
+                 reverse('goals:goal_detail', args=[goal.pk]), {}, {'pk': goal.pk}),
+            ]
+            self.stdout.write(f'{"case":<13}{"mode":<12}{"req/s":>9}{"p50 ms":>9}{"p99 ms":>9}')
+            for name, sync_view, async_view, path, params, kwargs in cases:
+                sync_handler: Callable = sync_view.as_view()
+                async_handler: Callable = async_view.as_view()
+
+                def sync_request() -> HttpRequest:
+                    return self.with_user(RequestFactory().get(path, params), user)
+
+                def async_request() -> HttpRequest:
+                    return self.with_user(AsyncRequestFactory().get(path, params), user)
+
+                def wsgi() -> HttpResponse:
+                    return self.rendered(sync_handler(sync_request(), **kwargs))
+
+                async def asgi_sync() -> HttpResponse:
+                    return self.rendered(await sync_to_async(sync_handler)(sync_request(), **kwargs))
+
+                async def asgi_async() -> HttpResponse:
+                    return await async_handler(async_request(), **kwargs)
+
+                if wsgi().content != asyncio.run(self.asgi(asgi_async, 1, 1))[1]:
+                    raise CommandError(f'{name}: the sync and async views return different content')
+                self.report(name, 'wsgi', *self.wsgi(wsgi, options['workers'], options['requests']))
+                for mode, handler in (('asgi sync', asgi_sync), ('asgi async', asgi_async)):
+                    elapsed, _, latencies = asyncio.run(self.asgi(handler, options['workers'], options['requests']))
+                    self.report(name, mode, elapsed, latencies)
+        finally:
+            for model in (Goal, GoalCategory, BoardParticipant):
+                model.objects.filter(board=board).delete()
+            board.delete()
+            user.delete()
+
+    def report(self, name: str, mode: str, elapsed: float, latencies: List[float]) -> None:
+
+        latencies = sorted(latencies)
+        p99: float = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]
+        self.stdout.write(f'{name:<13}{mode:<12}{len(latencies) / elapsed:>9.0f}'
+                          f'{statistics.median(latencies) * 1000:>9.1f}{p99 * 1000:>9.1f}')
+
+    @staticmethod
+    def wsgi(handler: Callable[[], HttpResponse], workers: int, requests: int) -> Tuple[float, List[float]]:
+
+        def timed(_) -> float:
+            started: float = time.perf_counter()
+            try:
+                handler()
+            finally:
+                # one connection per request, as with CONN_MAX_AGE = 0
+                connections.close_all()
+            return time.perf_counter() - started
+
+        started: float = time.perf_counter()
+        with ThreadPoolExecutor(workers) as pool:
+            latencies: List[float] = list(pool.map(timed, range(requests)))
+        return time.perf_counter() - started, latencies
+
+    @staticmethod
+    async def asgi(handler: Callable[[], Awaitable[HttpResponse]], workers: int,
+                   requests: int) -> Tuple[float, bytes, List[float]]:
+
+        semaphore: asyncio.Semaphore = asyncio.Semaphore(workers)
+
+        async def timed() -> Tuple[float, bytes]:
+            async with semaphore:
+                started: float = time.perf_counter()
+                # what ASGIHandler does per request: sync code of the request shares one thread
+                async with ThreadSensitiveContext():
+                    try:
+                        response: HttpResponse = await handler()
+                    finally:
+                        await sync_to_async(connections.close_all)()
+                return time.perf_counter() - started, response.content
+
+        started: float = time.perf_counter()
+        results: List[Tuple[float, bytes]] = await asyncio.gather(*(timed() for _ in range(requests)))
+        return time.perf_counter() - started, results[0][1], [latency for latency, _ in results]
+
+    @staticmethod
+    def with_user(request: HttpRequest, user: User) -> HttpRequest:
+
+        request.user = user
+        return request
+
+    @staticmethod
+    def rendered(response: HttpResponse) -> HttpResponse:
+
+        if hasattr(response, 'render'):
+            response.render()
+        return response
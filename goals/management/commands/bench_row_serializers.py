@@ -0,0 +1,67 @@
+import timeit
+from typing import List, Tuple, Type
+
+from django.core.management import BaseCommand, CommandError
+from django.db import models, transaction
+from rest_framework import serializers
+from rest_framework.renderers import JSONRenderer
+
+from goals.benchdata import seed_board
+from goals.models import Goal, GoalComment
+from goals.row_serializers import GoalCommentRowSerializer, GoalRowSerializer, RowSerializer
+from goals.serializers import GoalCommentSerializer, GoalSerializer
+
+
+class Command(BaseCommand):
+
+    help = ('Compares the ModelSerializer and RowSerializer paths of the goal and comment lists: time to turn '
+            'an already fetched page into JSON, with nested and with sideloaded users.')
+
+    def add_arguments(self, parser) -> None:
+
+        parser.add_argument('--sizes', type=int, nargs='+', default=[10, 100, 1000], help='page sizes to time')
+        parser.add_argument('--repeat', type=int, default=5, help='timing runs per size, the best one is shown')
+
+    def handle(self, *args, **options) -> None:
+
+        largest: int = max(options['sizes'])
+        with transaction.atomic():
+            seed_board(largest)
+            cases: List[Tuple[str, models.QuerySet, Type[serializers.ModelSerializer], Type[RowSerializer]]] = [
+                ('goal', Goal.objects.select_related('user').order_by('id'), GoalSerializer, GoalRowSerializer),
+                ('comment', GoalComment.objects.select_related('user').order_by('id'), GoalCommentSerializer,
+                 GoalCommentRowSerializer),
+            ]
+            self.stdout.write(f'{"list":<8}{"size":>6}{"serializer ms":>16}{"rows ms":>10}{"speedup":>9}'
+                              f'{"sideload ms":>13}{"bytes":>10}{"sideload bytes":>16}')
+            for name, queryset, serializer_class, row_serializer_class in cases:
+                for size in options['sizes']:
+                    self.compare(name, queryset[:size], serializer_class, row_serializer_class(), options['repeat'])
+            transaction.set_rollback(True)
+
+    def compare(self, name: str, queryset: models.QuerySet, serializer_class: Type[serializers.ModelSerializer],
+                row_serializer: RowSerializer, repeat: int) -> None:
+
+        renderer: JSONRenderer = JSONRenderer()
+        objects: list = list(queryset)
+        rows: list = list(row_serializer.values(queryset))
+        sideload_serializer: RowSerializer = type(row_serializer)(("user",))
+        sideload_rows: list = list(sideload_serializer.values(queryset))
+
+        def serializer_path() -> bytes:
+            return renderer.render(serializer_class(objects, many=True).data)
+
+        def row_path() -> bytes:
+            return renderer.render(row_serializer.serialize(rows))
+
+        def sideload_path() -> bytes:
+            data: List[dict] = sideload_serializer.serialize(sideload_rows)
+            return renderer.render({"results": data, **sideload_serializer.load_sideloads(data)})
+
+        if serializer_path() != row_path():
+            raise CommandError(f'{name}: the two paths render different output')
+        slow: float = min(timeit.repeat(serializer_path, number=1, repeat=repeat)) * 1000
+        fast: float = min(timeit.repeat(row_path, number=1, repeat=repeat)) * 1000
+        sideload: float = min(timeit.repeat(sideload_path, number=1, repeat=repeat)) * 1000
+        self.stdout.write(f'{name:<8}{queryset.query.high_mark:>6}{slow:>16.2f}{fast:>10.2f}{slow / fast:>8.1f}x'
+                          f'{sideload:>13.2f}{len(row_path()):>10}{len(sideload_path()):>16}')
@@ -0,0 +1,42 @@
+from typing import List
+
+from django.core.management import BaseCommand, CommandError
+
+from goals.cascade import pending_cascades, process_chunk
+from goals.models import CascadeDeletion
+
+
+class Command(BaseCommand):
+
+    help = 'Resumes unfinished board and category deletions, chunk by chunk.'
+
+    def add_arguments(self, parser) -> None:
+
+        parser.add_argument('jobs', nargs='*', type=int, help='cascade ids to run (default: every unfinished one)')
+        parser.add_argument('--list', action='store_true', help='only print the progress of unfinished cascades')
+
+    def handle(self, *args, **options) -> None:
+
+        jobs: List[CascadeDeletion] = list(pending_cascades())
+        if options['jobs']:
+            jobs = [job for job in jobs if job.id in options['jobs']]
+            missing: set = set(options['jobs']) - {job.id for job in jobs}
+            if missing:
+                raise CommandError(f'no unfinished cascade with id {", ".join(map(str, sorted(missing)))}')
+
+        for job in jobs:
+            self.report(job)
+            if options['list']:
+                continue
+
+            while job is not None and job.stage != CascadeDeletion.Stage.finished:
+                job = process_chunk(job.id)
+                if job is not None:
+                    self.report(job)
+            if job is None:
+                self.stdout.write(self.style.WARNING('  held by another worker, skipped'))
+
+    def report(self, job: CascadeDeletion) -> None:
+
+        target: str = f'category {job.category_id}' if job.category_id else f'board {job.board_id}'
+        self.stdout.write(f'cascade {job.id} ({target}): {job.get_stage_display()}, {job.processed}/{job.total}')
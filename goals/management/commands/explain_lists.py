@@ -0,0 +1,90 @@
+import re
+from typing import Dict, List, Optional, Set, Type
+
+from django.core.management import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.db.models import Count
+from rest_framework.generics import ListAPIView
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from core.models import User
+from goals.models import BoardParticipant
+from goals.views import BoardListView, GoalCategoryListView, GoalCommentListView, GoalListView
+
+
+LIST_VIEWS: Dict[str, Type[ListAPIView]] = {
+    "board/list": BoardListView,
+    "goal/list": GoalListView,
+    "goal_category/list": GoalCategoryListView,
+    "goal_comment/list": GoalCommentListView,
+}
+
+INDEX_RE = re.compile(r"Index(?: Only)? Scan(?: Backward)? (?:using|on) (\w+)")
+SEQ_SCAN_RE = re.compile(r"Seq Scan on (\w+)")
+
+
+class Command(BaseCommand):
+
+    help = 'Prints the EXPLAIN plan of every goals list endpoint and the indexes it uses.'
+
+    def add_arguments(self, parser) -> None:
+
+        parser.add_argument('--user', help='username to build the querysets for (default: busiest participant)')
+        parser.add_argument('--limit', type=int, default=100, help='page size applied to each queryset')
+        parser.add_argument('--analyze', action='store_true', help='run EXPLAIN ANALYZE instead of EXPLAIN')
+        parser.add_argument('--no-seqscan', action='store_true',
+                            help='disable sequential scans to check that an index path exists at all')
+        parser.add_argument('--strict', action='store_true',
+                            help='fail if any plan reads a goals table with a sequential scan')
+        parser.add_argument('--verbose-plan', action='store_true', help='print the full plans')
+
+    def handle(self, *args, **options) -> None:
+
+        user: User = self.get_user(options['user'])
+        offenders: List[str] = []
+
+        with transaction.atomic():
+            if options['no_seqscan']:
+                with connection.cursor() as cursor:
+                    cursor.execute('SET LOCAL enable_seqscan = off')
+
+            for url, view_class in LIST_VIEWS.items():
+                plan: str = self.explain(view_class, url, user, options['limit'], options['analyze'])
+                indexes: Set[str] = set(INDEX_RE.findall(plan))
+                seq_scans: Set[str] = {table for table in SEQ_SCAN_RE.findall(plan) if table.startswith('goals_')}
+
+                self.stdout.write(self.style.MIGRATE_HEADING(url))
+                self.stdout.write(f'  indexes: {", ".join(sorted(indexes)) or "-"}')
+                self.stdout.write(f'  seq scans: {", ".join(sorted(seq_scans)) or "-"}')
+                if options['verbose_plan']:
+                    self.stdout.write(plan)
+                if seq_scans:
+                    offenders.append(url)
+
+        if options['strict'] and offenders:
+            raise CommandError(f'sequential scans in: {", ".join(offenders)}')
+
+    @staticmethod
+    def get_user(username: Optional[str]) -> User:
+
+        if username:
+            try:
+                return User.objects.get(username=username)
+            except User.DoesNotExist:
+                raise CommandError(f'user {username} not found')
+
+        busiest: Optional[dict] = BoardParticipant.objects.values('user').annotate(
+            boards=Count('board')).order_by('-boards').first()
+        if busiest is None:
+            raise CommandError('the database has no board participants, seed it first')
+        return User.objects.get(pk=busiest['user'])
+
+    @staticmethod
+    def explain(view_class: Type[ListAPIView], url: str, user: User, limit: int, analyze: bool) -> str:
+
+        request: Request = Request(APIRequestFactory().get(f'/goals/{url}'))
+        request.user = user
+        view: ListAPIView = view_class(request=request, format_kwarg=None, args=(), kwargs={})
+        queryset = view.filter_queryset(view.get_queryset())[:limit]
+        return queryset.explain(analyze=analyze)
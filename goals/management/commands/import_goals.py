@@ -0,0 +1,59 @@
+import json
+import sys
+from typing import Optional
+
+from django.core.management import BaseCommand, CommandError
+from rest_framework import exceptions
+
+from core.models import User
+from goals.imports import FORMATS, GoalImporter, read_rows
+from goals.models import GoalCategory
+from goals.roles import BoardRoles
+
+
+class Command(BaseCommand):
+
+    help = ('Imports goals into a category from a CSV or NDJSON file with COPY, on behalf of a user with the '
+            'owner or writer role on its board. Invalid rows are skipped and reported.')
+
+    def add_arguments(self, parser) -> None:
+
+        parser.add_argument('category', type=int, help='id of the target category')
+        parser.add_argument('path', help='file to import, - for stdin')
+        parser.add_argument('--user', required=True, help='username recorded as the author of the goals')
+        parser.add_argument('--format', choices=FORMATS, help='input format (default: from the file extension)')
+        parser.add_argument('--strict', action='store_true', help='import nothing unless every row is valid')
+        parser.add_argument('--batch-size', type=int, default=5000, help='rows per COPY')
+        parser.add_argument('--report', help='write the JSON report with the errors of every failed row here')
+
+    def handle(self, *args, **options) -> None:
+
+        category: Optional[GoalCategory] = GoalCategory.objects.filter(pk=options['category']).first()
+        if category is None:
+            raise CommandError(f'no category with id {options["category"]}')
+        user: Optional[User] = User.objects.filter(username=options['user']).first()
+        if user is None:
+            raise CommandError(f'no user {options["user"]}')
+
+        import_format: str = options['format'] or ('csv' if options['path'].endswith('.csv') else 'ndjson')
+        try:
+            importer: GoalImporter = GoalImporter(category, user, BoardRoles(user), strict=options['strict'],
+                                                  batch_size=options['batch_size'])
+        except (exceptions.PermissionDenied, exceptions.ValidationError) as exc:
+            raise CommandError(str(exc.detail))
+
+        if options['path'] == '-':
+            report: dict = importer.run(read_rows(sys.stdin, import_format))
+        else:
+            with open(options['path'], newline='', encoding='utf-8-sig') as lines:
+                report = importer.run(read_rows(lines, import_format))
+
+        self.stdout.write(f'imported {report["imported"]} goals, {report["failed"]} rows failed')
+        if options['report']:
+            with open(options['report'], 'w') as output:
+                json.dump(report, output, ensure_ascii=False, indent=2)
+        else:
+            for error in report['errors']:
+                self.stderr.write(f'row {error["row"]}: {json.dumps(error["errors"], ensure_ascii=False)}')
+        if options['strict'] and report['failed']:
+            raise CommandError('nothing imported, fix the failed rows or drop --strict')
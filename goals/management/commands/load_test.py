@@ -0,0 +1,96 @@
+import multiprocessing
+from typing import Dict, List, Tuple
+
+from django.core.management import BaseCommand, CommandError
+from django.db.models import Q
+
+from core.models import User
+from goals.loadtest import MIX, Sample, run_worker
+from goals.models import BoardParticipant, Goal, GoalCategory
+
+
+class Command(BaseCommand):
+
+    help = ('Replays a weighted mix of API calls (board snapshots, filtered goal lists, searches, details, goal '
+            'and comment creates) against a running server from several processes, as users created by '
+            'seed_data, and reports throughput and latency percentiles per endpoint.')
+
+    def add_arguments(self, parser) -> None:
+
+        parser.add_argument('--url', default='http://127.0.0.1:8000', help='base URL of the server under test')
+        parser.add_argument('--processes', type=int, default=4, help='worker processes')
+        parser.add_argument('--users', type=int, default=4, help='simulated users per process')
+        parser.add_argument('--duration', type=float, default=30, help='seconds to run')
+        parser.add_argument('--think', type=float, default=0, help='mean pause between requests of a user')
+        parser.add_argument('--timeout', type=float, default=10, help='request timeout in seconds')
+        parser.add_argument('--prefix', default='seed', help='username prefix of the seed_data users')
+        parser.add_argument('--password', default='seed-password', help='password of the seed_data users')
+
+    def handle(self, *args, **options) -> None:
+
+        profiles: List[dict] = self.profiles(options['prefix'], options['processes'] * options['users'])
+        if not profiles:
+            raise CommandError(f'no {options["prefix"]}-* user takes part in a board, run seed_data first')
+
+        jobs: list = [
+            (worker, options['url'], profiles[worker::options['processes']], options['password'],
+             options['duration'], options['think'], options['timeout'])
+            for worker in range(min(options['processes'], len(profiles)))
+        ]
+        self.stdout.write(f'{len(jobs)} processes, {len(profiles)} users, {options["duration"]:.0f}s '
+                          f'against {options["url"]}')
+        with multiprocessing.get_context('spawn').Pool(len(jobs)) as pool:
+            results: List[List[Sample]] = pool.map(run_worker, jobs)
+        # workers fire requests for --duration seconds once logged in, process start-up is not counted
+        self.report([sample for samples in results for sample in samples], options['duration'])
+
+    @staticmethod
+    def profiles(prefix: str, count: int) -> List[dict]:
+        """
+        The ids each simulated user may touch, read here so the workers never open a database connection.
+        """
+        users: List[User] = list(User.objects.filter(
+            username__startswith=f'{prefix}-', participants__board__is_deleted=False).distinct().order_by('id')[:count])
+        profiles: List[dict] = []
+        for user in users:
+            roles: Dict[int, int] = dict(BoardParticipant.objects.filter(
+                user=user, board__is_deleted=False).values_list('board_id', 'role'))
+            writable: List[int] = [board_id for board_id, role in roles.items()
+                                   if role != BoardParticipant.Role.reader]
+            categories: List[Tuple[int, int]] = list(GoalCategory.objects.filter(
+                board_id__in=roles, is_deleted=False).values_list('id', 'board_id'))
+            goals: List[Tuple[int, int]] = list(Goal.objects.filter(
+                ~Q(status=Goal.Status.archived), board_id__in=roles, is_deleted=False).order_by('?').values_list(
+                'id', 'board_id')[:500])
+            if not categories or not goals:
+                continue
+            profiles.append({
+                'username': user.username,
+                'boards': list(roles),
+                'categories': [category_id for category_id, _ in categories],
+                'goals': [goal_id for goal_id, _ in goals],
+                'writable_categories': [category_id for category_id, board_id in categories if board_id in writable],
+                'writable_goals': [goal_id for goal_id, board_id in goals if board_id in writable],
+            })
+        return profiles
+
+    def report(self, samples: List[Sample], elapsed: float) -> None:
+
+        self.stdout.write(f'{"endpoint":<16}{"requests":>10}{"errors":>8}{"req/s":>9}{"p50 ms":>9}{"p90 ms":>9}'
+                          f'{"p99 ms":>9}{"max ms":>9}')
+        by_endpoint: Dict[str, List[Sample]] = {}
+        for sample in samples:
+            by_endpoint.setdefault(sample[0], []).append(sample)
+        for endpoint in [*MIX, 'total']:
+            rows: List[Sample] = samples if endpoint == 'total' else by_endpoint.get(endpoint, [])
+            if not rows:
+                continue
+            latencies: List[float] = sorted(seconds * 1000 for _, _, seconds in rows)
+            errors: int = sum(1 for _, status, _ in rows if not 200 <= status < 300)
+
+            def percentile(share: float) -> float:
+                return latencies[min(len(latencies) - 1, int(len(latencies) * share))]
+
+            self.stdout.write(f'{endpoint:<16}{len(rows):>10}{errors:>8}{len(rows) / elapsed:>9.1f}'
+                              f'{percentile(0.5):>9.1f}{percentile(0.9):>9.1f}{percentile(0.99):>9.1f}'
+                              f'{latencies[-1]:>9.1f}')
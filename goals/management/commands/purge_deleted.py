@@ -0,0 +1,64 @@
+import datetime
+import time
+from typing import Dict, List, Optional, Tuple
+
+from django.conf import settings
+from django.core.management import BaseCommand
+from django.template.defaultfilters import filesizeformat
+from django.utils import timezone
+
+from goals.purge import purge_batch, purge_counts
+
+
+class Command(BaseCommand):
+
+    help = ('Hard deletes boards, categories and goals soft deleted for longer than GOALS_PURGE_AFTER_DAYS, '
+            'with everything that references them, in small batches and in dependency order, and reports the '
+            'rows and bytes reclaimed. With --interval it keeps running and purges again every INTERVAL seconds.')
+
+    def add_arguments(self, parser) -> None:
+
+        parser.add_argument('--days', type=int, default=settings.GOALS_PURGE_AFTER_DAYS,
+                            help='purge rows deleted more than this many days ago')
+        parser.add_argument('--batch-size', type=int, default=settings.GOALS_PURGE_BATCH_SIZE,
+                            help='rows deleted per transaction')
+        parser.add_argument('--pause', type=float, default=settings.GOALS_PURGE_PAUSE,
+                            help='seconds to sleep between batches')
+        parser.add_argument('--interval', type=float, help='keep running, starting a purge every INTERVAL seconds')
+        parser.add_argument('--dry-run', action='store_true', help='only count the rows that would be purged')
+
+    def handle(self, *args, **options) -> None:
+
+        while True:
+            started: float = time.monotonic()
+            before: datetime.datetime = timezone.now() - datetime.timedelta(days=options['days'])
+            if options['dry_run']:
+                for name, rows in purge_counts(before).items():
+                    self.stdout.write(f'{name}: {rows} rows would be purged')
+            else:
+                self.purge(before, options['batch_size'], options['pause'])
+
+            if options['interval'] is None:
+                return
+            time.sleep(max(0.0, options['interval'] - (time.monotonic() - started)))
+
+    def purge(self, before: datetime.datetime, batch_size: int, pause: float) -> None:
+
+        reclaimed: Dict[str, List[int]] = {}
+        while True:
+            batch: Optional[Tuple[str, int, int]] = purge_batch(before, batch_size)
+            if batch is None:
+                break
+            name, rows, size = batch
+            total: List[int] = reclaimed.setdefault(name, [0, 0])
+            total[0] += rows
+            total[1] += size
+            self.stdout.write(f'purged {total[0]} {name}')
+            if pause:
+                time.sleep(pause)
+
+        for name, (rows, size) in reclaimed.items():
+            self.stdout.write(f'{name}: {rows} rows, {filesizeformat(size)}')
+        rows = sum(rows for rows, _ in reclaimed.values())
+        size = sum(size for _, size in reclaimed.values())
+        self.stdout.write(self.style.SUCCESS(f'done: {rows} rows, {filesizeformat(size)} reclaimed'))
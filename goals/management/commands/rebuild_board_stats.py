@@ -0,0 +1,17 @@
+from django.core.management import BaseCommand
+
+from goals.stats import rebuild_board_stats
+
+
+class Command(BaseCommand):
+
+    help = 'Recomputes the maintained board statistics counters from the goals and comments.'
+
+    def add_arguments(self, parser) -> None:
+
+        parser.add_argument('boards', nargs='*', type=int, help='board ids to rebuild (default: all boards)')
+
+    def handle(self, *args, **options) -> None:
+
+        rebuild_board_stats(options['boards'] or None)
+        self.stdout.write(self.style.SUCCESS('Board statistics rebuilt'))
@@ -0,0 +1,110 @@
+import datetime
+import random
+from typing import List
+
+from django.contrib.auth.hashers import make_password
+from django.core.management import BaseCommand, CommandError
+from django.db import transaction
+from django.utils import timezone
+
+from core.models import User
+from goals.models import Board, BoardParticipant, Goal, GoalCategory, GoalComment
+
+
+WORDS: List[str] = (
+    'plan review release budget report design launch draft sprint backlog meeting research fix deploy '
+    'migrate test audit refactor document hire onboard train measure publish call order renew'
+).split()
+
+
+def sentence(rng: random.Random, words: int) -> str:
+
+    return ' '.join(rng.choice(WORDS) for _ in range(words)).capitalize()
+
+
+class Command(BaseCommand):
+
+    help = ('Seeds synthetic users, boards, participants, categories, goals and comments with bulk_create, '
+            'one transaction per chunk of boards. Every user gets the same password, so load_test can log '
+            'in as them. Volumes are per parent: participants and categories per board, goals per category, '
+            'comments per goal.')
+
+    def add_arguments(self, parser) -> None:
+
+        parser.add_argument('--users', type=int, default=100, help='users to create')
+        parser.add_argument('--boards', type=int, default=50, help='boards to create')
+        parser.add_argument('--participants', type=int, default=5, help='participants per board, owner included')
+        parser.add_argument('--categories', type=int, default=5, help='categories per board')
+        parser.add_argument('--goals', type=int, default=40, help='goals per category')
+        parser.add_argument('--comments', type=int, default=2, help='comments per goal')
+        parser.add_argument('--prefix', default='seed', help='username prefix of the created users')
+        parser.add_argument('--password', default='seed-password', help='password of every created user')
+        parser.add_argument('--chunk', type=int, default=10, help='boards created per transaction')
+        parser.add_argument('--batch-size', type=int, default=5000, help='bulk_create batch size')
+        parser.add_argument('--random-seed', type=int, default=0, help='seed of the generated values')
+
+    def handle(self, *args, **options) -> None:
+
+        if options['participants'] < 1 or options['participants'] > options['users']:
+            raise CommandError('--participants must be between 1 and --users')
+        rng: random.Random = random.Random(options['random_seed'])
+        batch_size: int = options['batch_size']
+
+        # one hash for everyone: make_password is deliberately slow
+        password: str = make_password(options['password'])
+        prefix: str = options['prefix']
+        start: int = User.objects.filter(username__startswith=f'{prefix}-').count()
+        users: List[User] = User.objects.bulk_create([
+            User(username=f'{prefix}-{i:06d}', password=password, email=f'{prefix}{i}@example.com')
+            for i in range(start, start + options['users'])
+        ], batch_size=batch_size)
+        self.stdout.write(f'{len(users)} users')
+
+        totals: dict = {'boards': 0, 'participants': 0, 'categories': 0, 'goals': 0, 'comments': 0}
+        for first in range(0, options['boards'], options['chunk']):
+            with transaction.atomic():
+                self.seed_boards(rng, users, min(options['chunk'], options['boards'] - first), options, totals)
+            self.stdout.write(', '.join(f'{count} {name}' for name, count in totals.items()))
+
+        self.stdout.write(self.style.SUCCESS(
+            f'done: users {users[0].username} to {users[-1].username}, password {options["password"]!r}'))
+
+    @staticmethod
+    def seed_boards(rng: random.Random, users: List[User], count: int, options: dict, totals: dict) -> None:
+
+        now = timezone.now()
+        today: datetime.date = timezone.localdate()
+        batch_size: int = options['batch_size']
+
+        boards: List[Board] = Board.objects.bulk_create(
+            [Board(title=sentence(rng, 3), created=now, updated=now) for _ in range(count)])
+        members: dict = {board.id: rng.sample(users, options['participants']) for board in boards}
+        BoardParticipant.objects.bulk_create([
+            BoardParticipant(board=board, user=user, created=now, updated=now,
+                             role=BoardParticipant.Role.owner if i == 0 else rng.choice(
+                                 [BoardParticipant.Role.writer, BoardParticipant.Role.reader]))
+            for board in boards for i, user in enumerate(members[board.id])
+        ], batch_size=batch_size)
+        categories: List[GoalCategory] = GoalCategory.objects.bulk_create([
+            GoalCategory(board=board, user=members[board.id][0], title=sentence(rng, 2), created=now, updated=now)
+            for board in boards for _ in range(options['categories'])
+        ], batch_size=batch_size)
+        goals: List[Goal] = Goal.objects.bulk_create([
+            Goal(category=category, board_id=category.board_id, user=rng.choice(members[category.board_id]),
+                 title=sentence(rng, 4), description=sentence(rng, 12) if rng.random() < 0.5 else None,
+                 status=rng.choice(Goal.Status.values), priority=rng.choice(Goal.Priority.values),
+                 due_date=today + datetime.timedelta(days=rng.randint(-60, 60)) if rng.random() < 0.7 else None,
+                 created=now, updated=now)
+            for category in categories for _ in range(options['goals'])
+        ], batch_size=batch_size)
+        comments: List[GoalComment] = GoalComment.objects.bulk_create([
+            GoalComment(goal=goal, board_id=goal.board_id, user=rng.choice(members[goal.board_id]),
+                        text=sentence(rng, 8), created=now, updated=now)
+            for goal in goals for _ in range(options['comments'])
+        ], batch_size=batch_size)
+
+        totals['boards'] += len(boards)
+        totals['participants'] += count * options['participants']
+        totals['categories'] += len(categories)
+        totals['goals'] += len(goals)
+        totals['comments'] += len(comments)
@@ -0,0 +1,33 @@
+# Generated by Django 4.2 on 2026-10-18 06:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('goals', '0008_alter_goalcategory_board'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='boardparticipant',
+            index=models.Index(fields=['user', 'board'], name='participant_user_board_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='goal',
+            index=models.Index(fields=['category', 'status', 'is_deleted'], name='goal_category_status_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='goal',
+            index=models.Index(condition=models.Q(('is_deleted', False)), fields=['category', 'status'], name='goal_active_category_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='goalcategory',
+            index=models.Index(condition=models.Q(('is_deleted', False)), fields=['board', 'title'], name='category_active_board_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='goalcomment',
+            index=models.Index(fields=['goal', '-created'], name='comment_goal_created_idx'),
+        ),
+    ]
@@ -0,0 +1,81 @@
+# Generated by Django 4.2 on 2026-10-18 06:14
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.db import migrations
+
+
+CREATE_TRIGGERS = """
+CREATE FUNCTION goals_goal_search_vector(p_goal_id bigint, p_title text, p_description text)
+RETURNS tsvector AS $$
+    SELECT setweight(to_tsvector('russian', coalesce(p_title, '')), 'A')
+        || setweight(to_tsvector('russian', coalesce(p_description, '')), 'B')
+        || setweight(to_tsvector('russian', coalesce(
+               (SELECT string_agg(c.text, ' ') FROM goals_goalcomment c WHERE c.goal_id = p_goal_id), ''
+           )), 'C')
+$$ LANGUAGE sql STABLE;
+
+CREATE FUNCTION goals_goal_search_vector_trigger() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'INSERT' OR NEW.search_vector IS NULL
+            OR NEW.title IS DISTINCT FROM OLD.title
+            OR NEW.description IS DISTINCT FROM OLD.description THEN
+        NEW.search_vector := goals_goal_search_vector(NEW.id, NEW.title, NEW.description);
+    ELSE
+        -- the ORM writes back whatever vector it loaded, keep the maintained one
+        NEW.search_vector := OLD.search_vector;
+    END IF;
+    RETURN NEW;
+END
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER goals_goal_search_vector
+    BEFORE INSERT OR UPDATE ON goals_goal
+    FOR EACH ROW EXECUTE FUNCTION goals_goal_search_vector_trigger();
+
+CREATE FUNCTION goals_goalcomment_search_vector_trigger() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        UPDATE goals_goal SET search_vector = NULL WHERE id = OLD.goal_id;
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        UPDATE goals_goal SET search_vector = NULL WHERE id = NEW.goal_id;
+    END IF;
+    RETURN NULL;
+END
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER goals_goalcomment_search_vector
+    AFTER INSERT OR UPDATE OF text, goal_id OR DELETE ON goals_goalcomment
+    FOR EACH ROW EXECUTE FUNCTION goals_goalcomment_search_vector_trigger();
+
+UPDATE goals_goal SET search_vector = NULL;
+"""
+
+DROP_TRIGGERS = """
+DROP TRIGGER IF EXISTS goals_goalcomment_search_vector ON goals_goalcomment;
+DROP TRIGGER IF EXISTS goals_goal_search_vector ON goals_goal;
+DROP FUNCTION IF EXISTS goals_goalcomment_search_vector_trigger();
+DROP FUNCTION IF EXISTS goals_goal_search_vector_trigger();
+DROP FUNCTION IF EXISTS goals_goal_search_vector(bigint, text, text);
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('goals', '0009_goals_access_path_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='goal',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True, verbose_name='Поисковый вектор'),
+        ),
+        migrations.RunSQL(CREATE_TRIGGERS, DROP_TRIGGERS),
+        migrations.AddIndex(
+            model_name='goal',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='goal_search_vector_idx'),
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 4.2 on 2026-10-18 06:30
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('goals', '0010_goal_search_vector'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='goal',
+            name='board',
+            field=models.ForeignKey(editable=False, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='goals', to='goals.board', verbose_name='Доска'),
+        ),
+        migrations.AddField(
+            model_name='goalcomment',
+            name='board',
+            field=models.ForeignKey(editable=False, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='comments', to='goals.board', verbose_name='Доска'),
+        ),
+    ]
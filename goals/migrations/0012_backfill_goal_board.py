@@ -0,0 +1,47 @@
+from django.db import migrations
+
+
+BATCH_SIZE = 10000
+
+FILL_GOALS = """
+UPDATE goals_goal g SET board_id = c.board_id
+FROM goals_goalcategory c
+WHERE c.id = g.category_id AND g.id >= %s AND g.id < %s AND g.board_id IS NULL
+"""
+
+FILL_COMMENTS = """
+UPDATE goals_goalcomment gc SET board_id = g.board_id
+FROM goals_goal g
+WHERE g.id = gc.goal_id AND gc.id >= %s AND gc.id < %s AND gc.board_id IS NULL
+"""
+
+
+def fill_in_batches(connection, table: str, sql: str) -> None:
+
+    with connection.cursor() as cursor:
+        cursor.execute(f'SELECT min(id), max(id) FROM {table}')
+        first_id, last_id = cursor.fetchone()
+        if first_id is None:
+            return
+        for start in range(first_id, last_id + 1, BATCH_SIZE):
+            cursor.execute(sql, [start, start + BATCH_SIZE])
+
+
+def backfill_board(apps, schema_editor) -> None:
+
+    fill_in_batches(schema_editor.connection, 'goals_goal', FILL_GOALS)
+    fill_in_batches(schema_editor.connection, 'goals_goalcomment', FILL_COMMENTS)
+
+
+class Migration(migrations.Migration):
+
+    # every batch commits on its own instead of locking both tables for the whole backfill
+    atomic = False
+
+    dependencies = [
+        ('goals', '0011_goal_board_goalcomment_board'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_board, migrations.RunPython.noop),
+    ]
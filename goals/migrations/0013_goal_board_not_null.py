@@ -0,0 +1,28 @@
+# Generated by Django 4.2 on 2026-10-18 06:31
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('goals', '0012_backfill_goal_board'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='goal',
+            name='board',
+            field=models.ForeignKey(editable=False, on_delete=django.db.models.deletion.PROTECT, related_name='goals', to='goals.board', verbose_name='Доска'),
+        ),
+        migrations.AlterField(
+            model_name='goalcomment',
+            name='board',
+            field=models.ForeignKey(editable=False, on_delete=django.db.models.deletion.PROTECT, related_name='comments', to='goals.board', verbose_name='Доска'),
+        ),
+        migrations.AddIndex(
+            model_name='goal',
+            index=models.Index(condition=models.Q(('is_deleted', False)), fields=['board', 'status'], name='goal_active_board_idx'),
+        ),
+    ]
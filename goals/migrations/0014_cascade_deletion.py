@@ -0,0 +1,36 @@
+# Generated by Django 4.2 on 2026-10-18 06:29
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('goals', '0013_goal_board_not_null'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CascadeDeletion',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created', models.DateTimeField(verbose_name='Дата создания')),
+                ('updated', models.DateTimeField(verbose_name='Дата последнего обновления')),
+                ('stage', models.PositiveSmallIntegerField(choices=[(1, 'Категории'), (2, 'Цели'), (3, 'Завершено')], default=1, verbose_name='Этап')),
+                ('last_id', models.BigIntegerField(default=0, verbose_name='Последний обработанный id')),
+                ('total', models.PositiveIntegerField(default=0, verbose_name='Всего строк')),
+                ('processed', models.PositiveIntegerField(default=0, verbose_name='Обработано строк')),
+                ('board', models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='cascades', to='goals.board', verbose_name='Доска')),
+                ('category', models.ForeignKey(null=True, on_delete=django.db.models.deletion.PROTECT, related_name='cascades', to='goals.goalcategory', verbose_name='Категория')),
+            ],
+            options={
+                'verbose_name': 'Каскадное удаление',
+                'verbose_name_plural': 'Каскадные удаления',
+            },
+        ),
+        migrations.AddIndex(
+            model_name='cascadedeletion',
+            index=models.Index(condition=models.Q(('stage', 3), _negated=True), fields=['id'], name='cascade_pending_idx'),
+        ),
+    ]
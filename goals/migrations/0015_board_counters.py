@@ -0,0 +1,149 @@
+# Generated by Django 4.2 on 2026-10-18 06:38
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+# Open statuses (Goal.Status.to_do and in_progress) are the ones that can be overdue.
+CREATE_TRIGGERS = """
+CREATE FUNCTION goals_count_goal(p_board_id bigint, p_status smallint, p_priority smallint, p_due_date date,
+                                 p_delta integer) RETURNS void AS $$
+BEGIN
+    INSERT INTO goals_boardgoalcounter (board_id, status, priority, count)
+        VALUES (p_board_id, p_status, p_priority, p_delta)
+        ON CONFLICT (board_id, status, priority) DO UPDATE SET count = goals_boardgoalcounter.count + EXCLUDED.count;
+    IF p_due_date IS NOT NULL AND p_status IN (1, 2) THEN
+        INSERT INTO goals_boardduedatecounter (board_id, due_date, count)
+            VALUES (p_board_id, p_due_date, p_delta)
+            ON CONFLICT (board_id, due_date) DO UPDATE SET count = goals_boardduedatecounter.count + EXCLUDED.count;
+    END IF;
+END
+$$ LANGUAGE plpgsql;
+
+CREATE FUNCTION goals_goal_counters_trigger() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') AND NOT OLD.is_deleted THEN
+        PERFORM goals_count_goal(OLD.board_id, OLD.status::smallint, OLD.priority::smallint, OLD.due_date, -1);
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') AND NOT NEW.is_deleted THEN
+        PERFORM goals_count_goal(NEW.board_id, NEW.status::smallint, NEW.priority::smallint, NEW.due_date, 1);
+    END IF;
+    RETURN NULL;
+END
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER goals_goal_counters
+    AFTER INSERT OR DELETE ON goals_goal
+    FOR EACH ROW EXECUTE FUNCTION goals_goal_counters_trigger();
+
+CREATE TRIGGER goals_goal_counters_update
+    AFTER UPDATE OF board_id, status, priority, due_date, is_deleted ON goals_goal
+    FOR EACH ROW
+    WHEN ((OLD.board_id, OLD.status, OLD.priority, OLD.due_date, OLD.is_deleted)
+          IS DISTINCT FROM (NEW.board_id, NEW.status, NEW.priority, NEW.due_date, NEW.is_deleted))
+    EXECUTE FUNCTION goals_goal_counters_trigger();
+
+CREATE FUNCTION goals_count_comment(p_board_id bigint, p_delta integer) RETURNS void AS $$
+    INSERT INTO goals_boardcommentcounter (board_id, count) VALUES (p_board_id, p_delta)
+        ON CONFLICT (board_id) DO UPDATE SET count = goals_boardcommentcounter.count + EXCLUDED.count;
+$$ LANGUAGE sql;
+
+CREATE FUNCTION goals_goalcomment_counters_trigger() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        PERFORM goals_count_comment(OLD.board_id, -1);
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        PERFORM goals_count_comment(NEW.board_id, 1);
+    END IF;
+    RETURN NULL;
+END
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER goals_goalcomment_counters
+    AFTER INSERT OR DELETE ON goals_goalcomment
+    FOR EACH ROW EXECUTE FUNCTION goals_goalcomment_counters_trigger();
+
+CREATE TRIGGER goals_goalcomment_counters_update
+    AFTER UPDATE OF board_id ON goals_goalcomment
+    FOR EACH ROW WHEN (OLD.board_id IS DISTINCT FROM NEW.board_id)
+    EXECUTE FUNCTION goals_goalcomment_counters_trigger();
+
+INSERT INTO goals_boardgoalcounter (board_id, status, priority, count)
+    SELECT board_id, status, priority, count(*) FROM goals_goal WHERE NOT is_deleted
+    GROUP BY board_id, status, priority;
+INSERT INTO goals_boardduedatecounter (board_id, due_date, count)
+    SELECT board_id, due_date, count(*) FROM goals_goal
+    WHERE NOT is_deleted AND due_date IS NOT NULL AND status IN (1, 2)
+    GROUP BY board_id, due_date;
+INSERT INTO goals_boardcommentcounter (board_id, count)
+    SELECT board_id, count(*) FROM goals_goalcomment GROUP BY board_id;
+"""
+
+DROP_TRIGGERS = """
+DROP TRIGGER IF EXISTS goals_goalcomment_counters_update ON goals_goalcomment;
+DROP TRIGGER IF EXISTS goals_goalcomment_counters ON goals_goalcomment;
+DROP TRIGGER IF EXISTS goals_goal_counters_update ON goals_goal;
+DROP TRIGGER IF EXISTS goals_goal_counters ON goals_goal;
+DROP FUNCTION IF EXISTS goals_goalcomment_counters_trigger();
+DROP FUNCTION IF EXISTS goals_count_comment(bigint, integer);
+DROP FUNCTION IF EXISTS goals_goal_counters_trigger();
+DROP FUNCTION IF EXISTS goals_count_goal(bigint, smallint, smallint, date, integer);
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('goals', '0014_cascade_deletion'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BoardCommentCounter',
+            fields=[
+                ('board', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='comment_counter', serialize=False, to='goals.board', verbose_name='Доска')),
+                ('count', models.IntegerField(default=0, verbose_name='Количество')),
+            ],
+            options={
+                'verbose_name': 'Счётчик комментариев',
+                'verbose_name_plural': 'Счётчики комментариев',
+            },
+        ),
+        migrations.CreateModel(
+            name='BoardGoalCounter',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('status', models.PositiveSmallIntegerField(choices=[(1, 'К выполнению'), (2, 'В процессе'), (3, 'Выполнено'), (4, 'Архив')], verbose_name='Статус')),
+                ('priority', models.PositiveSmallIntegerField(choices=[(1, 'Низкий'), (2, 'Средний'), (3, 'Высокий'), (4, 'Критический')], verbose_name='Приоритет')),
+                ('count', models.IntegerField(default=0, verbose_name='Количество')),
+                ('board', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='goal_counters', to='goals.board', verbose_name='Доска')),
+            ],
+            options={
+                'verbose_name': 'Счётчик целей',
+                'verbose_name_plural': 'Счётчики целей',
+            },
+        ),
+        migrations.CreateModel(
+            name='BoardDueDateCounter',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('due_date', models.DateField(verbose_name='Дата дедлайна')),
+                ('count', models.IntegerField(default=0, verbose_name='Количество')),
+                ('board', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='due_date_counters', to='goals.board', verbose_name='Доска')),
+            ],
+            options={
+                'verbose_name': 'Счётчик дедлайнов',
+                'verbose_name_plural': 'Счётчики дедлайнов',
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='boardgoalcounter',
+            constraint=models.UniqueConstraint(fields=('board', 'status', 'priority'), name='goal_counter_unique'),
+        ),
+        migrations.AddConstraint(
+            model_name='boardduedatecounter',
+            constraint=models.UniqueConstraint(fields=('board', 'due_date'), name='due_date_counter_unique'),
+        ),
+        migrations.RunSQL(CREATE_TRIGGERS, DROP_TRIGGERS),
+    ]
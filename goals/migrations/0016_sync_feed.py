@@ -0,0 +1,108 @@
+# Generated by Django 4.2 on 2026-10-18 06:41
+
+from django.db import migrations, models
+import django.db.models.deletion
+import django.utils.timezone
+
+
+# Rows that are hard deleted or move to another board leave a tombstone for the sync feed.
+CREATE_TRIGGERS = """
+CREATE FUNCTION goals_sync_tombstone_trigger() RETURNS trigger AS $$
+BEGIN
+    INSERT INTO goals_synctombstone (section, object_id, board_id, deleted)
+        VALUES (TG_ARGV[0], OLD.id, OLD.board_id, clock_timestamp());
+    RETURN NULL;
+END
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER goals_goal_sync_tombstone
+    AFTER DELETE ON goals_goal
+    FOR EACH ROW EXECUTE FUNCTION goals_sync_tombstone_trigger('goals');
+
+CREATE TRIGGER goals_goal_sync_tombstone_move
+    AFTER UPDATE OF board_id ON goals_goal
+    FOR EACH ROW WHEN (OLD.board_id IS DISTINCT FROM NEW.board_id)
+    EXECUTE FUNCTION goals_sync_tombstone_trigger('goals');
+
+CREATE TRIGGER goals_goalcategory_sync_tombstone
+    AFTER DELETE ON goals_goalcategory
+    FOR EACH ROW EXECUTE FUNCTION goals_sync_tombstone_trigger('categories');
+
+CREATE TRIGGER goals_goalcategory_sync_tombstone_move
+    AFTER UPDATE OF board_id ON goals_goalcategory
+    FOR EACH ROW WHEN (OLD.board_id IS DISTINCT FROM NEW.board_id)
+    EXECUTE FUNCTION goals_sync_tombstone_trigger('categories');
+
+CREATE TRIGGER goals_goalcomment_sync_tombstone
+    AFTER DELETE ON goals_goalcomment
+    FOR EACH ROW EXECUTE FUNCTION goals_sync_tombstone_trigger('comments');
+
+CREATE TRIGGER goals_goalcomment_sync_tombstone_move
+    AFTER UPDATE OF board_id ON goals_goalcomment
+    FOR EACH ROW WHEN (OLD.board_id IS DISTINCT FROM NEW.board_id)
+    EXECUTE FUNCTION goals_sync_tombstone_trigger('comments');
+
+CREATE TRIGGER goals_boardparticipant_sync_tombstone
+    AFTER DELETE ON goals_boardparticipant
+    FOR EACH ROW EXECUTE FUNCTION goals_sync_tombstone_trigger('participants');
+"""
+
+DROP_TRIGGERS = """
+DROP TRIGGER IF EXISTS goals_goal_sync_tombstone ON goals_goal;
+DROP TRIGGER IF EXISTS goals_goal_sync_tombstone_move ON goals_goal;
+DROP TRIGGER IF EXISTS goals_goalcategory_sync_tombstone ON goals_goalcategory;
+DROP TRIGGER IF EXISTS goals_goalcategory_sync_tombstone_move ON goals_goalcategory;
+DROP TRIGGER IF EXISTS goals_goalcomment_sync_tombstone ON goals_goalcomment;
+DROP TRIGGER IF EXISTS goals_goalcomment_sync_tombstone_move ON goals_goalcomment;
+DROP TRIGGER IF EXISTS goals_boardparticipant_sync_tombstone ON goals_boardparticipant;
+DROP FUNCTION IF EXISTS goals_sync_tombstone_trigger();
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('goals', '0015_board_counters'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SyncTombstone',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('section', models.CharField(max_length=32, verbose_name='Раздел')),
+                ('object_id', models.BigIntegerField(verbose_name='Id записи')),
+                ('deleted', models.DateTimeField(default=django.utils.timezone.now, verbose_name='Дата удаления')),
+            ],
+            options={
+                'verbose_name': 'Удалённая запись',
+                'verbose_name_plural': 'Удалённые записи',
+            },
+        ),
+        migrations.AddIndex(
+            model_name='boardparticipant',
+            index=models.Index(fields=['board', 'updated'], name='participant_board_updated_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='goal',
+            index=models.Index(fields=['board', 'updated'], name='goal_board_updated_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='goalcategory',
+            index=models.Index(fields=['board', 'updated'], name='category_board_updated_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='goalcomment',
+            index=models.Index(fields=['board', 'updated'], name='comment_board_updated_idx'),
+        ),
+        migrations.AddField(
+            model_name='synctombstone',
+            name='board',
+            field=models.ForeignKey(db_constraint=False, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to='goals.board', verbose_name='Доска'),
+        ),
+        migrations.AddIndex(
+            model_name='synctombstone',
+            index=models.Index(fields=['board', 'deleted'], name='tombstone_board_deleted_idx'),
+        ),
+        migrations.RunSQL(CREATE_TRIGGERS, DROP_TRIGGERS),
+    ]
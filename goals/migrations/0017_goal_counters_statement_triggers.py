@@ -0,0 +1,67 @@
+# Generated by Django 4.2 on 2026-10-18 07:05
+
+from django.db import migrations
+
+
+# Inserts and deletes of goals update the counters once per statement from the transition table,
+# instead of once per row: a COPY or bulk_create of many goals on one board no longer updates the
+# same counter rows thousands of times in one transaction. Updates keep the row level trigger.
+CREATE_TRIGGERS = """
+DROP TRIGGER goals_goal_counters ON goals_goal;
+
+CREATE FUNCTION goals_goal_counters_statement_trigger() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        INSERT INTO goals_boardgoalcounter (board_id, status, priority, count)
+            SELECT board_id, status, priority, count(*) FROM goals_goal_inserted WHERE NOT is_deleted
+            GROUP BY board_id, status, priority ORDER BY board_id, status, priority
+            ON CONFLICT (board_id, status, priority) DO UPDATE SET count = goals_boardgoalcounter.count + EXCLUDED.count;
+        INSERT INTO goals_boardduedatecounter (board_id, due_date, count)
+            SELECT board_id, due_date, count(*) FROM goals_goal_inserted
+            WHERE NOT is_deleted AND due_date IS NOT NULL AND status IN (1, 2)
+            GROUP BY board_id, due_date ORDER BY board_id, due_date
+            ON CONFLICT (board_id, due_date) DO UPDATE SET count = goals_boardduedatecounter.count + EXCLUDED.count;
+    ELSE
+        INSERT INTO goals_boardgoalcounter (board_id, status, priority, count)
+            SELECT board_id, status, priority, -count(*) FROM goals_goal_deleted WHERE NOT is_deleted
+            GROUP BY board_id, status, priority ORDER BY board_id, status, priority
+            ON CONFLICT (board_id, status, priority) DO UPDATE SET count = goals_boardgoalcounter.count + EXCLUDED.count;
+        INSERT INTO goals_boardduedatecounter (board_id, due_date, count)
+            SELECT board_id, due_date, -count(*) FROM goals_goal_deleted
+            WHERE NOT is_deleted AND due_date IS NOT NULL AND status IN (1, 2)
+            GROUP BY board_id, due_date ORDER BY board_id, due_date
+            ON CONFLICT (board_id, due_date) DO UPDATE SET count = goals_boardduedatecounter.count + EXCLUDED.count;
+    END IF;
+    RETURN NULL;
+END
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER goals_goal_counters_insert
+    AFTER INSERT ON goals_goal REFERENCING NEW TABLE AS goals_goal_inserted
+    FOR EACH STATEMENT EXECUTE FUNCTION goals_goal_counters_statement_trigger();
+
+CREATE TRIGGER goals_goal_counters_delete
+    AFTER DELETE ON goals_goal REFERENCING OLD TABLE AS goals_goal_deleted
+    FOR EACH STATEMENT EXECUTE FUNCTION goals_goal_counters_statement_trigger();
+"""
+
+DROP_TRIGGERS = """
+DROP TRIGGER IF EXISTS goals_goal_counters_insert ON goals_goal;
+DROP TRIGGER IF EXISTS goals_goal_counters_delete ON goals_goal;
+DROP FUNCTION IF EXISTS goals_goal_counters_statement_trigger();
+
+CREATE TRIGGER goals_goal_counters
+    AFTER INSERT OR DELETE ON goals_goal
+    FOR EACH ROW EXECUTE FUNCTION goals_goal_counters_trigger();
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('goals', '0016_sync_feed'),
+    ]
+
+    operations = [
+        migrations.RunSQL(CREATE_TRIGGERS, DROP_TRIGGERS),
+    ]
@@ -0,0 +1,122 @@
+# Generated by Django 4.2 on 2026-10-18 07:12
+
+from django.conf import settings
+import django.contrib.postgres.search
+from django.db import migrations, models
+import django.db.models.deletion
+import django.utils.timezone
+
+
+# Live rows first; archived rows keep their ids, so the union has unique ids.
+CREATE_VIEWS = """
+CREATE VIEW goals_goal_with_archived AS
+    SELECT id, created, updated, user_id, category_id, board_id, title, description, status, priority, due_date,
+           is_deleted, search_vector, NULL::timestamptz AS archived
+    FROM goals_goal
+    UNION ALL
+    SELECT id, created, updated, user_id, category_id, board_id, title, description, status, priority, due_date,
+           is_deleted, NULL::tsvector, archived
+    FROM goals_archivedgoal;
+
+CREATE VIEW goals_goalcomment_with_archived AS
+    SELECT id, created, updated, user_id, goal_id, board_id, text, NULL::timestamptz AS archived
+    FROM goals_goalcomment
+    UNION ALL
+    SELECT id, created, updated, user_id, goal_id, board_id, text, archived
+    FROM goals_archivedgoalcomment;
+"""
+
+DROP_VIEWS = """
+DROP VIEW IF EXISTS goals_goalcomment_with_archived;
+DROP VIEW IF EXISTS goals_goal_with_archived;
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('goals', '0017_goal_counters_statement_triggers'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='GoalCommentWithArchived',
+            fields=[
+                ('created', models.DateTimeField(verbose_name='Дата создания')),
+                ('updated', models.DateTimeField(verbose_name='Дата последнего обновления')),
+                ('id', models.BigIntegerField(primary_key=True, serialize=False)),
+                ('text', models.TextField(verbose_name='Текст')),
+                ('archived', models.DateTimeField(null=True, verbose_name='Дата переноса в архив')),
+            ],
+            options={
+                'db_table': 'goals_goalcomment_with_archived',
+                'ordering': ['-created'],
+                'managed': False,
+            },
+        ),
+        migrations.CreateModel(
+            name='GoalWithArchived',
+            fields=[
+                ('created', models.DateTimeField(verbose_name='Дата создания')),
+                ('updated', models.DateTimeField(verbose_name='Дата последнего обновления')),
+                ('id', models.BigIntegerField(primary_key=True, serialize=False)),
+                ('title', models.CharField(max_length=256, verbose_name='Название')),
+                ('description', models.TextField(blank=True, null=True, verbose_name='Описание')),
+                ('status', models.PositiveSmallIntegerField(choices=[(1, 'К выполнению'), (2, 'В процессе'), (3, 'Выполнено'), (4, 'Архив')], verbose_name='Статус')),
+                ('priority', models.PositiveSmallIntegerField(choices=[(1, 'Низкий'), (2, 'Средний'), (3, 'Высокий'), (4, 'Критический')], verbose_name='Приоритет')),
+                ('due_date', models.DateField(null=True, verbose_name='Дата дедлайна')),
+                ('is_deleted', models.BooleanField(default=False, verbose_name='Удалена')),
+                ('search_vector', django.contrib.postgres.search.SearchVectorField(editable=False, null=True, verbose_name='Поисковый вектор')),
+                ('archived', models.DateTimeField(null=True, verbose_name='Дата переноса в архив')),
+            ],
+            options={
+                'db_table': 'goals_goal_with_archived',
+                'managed': False,
+            },
+        ),
+        migrations.CreateModel(
+            name='ArchivedGoal',
+            fields=[
+                ('created', models.DateTimeField(verbose_name='Дата создания')),
+                ('updated', models.DateTimeField(verbose_name='Дата последнего обновления')),
+                ('id', models.BigIntegerField(primary_key=True, serialize=False)),
+                ('title', models.CharField(max_length=256, verbose_name='Название')),
+                ('description', models.TextField(blank=True, null=True, verbose_name='Описание')),
+                ('status', models.PositiveSmallIntegerField(choices=[(1, 'К выполнению'), (2, 'В процессе'), (3, 'Выполнено'), (4, 'Архив')], verbose_name='Статус')),
+                ('priority', models.PositiveSmallIntegerField(choices=[(1, 'Низкий'), (2, 'Средний'), (3, 'Высокий'), (4, 'Критический')], verbose_name='Приоритет')),
+                ('due_date', models.DateField(null=True, verbose_name='Дата дедлайна')),
+                ('is_deleted', models.BooleanField(default=False, verbose_name='Удалена')),
+                ('archived', models.DateTimeField(default=django.utils.timezone.now, verbose_name='Дата переноса в архив')),
+                ('board', models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='+', to='goals.board', verbose_name='Доска')),
+                ('category', models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='+', to='goals.goalcategory', verbose_name='Категория')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='+', to=settings.AUTH_USER_MODEL, verbose_name='Автор')),
+            ],
+            options={
+                'verbose_name': 'Архивная цель',
+                'verbose_name_plural': 'Архивные цели',
+            },
+        ),
+        migrations.CreateModel(
+            name='ArchivedGoalComment',
+            fields=[
+                ('created', models.DateTimeField(verbose_name='Дата создания')),
+                ('updated', models.DateTimeField(verbose_name='Дата последнего обновления')),
+                ('id', models.BigIntegerField(primary_key=True, serialize=False)),
+                ('text', models.TextField(verbose_name='Текст')),
+                ('archived', models.DateTimeField(default=django.utils.timezone.now, verbose_name='Дата переноса в архив')),
+                ('board', models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='+', to='goals.board', verbose_name='Доска')),
+                ('goal', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='comments', to='goals.archivedgoal', verbose_name='Цель')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='+', to=settings.AUTH_USER_MODEL, verbose_name='Автор')),
+            ],
+            options={
+                'verbose_name': 'Архивный комментарий',
+                'verbose_name_plural': 'Архивные комментарии',
+            },
+        ),
+        migrations.AddIndex(
+            model_name='archivedgoal',
+            index=models.Index(fields=['board', 'status'], name='archived_goal_board_idx'),
+        ),
+        migrations.RunSQL(CREATE_VIEWS, DROP_VIEWS),
+    ]
@@ -0,0 +1,90 @@
+# Generated by Django 4.2 on 2026-10-18 18:02
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.db import migrations
+
+
+# Comment text moves out of the goal vector into a vector of its own: a comment write only touches its own
+# row instead of rebuilding the goal vector from every comment of the goal under the goal row lock.
+SPLIT_VECTORS = """
+CREATE OR REPLACE FUNCTION goals_goal_search_vector(p_goal_id bigint, p_title text, p_description text)
+RETURNS tsvector AS $$
+    SELECT setweight(to_tsvector('russian', coalesce(p_title, '')), 'A')
+        || setweight(to_tsvector('russian', coalesce(p_description, '')), 'B')
+$$ LANGUAGE sql IMMUTABLE;
+
+DROP TRIGGER IF EXISTS goals_goalcomment_search_vector ON goals_goalcomment;
+DROP FUNCTION IF EXISTS goals_goalcomment_search_vector_trigger();
+
+CREATE FUNCTION goals_goalcomment_search_vector_trigger() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'INSERT' OR NEW.search_vector IS NULL OR NEW.text IS DISTINCT FROM OLD.text THEN
+        NEW.search_vector := setweight(to_tsvector('russian', coalesce(NEW.text, '')), 'C');
+    ELSE
+        -- the ORM writes back whatever vector it loaded, keep the maintained one
+        NEW.search_vector := OLD.search_vector;
+    END IF;
+    RETURN NEW;
+END
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER goals_goalcomment_search_vector
+    BEFORE INSERT OR UPDATE ON goals_goalcomment
+    FOR EACH ROW EXECUTE FUNCTION goals_goalcomment_search_vector_trigger();
+
+UPDATE goals_goalcomment SET search_vector = NULL;
+UPDATE goals_goal SET search_vector = NULL;
+"""
+
+MERGE_VECTORS = """
+DROP TRIGGER IF EXISTS goals_goalcomment_search_vector ON goals_goalcomment;
+DROP FUNCTION IF EXISTS goals_goalcomment_search_vector_trigger();
+
+CREATE OR REPLACE FUNCTION goals_goal_search_vector(p_goal_id bigint, p_title text, p_description text)
+RETURNS tsvector AS $$
+    SELECT setweight(to_tsvector('russian', coalesce(p_title, '')), 'A')
+        || setweight(to_tsvector('russian', coalesce(p_description, '')), 'B')
+        || setweight(to_tsvector('russian', coalesce(
+               (SELECT string_agg(c.text, ' ') FROM goals_goalcomment c WHERE c.goal_id = p_goal_id), ''
+           )), 'C')
+$$ LANGUAGE sql STABLE;
+
+CREATE FUNCTION goals_goalcomment_search_vector_trigger() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        UPDATE goals_goal SET search_vector = NULL WHERE id = OLD.goal_id;
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        UPDATE goals_goal SET search_vector = NULL WHERE id = NEW.goal_id;
+    END IF;
+    RETURN NULL;
+END
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER goals_goalcomment_search_vector
+    AFTER INSERT OR UPDATE OF text, goal_id OR DELETE ON goals_goalcomment
+    FOR EACH ROW EXECUTE FUNCTION goals_goalcomment_search_vector_trigger();
+
+UPDATE goals_goal SET search_vector = NULL;
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('goals', '0018_goal_archive'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='goalcomment',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True, verbose_name='Поисковый вектор'),
+        ),
+        migrations.RunSQL(SPLIT_VECTORS, MERGE_VECTORS),
+        migrations.AddIndex(
+            model_name='goalcomment',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='comment_search_vector_idx'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 4.2 on 2026-10-18 18:09
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('goals', '0019_goalcomment_search_vector'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='goal',
+            name='goal_category_status_idx',
+        ),
+    ]
@@ -0,0 +1,166 @@
+import hashlib
+from typing import Dict, List, Optional, Tuple, Type
+
+from django.conf import settings
+from django.contrib.postgres.aggregates import StringAgg
+from django.db import models
+from django.db.models.functions import MD5, Cast, Concat
+from django.http import HttpResponse
+from django.utils.http import parse_etags
+from rest_framework import status
+from rest_framework.renderers import JSONRenderer
+from rest_framework.request import Request
+from rest_framework.response import Response
+
+from goals.cache import HITS_KEY, MISSES_KEY, board_generations, count, get_cache, make_response_key
+from goals.roles import get_board_roles
+from goals.row_serializers import RowSerializer, get_row_serializer
+
+
+class ConditionalListMixin:
+    """
+    Answers conditional GETs of a list view with 304 Not Modified.
+
+    The validators are max(updated), the row count and a hash of the nested authors of the filtered
+    queryset, so an unchanged list costs one aggregate query and no serialization. Views whose rows
+    carry more than their own columns add aggregates in ``get_list_aggregates`` or extend
+    ``get_list_validators``; all of them go into the ETag. There is no Last-Modified: a row leaving the filtered set (soft delete, move, lost
+    access) does not move max(updated), so If-Modified-Since would answer 304 for a changed list.
+    """
+
+    # serialized fields of the nested author, None for rows without one
+    author_field: Optional[str] = "user"
+    author_fields: Tuple[str, ...] = ("username", "first_name", "last_name", "email")
+
+    def get_list_aggregates(self) -> Dict[str, models.Aggregate]:
+
+        aggregates: Dict[str, models.Aggregate] = {"last_modified": models.Max("updated"), "count": models.Count("id")}
+        if self.author_field is not None:
+            parts: List = [Cast(f"{self.author_field}_id", models.TextField())]
+            for field in self.author_fields:
+                parts += [models.Value("\x1f"), f"{self.author_field}__{field}"]
+            author = Concat(*parts, output_field=models.TextField())
+            aggregates["authors"] = MD5(StringAgg(author, delimiter="\x1e", distinct=True, ordering=author))
+        return aggregates
+
+    def get_list_validators(self, queryset: models.QuerySet) -> dict:
+
+        return queryset.order_by().aggregate(**self.get_list_aggregates())
+
+    @staticmethod
+    def make_etag(request: Request, validators: dict) -> str:
+
+        values: str = ":".join(str(validators[name]) for name in sorted(validators))
+        key: str = f'{request.user.pk}:{values}:{request.get_full_path()}'
+        return f'W/"{hashlib.md5(key.encode()).hexdigest()}"'
+
+    @staticmethod
+    def is_not_modified(request: Request, etag: str) -> bool:
+
+        if_none_match: Optional[str] = request.headers.get("If-None-Match")
+        if if_none_match is None:
+            return False
+        tags = {tag.removeprefix("W/") for tag in parse_etags(if_none_match)}
+        return "*" in tags or etag.removeprefix("W/") in tags
+
+    def list(self, request: Request, *args, **kwargs) -> Response:
+
+        validators: dict = self.get_list_validators(self.filter_queryset(self.get_queryset()))
+        etag: str = self.make_etag(request, validators)
+
+        if self.is_not_modified(request, etag):
+            response: Response = Response(status=status.HTTP_304_NOT_MODIFIED)
+        else:
+            response = super().list(request, *args, **kwargs)
+
+        response["ETag"] = etag
+        return response
+
+
+class ResponseCacheMixin:
+    """
+    Opt-in (GOALS_RESPONSE_CACHE) cache of rendered JSON list responses.
+
+    Entries are keyed by the view, the user, the generations of the user's boards and the query
+    string. Any write to a board bumps its generation, which orphans exactly the entries covering that
+    board; the cache backend's TTL and size limit take care of them.
+    """
+
+    def get_response_cache_key(self, request: Request) -> str:
+
+        generations: Dict[int, int] = board_generations(get_board_roles(request).board_ids())
+        return make_response_key(type(self).__name__, request.user.pk, generations, request.query_params.lists())
+
+    def list(self, request: Request, *args, **kwargs) -> Response:
+
+        if not settings.GOALS_RESPONSE_CACHE or not isinstance(request.accepted_renderer, JSONRenderer):
+            return super().list(request, *args, **kwargs)
+
+        key: str = self.get_response_cache_key(request)
+        cached: Optional[tuple] = get_cache().get(key)
+        if cached is not None:
+            count(HITS_KEY)
+            content, content_type = cached
+            response: HttpResponse = HttpResponse(content, content_type=content_type)
+            response["X-Cache"] = "HIT"
+            return response
+
+        count(MISSES_KEY)
+        response = super().list(request, *args, **kwargs)
+        if response.status_code == status.HTTP_200_OK:
+            response.accepted_renderer = request.accepted_renderer
+            response.accepted_media_type = request.accepted_media_type
+            response.renderer_context = self.get_renderer_context()
+            response.render()
+            get_cache().set(key, (response.content, response["Content-Type"]))
+        response["X-Cache"] = "MISS"
+        return response
+
+
+class RowListMixin:
+    """
+    Serves list GETs through a RowSerializer: the page is fetched with ``.values()`` and turned into
+    dicts directly, with the same output as the view's serializer_class.
+
+    ``?expand=users:sideload`` swaps the nested author of every row for its ``user_id`` and adds
+    the distinct authors of the page once, as a ``users`` map keyed by id. Unpaginated lists are then
+    wrapped as ``{"results": [...], "users": {...}}``.
+    """
+
+    row_serializer_class: Optional[Type[RowSerializer]] = None
+    expand_query_param: str = "expand"
+    sideload_fields: Dict[str, str] = {"users": "user"}
+
+    def get_sideload(self, request: Request) -> Tuple[str, ...]:
+
+        requested: set = {
+            item.strip() for value in request.query_params.getlist(self.expand_query_param) for item in value.split(",")
+        }
+        return tuple(sorted(field for name, field in self.sideload_fields.items() if f"{name}:sideload" in requested))
+
+    def list(self, request: Request, *args, **kwargs) -> Response:
+
+        if self.row_serializer_class is None:
+            return super().list(request, *args, **kwargs)
+
+        sideload: Tuple[str, ...] = self.get_sideload(request)
+        row_serializer: RowSerializer = get_row_serializer(self.row_serializer_class, sideload)
+        queryset: models.QuerySet = row_serializer.values(self.filter_queryset(self.get_queryset()))
+
+        page: Optional[list] = self.paginate_queryset(queryset)
+        data: List[dict] = row_serializer.serialize(queryset if page is None else page)
+        return self.get_list_response(data, page is not None, row_serializer.load_sideloads(data))
+
+    def get_list_response(self, data: List[dict], paginated: bool, sideloads: Dict[str, dict]) -> Response:
+
+        if paginated:
+            response: Response = self.get_paginated_response(data)
+        elif sideloads:
+            response = Response({"results": data})
+        else:
+            return Response(data)
+
+        names: Dict[str, str] = {field: name for name, field in self.sideload_fields.items()}
+        for field, objects in sideloads.items():
+            response.data[names[field]] = objects
+        return response
@@ -1,6 +1,8 @@
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
-from django.db import models
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
+from django.db import models, transaction
 from django.utils import timezone
 
 from core.models import User
@@ -20,9 +22,47 @@ class DatesModelMixin(models.Model):
         if not self.id:
             self.created = timezone.now()
         self.updated = timezone.now()
+        if kwargs.get("update_fields") is not None:
+            kwargs["update_fields"] = {*kwargs["update_fields"], "updated"}
         return super().save(*args, **kwargs)
 
 
+class BoardCopyMixin:
+    """
+    Keeps the denormalized ``board`` of a row in step with the parent named by ``board_source``.
+
+    The parent's board is only read when the parent changed since the row was loaded (or the row is
+    new), so saves that leave the parent alone, like a status-only PATCH, cost no extra query.
+    """
+    board_source: str
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_source_id = instance.__dict__.get(f"{cls.board_source}_id")
+        return instance
+
+    def source_board_id(self, update_fields) -> Optional[int]:
+        """
+        Returns the board of the parent when it has to be copied, None when the stored one still holds.
+        """
+        source_id: Optional[int] = getattr(self, f"{self.board_source}_id")
+        if update_fields is not None and not {self.board_source, f"{self.board_source}_id"} & set(update_fields):
+            return None
+        if self.board_id is not None and source_id == getattr(self, "_loaded_source_id", None):
+            return None
+        field = self._meta.get_field(self.board_source)
+        if field.is_cached(self):
+            return getattr(self, self.board_source).board_id
+        return field.related_model.objects.values_list("board_id", flat=True).get(pk=source_id)
+
+    def save(self, *args, **kwargs):
+
+        super().save(*args, **kwargs)
+        self._loaded_source_id = getattr(self, f"{self.board_source}_id")
+
+
 class Board(DatesModelMixin):
 
     class Meta:
@@ -41,6 +81,10 @@ class BoardParticipant(DatesModelMixin):
         unique_together: Tuple[str, ...] = ("board", "user")
         verbose_name: str = "Участник"
         verbose_name_plural: str = "Участники"
+        indexes: List[models.Index] = [
+            models.Index(fields=["user", "board"], name="participant_user_board_idx"),
+            models.Index(fields=["board", "updated"], name="participant_board_updated_idx"),
+        ]
 
     class Role(models.IntegerChoices):
 
@@ -59,6 +103,11 @@ class GoalCategory(DatesModelMixin):
 
         verbose_name: str = "Категория"
         verbose_name_plural: str = "Категории"
+        indexes: List[models.Index] = [
+            models.Index(fields=["board", "title"], condition=models.Q(is_deleted=False),
+                         name="category_active_board_idx"),
+            models.Index(fields=["board", "updated"], name="category_board_updated_idx"),
+        ]
 
     user = models.ForeignKey(User, verbose_name="Автор", on_delete=models.PROTECT)
     title = models.CharField(verbose_name="Название", max_length=255)
@@ -66,12 +115,20 @@ class GoalCategory(DatesModelMixin):
     is_deleted = models.BooleanField(verbose_name="Удалена", default=False)
 
 
-class Goal(DatesModelMixin):
+class Goal(BoardCopyMixin, DatesModelMixin):
 
     class Meta:
 
         verbose_name: str = "Цель"
         verbose_name_plural: str = "Цели"
+        indexes: List[models.Index] = [
+            models.Index(fields=["category", "status"], condition=models.Q(is_deleted=False),
+                         name="goal_active_category_idx"),
+            models.Index(fields=["board", "status"], condition=models.Q(is_deleted=False),
+                         name="goal_active_board_idx"),
+            GinIndex(fields=["search_vector"], name="goal_search_vector_idx"),
+            models.Index(fields=["board", "updated"], name="goal_board_updated_idx"),
+        ]
 
     class Status(models.IntegerChoices):
 
@@ -87,6 +144,8 @@ class Goal(DatesModelMixin):
         high: Tuple[int, str] = 3, "Высокий"
         critical: Tuple[int, str] = 4, "Критический"
 
+    board_source: str = "category"
+
     user = models.ForeignKey(User, verbose_name="Автор", on_delete=models.PROTECT)
     category = models.ForeignKey(GoalCategory, on_delete=models.CASCADE, verbose_name="Категория")
     title = models.CharField(max_length=256, verbose_name="Название")
@@ -96,16 +155,247 @@ class Goal(DatesModelMixin):
                                                 default=Priority.medium)
     due_date = models.DateField(verbose_name="Дата дедлайна", null=True)
     is_deleted = models.BooleanField(verbose_name="Удалена", default=False)
+    # Title and description only, maintained by the goals_goal_search_vector trigger, see migrations 0010
+    # and 0019; comment text has its own GoalComment.search_vector.
+    search_vector = SearchVectorField(verbose_name="Поисковый вектор", null=True, editable=False)
+    # Copy of category.board, lets goal queries join BoardParticipant directly.
+    board = models.ForeignKey(Board, verbose_name="Доска", on_delete=models.PROTECT, related_name="goals",
+                              editable=False)
 
+    def save(self, *args, **kwargs):
+
+        board_id: Optional[int] = self.source_board_id(kwargs.get("update_fields"))
+        moved: bool = board_id is not None and self.id is not None and self.board_id not in (None, board_id)
+        self.previous_board_id: Optional[int] = self.board_id if moved else None
+        if board_id is not None:
+            self.board_id = board_id
+            if kwargs.get("update_fields") is not None:
+                kwargs["update_fields"] = {*kwargs["update_fields"], "board"}
+
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+            if moved:
+                # the board_id trigger tombstones the comments on the old board, a fresh updated
+                # makes the sync feed upsert them on the new one
+                GoalComment.objects.filter(goal_id=self.id).update(board_id=board_id, updated=timezone.now())
 
-class GoalComment(DatesModelMixin):
+
+class GoalComment(BoardCopyMixin, DatesModelMixin):
 
     class Meta:
 
         verbose_name: str = "Комментарий"
         verbose_name_plural: str = "Комментарии"
         ordering: List[str] = ["-created"]
+        indexes: List[models.Index] = [
+            models.Index(fields=["goal", "-created"], name="comment_goal_created_idx"),
+            models.Index(fields=["board", "updated"], name="comment_board_updated_idx"),
+            GinIndex(fields=["search_vector"], name="comment_search_vector_idx"),
+        ]
+
+    board_source: str = "goal"
 
     user = models.ForeignKey(User, verbose_name="Автор", on_delete=models.PROTECT)
     text = models.TextField(verbose_name="Текст")
-    goal = models.ForeignKey(Goal, on_delete=models.CASCADE, verbose_name="Цель")
\ No newline at end of file
+    goal = models.ForeignKey(Goal, on_delete=models.CASCADE, verbose_name="Цель")
+    # Maintained by the goals_goalcomment_search_vector trigger, see migration 0019.
+    search_vector = SearchVectorField(verbose_name="Поисковый вектор", null=True, editable=False)
+    # Copy of goal.board, kept in sync by Goal.save when the goal moves to another board.
+    board = models.ForeignKey(Board, verbose_name="Доска", on_delete=models.PROTECT, related_name="comments",
+                              editable=False)
+
+    def save(self, *args, **kwargs):
+
+        board_id: Optional[int] = self.source_board_id(kwargs.get("update_fields"))
+        if board_id is not None:
+            self.board_id = board_id
+            if kwargs.get("update_fields") is not None:
+                kwargs["update_fields"] = {*kwargs["update_fields"], "board"}
+        return super().save(*args, **kwargs)
+
+
+class CascadeDeletion(DatesModelMixin):
+
+    class Meta:
+
+        verbose_name: str = "Каскадное удаление"
+        verbose_name_plural: str = "Каскадные удаления"
+        indexes: List[models.Index] = [
+            models.Index(fields=["id"], condition=~models.Q(stage=3), name="cascade_pending_idx"),
+        ]
+
+    class Stage(models.IntegerChoices):
+
+        categories: Tuple[int, str] = 1, "Категории"
+        goals: Tuple[int, str] = 2, "Цели"
+        finished: Tuple[int, str] = 3, "Завершено"
+
+    # Either a whole board or a single category of it is being deleted.
+    board = models.ForeignKey(Board, verbose_name="Доска", on_delete=models.PROTECT, related_name="cascades")
+    category = models.ForeignKey(GoalCategory, verbose_name="Категория", on_delete=models.PROTECT, null=True,
+                                 related_name="cascades")
+    stage = models.PositiveSmallIntegerField(verbose_name="Этап", choices=Stage.choices, default=Stage.categories)
+    last_id = models.BigIntegerField(verbose_name="Последний обработанный id", default=0)
+    total = models.PositiveIntegerField(verbose_name="Всего строк", default=0)
+    processed = models.PositiveIntegerField(verbose_name="Обработано строк", default=0)
+
+
+# The counters below are maintained by the goals_*_counters triggers (see migration 0015) on every
+# write to goals_goal and goals_goalcomment, and rebuilt by the rebuild_board_stats command.
+
+class BoardGoalCounter(models.Model):
+
+    class Meta:
+
+        verbose_name: str = "Счётчик целей"
+        verbose_name_plural: str = "Счётчики целей"
+        constraints: List[models.BaseConstraint] = [
+            models.UniqueConstraint(fields=["board", "status", "priority"], name="goal_counter_unique"),
+        ]
+
+    board = models.ForeignKey(Board, verbose_name="Доска", on_delete=models.CASCADE, related_name="goal_counters")
+    status = models.PositiveSmallIntegerField(verbose_name="Статус", choices=Goal.Status.choices)
+    priority = models.PositiveSmallIntegerField(verbose_name="Приоритет", choices=Goal.Priority.choices)
+    count = models.IntegerField(verbose_name="Количество", default=0)
+
+
+class BoardDueDateCounter(models.Model):
+    """
+    Open (to do or in progress) goals per due date, so overdue goals are a range sum over due dates.
+    """
+
+    class Meta:
+
+        verbose_name: str = "Счётчик дедлайнов"
+        verbose_name_plural: str = "Счётчики дедлайнов"
+        constraints: List[models.BaseConstraint] = [
+            models.UniqueConstraint(fields=["board", "due_date"], name="due_date_counter_unique"),
+        ]
+
+    board = models.ForeignKey(Board, verbose_name="Доска", on_delete=models.CASCADE,
+                              related_name="due_date_counters")
+    due_date = models.DateField(verbose_name="Дата дедлайна")
+    count = models.IntegerField(verbose_name="Количество", default=0)
+
+
+class BoardCommentCounter(models.Model):
+
+    class Meta:
+
+        verbose_name: str = "Счётчик комментариев"
+        verbose_name_plural: str = "Счётчики комментариев"
+
+    board = models.OneToOneField(Board, verbose_name="Доска", on_delete=models.CASCADE, primary_key=True,
+                                 related_name="comment_counter")
+    count = models.IntegerField(verbose_name="Количество", default=0)
+
+
+class SyncTombstone(models.Model):
+    """
+    Written by the goals_sync_tombstone triggers (see migration 0016) when a row is hard deleted or
+    leaves its board, so the sync feed can report it as removed.
+    """
+
+    class Meta:
+
+        verbose_name: str = "Удалённая запись"
+        verbose_name_plural: str = "Удалённые записи"
+        indexes: List[models.Index] = [
+            models.Index(fields=["board", "deleted"], name="tombstone_board_deleted_idx"),
+        ]
+
+    section = models.CharField(verbose_name="Раздел", max_length=32)
+    object_id = models.BigIntegerField(verbose_name="Id записи")
+    board = models.ForeignKey(Board, verbose_name="Доска", on_delete=models.DO_NOTHING, db_constraint=False,
+                              related_name="+")
+    deleted = models.DateTimeField(verbose_name="Дата удаления", default=timezone.now)
+
+
+# Goals archived (or soft deleted) for longer than GOALS_ARCHIVE_AFTER_DAYS are moved, with their
+# comments, out of goals_goal and goals_goalcomment by the archive_goals command (see goals/archive.py).
+# They keep their ids; the *WithArchived models read the live and the archived rows together.
+
+class GoalArchiveFields(DatesModelMixin):
+
+    class Meta:
+
+        abstract: bool = True
+
+    id = models.BigIntegerField(primary_key=True)
+    user = models.ForeignKey(User, verbose_name="Автор", on_delete=models.PROTECT, related_name="+")
+    category = models.ForeignKey(GoalCategory, on_delete=models.PROTECT, verbose_name="Категория", related_name="+")
+    board = models.ForeignKey(Board, verbose_name="Доска", on_delete=models.PROTECT, related_name="+")
+    title = models.CharField(max_length=256, verbose_name="Название")
+    description = models.TextField(null=True, blank=True, verbose_name="Описание")
+    status = models.PositiveSmallIntegerField(verbose_name="Статус", choices=Goal.Status.choices)
+    priority = models.PositiveSmallIntegerField(verbose_name="Приоритет", choices=Goal.Priority.choices)
+    due_date = models.DateField(verbose_name="Дата дедлайна", null=True)
+    is_deleted = models.BooleanField(verbose_name="Удалена", default=False)
+
+
+class ArchivedGoal(GoalArchiveFields):
+
+    class Meta:
+
+        verbose_name: str = "Архивная цель"
+        verbose_name_plural: str = "Архивные цели"
+        indexes: List[models.Index] = [
+            models.Index(fields=["board", "status"], name="archived_goal_board_idx"),
+        ]
+
+    archived = models.DateTimeField(verbose_name="Дата переноса в архив", default=timezone.now)
+
+
+class GoalWithArchived(GoalArchiveFields):
+    """
+    Live and archived goals (view goals_goal_with_archived), for the ``?include_archived`` read path.
+    """
+
+    class Meta:
+
+        managed: bool = False
+        db_table: str = "goals_goal_with_archived"
+
+    search_vector = SearchVectorField(verbose_name="Поисковый вектор", null=True, editable=False)
+    # null for live goals
+    archived = models.DateTimeField(verbose_name="Дата переноса в архив", null=True)
+
+
+class GoalCommentArchiveFields(DatesModelMixin):
+
+    class Meta:
+
+        abstract: bool = True
+
+    id = models.BigIntegerField(primary_key=True)
+    user = models.ForeignKey(User, verbose_name="Автор", on_delete=models.PROTECT, related_name="+")
+    text = models.TextField(verbose_name="Текст")
+    board = models.ForeignKey(Board, verbose_name="Доска", on_delete=models.PROTECT, related_name="+")
+
+
+class ArchivedGoalComment(GoalCommentArchiveFields):
+
+    class Meta:
+
+        verbose_name: str = "Архивный комментарий"
+        verbose_name_plural: str = "Архивные комментарии"
+
+    goal = models.ForeignKey(ArchivedGoal, on_delete=models.CASCADE, verbose_name="Цель",
+                             related_name="comments")
+    archived = models.DateTimeField(verbose_name="Дата переноса в архив", default=timezone.now)
+
+
+class GoalCommentWithArchived(GoalCommentArchiveFields):
+    """
+    Live and archived comments (view goals_goalcomment_with_archived).
+    """
+
+    class Meta:
+
+        managed: bool = False
+        db_table: str = "goals_goalcomment_with_archived"
+        ordering: List[str] = ["-created"]
+
+    goal = models.ForeignKey(GoalWithArchived, on_delete=models.DO_NOTHING, verbose_name="Цель",
+                             related_name="+")
+    archived = models.DateTimeField(verbose_name="Дата переноса в архив", null=True)
@@ -0,0 +1,231 @@
+import base64
+import binascii
+import datetime
+import json
+from collections import OrderedDict
+from typing import Any, List, Optional, Tuple
+
+from asgiref.sync import sync_to_async
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.db import models
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import LimitOffsetPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+
+def estimate_count(queryset: models.QuerySet) -> int:
+    """
+    Returns the planner's row estimate for the queryset instead of running COUNT(*).
+    """
+    plan: list = json.loads(queryset.explain(format="json"))
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+class KeysetPagination(LimitOffsetPagination):
+    """
+    LimitOffsetPagination with an opt-in keyset mode.
+
+    Passing ``cursor`` (empty for the first page) switches to keyset pagination over the
+    (ordering field, id) pair: each page is fetched with a WHERE on the last seen key instead of an
+    OFFSET, so deep pages cost the same as the first one. ``count=exact|estimate|none`` controls
+    whether the total is counted, estimated from the query plan or skipped. Only keyset pages are
+    capped at ``keyset_max_limit``; offset pages keep LimitOffsetPagination's uncapped ``limit``.
+    """
+
+    cursor_query_param: str = "cursor"
+    count_query_param: str = "count"
+    keyset_default_limit: int = 100
+    keyset_max_limit: int = 1000
+
+    COUNT_EXACT: str = "exact"
+    COUNT_ESTIMATE: str = "estimate"
+    COUNT_NONE: str = "none"
+
+    def paginate_queryset(self, queryset: models.QuerySet, request, view=None) -> Optional[list]:
+
+        page: Optional[models.QuerySet] = self.get_page_queryset(queryset, request)
+        if page is None:
+            return None
+        self.count = self.get_total(queryset)
+        return self.trim_page(list(page))
+
+    async def apaginate_queryset(self, queryset: models.QuerySet, request, view=None) -> Optional[list]:
+        """
+        paginate_queryset for async views, the page and the exact count are read with the async ORM.
+        """
+        page: Optional[models.QuerySet] = self.get_page_queryset(queryset, request)
+        if page is None:
+            return None
+        if self.count_mode == self.COUNT_EXACT:
+            self.count = await queryset.acount()
+        elif self.count_mode == self.COUNT_ESTIMATE:
+            self.count = await sync_to_async(estimate_count)(queryset)
+        else:
+            self.count = None
+        return self.trim_page([row async for row in page])
+
+    def get_page_queryset(self, queryset: models.QuerySet, request) -> Optional[models.QuerySet]:
+        """
+        Returns the queryset of the requested page with one extra row, which tells whether a next page
+        exists, or None when the request is not paginated.
+        """
+        self.request = request
+        self.keyset: bool = self.cursor_query_param in request.query_params
+        self.count_mode: str = self.get_count_mode(request)
+
+        if self.keyset:
+            return self.get_keyset_queryset(queryset, request)
+
+        self.limit = self.get_limit(request)
+        if self.limit is None:
+            return None
+        self.offset = self.get_offset(request)
+        return queryset[self.offset:self.offset + self.limit + 1]
+
+    def get_total(self, queryset: models.QuerySet) -> Optional[int]:
+
+        if self.count_mode == self.COUNT_EXACT:
+            return self.get_count(queryset)
+        if self.count_mode == self.COUNT_ESTIMATE:
+            return estimate_count(queryset)
+        return None
+
+    def trim_page(self, rows: list) -> list:
+
+        self.has_next: bool = len(rows) > self.limit
+        rows = rows[:self.limit]
+        if self.keyset:
+            self.next_cursor: Optional[str] = None
+            if self.has_next:
+                self.next_cursor = self.encode_cursor(self.key_field, rows[-1], self.key_model)
+        elif self.count_mode == self.COUNT_EXACT and self.template is not None and self.count > self.limit:
+            self.display_page_controls = True
+        return rows
+
+    def get_count_mode(self, request) -> str:
+
+        default: str = self.COUNT_NONE if self.keyset else self.COUNT_EXACT
+        mode: str = request.query_params.get(self.count_query_param, default)
+        if mode not in (self.COUNT_EXACT, self.COUNT_ESTIMATE, self.COUNT_NONE):
+            return default
+        return mode
+
+    def get_paginated_response(self, data: list) -> Response:
+
+        if not self.keyset and self.count_mode == self.COUNT_EXACT:
+            return super().get_paginated_response(data)
+
+        response: OrderedDict = OrderedDict()
+        if self.count_mode != self.COUNT_NONE:
+            response["count"] = self.count
+        response["next"] = self.get_next_link()
+        response["previous"] = None if self.keyset else self.get_previous_link()
+        response["results"] = data
+        return Response(response)
+
+    def get_next_link(self) -> Optional[str]:
+
+        if self.keyset:
+            if self.next_cursor is None:
+                return None
+            url: str = self.request.build_absolute_uri()
+            url = replace_query_param(url, self.limit_query_param, self.limit)
+            url = remove_query_param(url, self.offset_query_param)
+            return replace_query_param(url, self.cursor_query_param, self.next_cursor)
+
+        if self.count_mode != self.COUNT_EXACT:
+            if not self.has_next:
+                return None
+            url = self.request.build_absolute_uri()
+            url = replace_query_param(url, self.limit_query_param, self.limit)
+            return replace_query_param(url, self.offset_query_param, self.offset + self.limit)
+
+        return super().get_next_link()
+
+    def get_keyset_queryset(self, queryset: models.QuerySet, request) -> models.QuerySet:
+
+        self.limit = min(self.get_limit(request) or self.keyset_default_limit, self.keyset_max_limit)
+        field_name, descending = self.get_key(queryset)
+        self.key_field: str = field_name
+        self.key_model: models.Model = queryset.model
+        queryset = queryset.order_by(*self.get_key_ordering(field_name, descending))
+
+        cursor: Optional[Tuple[Any, Any]] = self.decode_cursor(request, queryset.model, field_name)
+        if cursor is not None:
+            value, pk = cursor
+            lookup: str = "lt" if descending else "gt"
+            queryset = queryset.filter(
+                models.Q(**{f"{field_name}__{lookup}": value})
+                | models.Q(**{field_name: value, f"pk__{lookup}": pk})
+            )
+        return queryset[:self.limit + 1]
+
+    @staticmethod
+    def get_key(queryset: models.QuerySet) -> Tuple[str, bool]:
+        """
+        Returns the first ordering field of the queryset and its direction; the primary key is used
+        as the tie-breaker, so the pair is unique.
+        """
+        ordering: List[Any] = list(queryset.query.order_by) or list(queryset.model._meta.ordering)
+        for order in ordering:
+            if isinstance(order, str) and order.lstrip("-") not in ("?", ""):
+                name: str = order.lstrip("-")
+                if name in ("pk", queryset.model._meta.pk.name):
+                    name = "pk"
+                return name, order.startswith("-")
+        return "pk", False
+
+    @staticmethod
+    def get_key_ordering(field_name: str, descending: bool) -> List[str]:
+
+        prefix: str = "-" if descending else ""
+        if field_name == "pk":
+            return [f"{prefix}pk"]
+        return [f"{prefix}{field_name}", f"{prefix}pk"]
+
+    def encode_cursor(self, field_name: str, row: Any, model: models.Model) -> str:
+
+        pk: Any = row["id"] if isinstance(row, dict) else row.pk
+        value: Any = pk if field_name == "pk" else self.get_row_value(row, field_name, model)
+        if isinstance(value, (datetime.date, datetime.datetime)):
+            value = value.isoformat()
+        payload: bytes = json.dumps({"f": field_name, "v": value, "id": pk}).encode()
+        return base64.urlsafe_b64encode(payload).decode().rstrip("=")
+
+    def decode_cursor(self, request, model: models.Model, field_name: str) -> Optional[Tuple[Any, Any]]:
+
+        encoded: str = request.query_params.get(self.cursor_query_param, "")
+        if not encoded:
+            return None
+
+        try:
+            payload: dict = json.loads(base64.urlsafe_b64decode(encoded + "=" * (-len(encoded) % 4)))
+            if payload["f"] != field_name:
+                raise ValueError
+            value: Any = payload["v"]
+            if field_name == "pk":
+                value = model._meta.pk.to_python(value)
+            else:
+                try:
+                    value = model._meta.get_field(field_name).to_python(value)
+                except FieldDoesNotExist:
+                    pass
+            pk: Any = model._meta.pk.to_python(payload["id"])
+            # the keyset filter cannot compare with NULL
+            if value is None or pk is None:
+                raise ValueError
+            return value, pk
+        except (TypeError, ValueError, KeyError, binascii.Error, ValidationError):
+            raise NotFound("Invalid cursor")
+
+    @staticmethod
+    def get_row_value(row: Any, field_name: str, model: models.Model) -> Any:
+
+        try:
+            attname: str = model._meta.get_field(field_name).attname
+        except FieldDoesNotExist:
+            attname = field_name
+        if isinstance(row, dict):
+            return row[field_name] if field_name in row else row[attname]
+        return getattr(row, attname)
@@ -1,6 +1,7 @@
 from rest_framework import permissions
 
-from goals.models import BoardParticipant, Board, GoalCategory, Goal, GoalComment
+from goals.models import Board, GoalCategory, Goal, GoalComment
+from goals.roles import get_board_roles
 
 
 class BoardPermissions(permissions.BasePermission):
@@ -11,10 +12,9 @@ class BoardPermissions(permissions.BasePermission):
             return False
 
         if request.method in permissions.SAFE_METHODS:
-            return BoardParticipant.objects.filter(user=request.user, board=obj).exists()
+            return get_board_roles(request).is_participant(obj.id)
 
-        return BoardParticipant.objects.filter(user=request.user, board=obj,
-                                               role=BoardParticipant.Role.owner).exists()
+        return get_board_roles(request).is_owner(obj.id)
 
 
 class CategoryPermissions(permissions.BasePermission):
@@ -25,11 +25,9 @@ class CategoryPermissions(permissions.BasePermission):
             return False
 
         if request.method in permissions.SAFE_METHODS:
-            return BoardParticipant.objects.filter(user=request.user, board=obj.board).exists()
+            return get_board_roles(request).is_participant(obj.board_id)
 
-        else:
-            _user = BoardParticipant.objects.filter(user=request.user, board=obj.board).get()
-            return _user.role in [BoardParticipant.Role.owner, BoardParticipant.Role.writer]
+        return get_board_roles(request).can_write(obj.board_id)
 
 
 class GoalPermissions(permissions.BasePermission):
@@ -40,10 +38,9 @@ class GoalPermissions(permissions.BasePermission):
             return False
 
         if request.method in permissions.SAFE_METHODS:
-            return BoardParticipant.objects.filter(user=request.user, board__categories=obj.category).exists()
+            return get_board_roles(request).is_participant(obj.board_id)
 
-        _user = BoardParticipant.objects.get(user=request.user, board__categories=obj.category)
-        return _user.role in [BoardParticipant.Role.owner, BoardParticipant.Role.writer]
+        return get_board_roles(request).can_write(obj.board_id)
 
 
 class CommentPermissions(permissions.BasePermission):
@@ -54,6 +51,6 @@ class CommentPermissions(permissions.BasePermission):
             return False
 
         if request.method in permissions.SAFE_METHODS:
-            return BoardParticipant.objects.filter(user=request.user, board__category__goal=obj.goal).exists()
+            return get_board_roles(request).is_participant(obj.board_id)
 
         return obj.user == request.user
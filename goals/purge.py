@@ -0,0 +1,99 @@
+import datetime
+from typing import Dict, List, Optional, Tuple
+
+from django.conf import settings
+from django.db import connection, models, transaction
+from django.utils import timezone
+
+from goals.models import (ArchivedGoal, ArchivedGoalComment, Board, BoardCommentCounter, BoardDueDateCounter,
+                          BoardGoalCounter, BoardParticipant, CascadeDeletion, Goal, GoalCategory, GoalComment,
+                          SyncTombstone)
+
+
+PENDING_STAGES: Tuple[int, ...] = (CascadeDeletion.Stage.categories, CascadeDeletion.Stage.goals)
+
+
+def purgeable_boards(before: datetime.datetime) -> models.QuerySet:
+    """
+    Boards deleted before ``before`` whose cascade deletion, if any, has finished.
+    """
+    return Board.objects.filter(is_deleted=True, updated__lt=before).exclude(cascades__stage__in=PENDING_STAGES)
+
+
+def purgeable_categories(before: datetime.datetime) -> models.QuerySet:
+    """
+    Categories deleted before ``before`` (and not still being cascaded), and every category of a purgeable board.
+    """
+    deleted: models.QuerySet = GoalCategory.objects.filter(is_deleted=True, updated__lt=before).exclude(
+        cascades__stage__in=PENDING_STAGES)
+    return GoalCategory.objects.filter(models.Q(id__in=deleted.values("id"))
+                                       | models.Q(board__in=purgeable_boards(before)))
+
+
+def purge_querysets(before: datetime.datetime) -> List[Tuple[str, models.QuerySet]]:
+    """
+    What a purge removes, table by table in dependency order: the rows referencing a table are
+    always gone before its own rows are deleted.
+
+    Sync tombstones go with their boards, and once they are older than any sync token still accepted.
+    """
+    categories: models.QuerySet = purgeable_categories(before)
+    boards: models.QuerySet = purgeable_boards(before)
+    goals: models.QuerySet = Goal.objects.filter(models.Q(is_deleted=True, updated__lt=before)
+                                                 | models.Q(category__in=categories))
+    archived_goals: models.QuerySet = ArchivedGoal.objects.filter(models.Q(is_deleted=True, archived__lt=before)
+                                                                  | models.Q(category__in=categories))
+    expired: datetime.datetime = timezone.now() - datetime.timedelta(
+        seconds=settings.GOALS_SYNC_TOKEN_MAX_AGE + settings.GOALS_SYNC_OVERLAP)
+
+    return [
+        ("comments", GoalComment.objects.filter(goal__in=goals)),
+        ("archived comments", ArchivedGoalComment.objects.filter(goal__in=archived_goals)),
+        ("goals", goals),
+        ("archived goals", archived_goals),
+        ("cascades", CascadeDeletion.objects.filter(models.Q(category__in=categories) | models.Q(board__in=boards))),
+        ("categories", categories),
+        ("participants", BoardParticipant.objects.filter(board__in=boards)),
+        ("goal counters", BoardGoalCounter.objects.filter(board__in=boards)),
+        ("due date counters", BoardDueDateCounter.objects.filter(board__in=boards)),
+        ("comment counters", BoardCommentCounter.objects.filter(board__in=boards)),
+        ("tombstones", SyncTombstone.objects.filter(models.Q(board_id__in=boards) | models.Q(deleted__lt=expired))),
+        ("boards", boards),
+    ]
+
+
+def _delete_rows(cursor, model: type, ids: list) -> Tuple[int, int]:
+
+    table: str = model._meta.db_table
+    cursor.execute(
+        f"WITH deleted AS (DELETE FROM {table} WHERE {model._meta.pk.column} = ANY(%s) "
+        f"RETURNING pg_column_size({table}.*) AS size) SELECT count(*), COALESCE(sum(size), 0) FROM deleted",
+        [ids],
+    )
+    rows, size = cursor.fetchone()
+    return rows, int(size)
+
+
+def purge_batch(before: datetime.datetime, batch_size: int) -> Optional[Tuple[str, int, int]]:
+    """
+    Hard deletes up to ``batch_size`` rows, lowest ids first, of the first table in ``purge_querysets``
+    that still has some, in one short transaction. Returns the table's label, the number of rows
+    and their size in bytes, or None when there is nothing left to purge.
+
+    Rows are deleted with plain SQL: nothing is left to cascade, and the delete triggers still write
+    the counters and the sync tombstones (which a later batch purges with their board).
+    """
+    for name, queryset in purge_querysets(before):
+        with transaction.atomic():
+            ids: list = list(queryset.order_by("pk").values_list("pk", flat=True)[:batch_size])
+            if not ids:
+                continue
+            with connection.cursor() as cursor:
+                rows, size = _delete_rows(cursor, queryset.model, ids)
+        return name, rows, size
+    return None
+
+
+def purge_counts(before: datetime.datetime) -> Dict[str, int]:
+
+    return {name: queryset.count() for name, queryset in purge_querysets(before)}
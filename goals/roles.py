@@ -0,0 +1,113 @@
+from typing import Dict, Iterable, List, Optional
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+from core.models import User
+from goals.models import BoardParticipant
+
+
+WRITE_ROLES = (BoardParticipant.Role.owner, BoardParticipant.Role.writer)
+
+
+def _cache_key(user_id: int) -> str:
+
+    return f"goals:board_roles:{user_id}"
+
+
+class BoardRoles:
+    """
+    All board roles of one user, loaded with a single query on first use.
+    """
+
+    def __init__(self, user: User) -> None:
+
+        self.user: User = user
+        self._roles: Optional[Dict[int, int]] = None
+
+    @property
+    def roles(self) -> Dict[int, int]:
+
+        if self._roles is None:
+            self._roles = self._load()
+        return self._roles
+
+    def _load(self) -> Dict[int, int]:
+
+        if not self.user.is_authenticated:
+            return {}
+
+        roles: Optional[Dict[int, int]] = self._cached()
+        if roles is None:
+            roles = dict(self._queryset())
+            self._store(roles)
+        return roles
+
+    async def aload(self) -> "BoardRoles":
+        """
+        Loads the roles with the async ORM, so the permission checks that follow run without a query.
+        """
+        if self._roles is None:
+            roles: Optional[Dict[int, int]] = self._cached() if self.user.is_authenticated else {}
+            if roles is None:
+                roles = {board_id: role async for board_id, role in self._queryset()}
+                self._store(roles)
+            self._roles = roles
+        return self
+
+    def _queryset(self):
+
+        return BoardParticipant.objects.filter(user=self.user).values_list("board_id", "role")
+
+    def _cached(self) -> Optional[Dict[int, int]]:
+
+        return cache.get(_cache_key(self.user.id)) if settings.BOARD_ROLES_CACHE_TIMEOUT else None
+
+    def _store(self, roles: Dict[int, int]) -> None:
+
+        if settings.BOARD_ROLES_CACHE_TIMEOUT:
+            cache.set(_cache_key(self.user.id), roles, settings.BOARD_ROLES_CACHE_TIMEOUT)
+
+    def role(self, board_id: int) -> Optional[int]:
+
+        return self.roles.get(board_id)
+
+    def board_ids(self) -> Iterable[int]:
+
+        return self.roles.keys()
+
+    def is_participant(self, board_id: int) -> bool:
+
+        return board_id in self.roles
+
+    def is_owner(self, board_id: int) -> bool:
+
+        return self.role(board_id) == BoardParticipant.Role.owner
+
+    def can_write(self, board_id: int) -> bool:
+
+        return self.role(board_id) in WRITE_ROLES
+
+
+def get_board_roles(request) -> BoardRoles:
+    """
+    Returns the BoardRoles of the request user, memoized on the request so that permission classes
+    and serializer validators of one request share a single lookup.
+    """
+    board_roles: Optional[BoardRoles] = getattr(request, "_board_roles", None)
+    if board_roles is None or board_roles.user != request.user:
+        board_roles = BoardRoles(request.user)
+        request._board_roles = board_roles
+    return board_roles
+
+
+def invalidate_board_roles(*user_ids: int) -> None:
+    """
+    Drops the cached roles of the users once the current transaction commits; deleting them earlier
+    would let a concurrent request cache the old roles again for the whole timeout.
+    """
+    if not settings.BOARD_ROLES_CACHE_TIMEOUT:
+        return
+    keys: List[str] = [_cache_key(user_id) for user_id in user_ids]
+    transaction.on_commit(lambda: cache.delete_many(keys))
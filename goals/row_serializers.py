@@ -0,0 +1,171 @@
+import datetime
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Type
+
+from django.core.exceptions import ImproperlyConfigured
+from django.db import models
+from django.utils import timezone
+from rest_framework import ISO_8601, serializers
+from rest_framework.settings import api_settings
+
+from goals.serializers import GoalActivitySerializer, GoalCategorySerializer, GoalCommentSerializer, GoalSerializer
+
+
+Converter = Optional[Callable[[Any], Any]]
+
+# Fields whose to_representation returns the database value unchanged.
+PLAIN_FIELDS: Tuple[Type[serializers.Field], ...] = (
+    serializers.BooleanField,
+    serializers.CharField,
+    serializers.ChoiceField,
+    serializers.IntegerField,
+    serializers.PrimaryKeyRelatedField,
+    serializers.ReadOnlyField,
+)
+
+
+def datetime_to_representation(value: datetime.datetime) -> str:
+
+    value = value.astimezone(timezone.get_current_timezone())
+    result: str = value.isoformat()
+    if result.endswith("+00:00"):
+        result = result[:-6] + "Z"
+    return result
+
+
+def date_to_representation(value: datetime.date) -> str:
+
+    return value.isoformat()
+
+
+def get_converter(field: serializers.Field) -> Converter:
+
+    if isinstance(field, serializers.DateTimeField):
+        if getattr(field, "format", api_settings.DATETIME_FORMAT) != ISO_8601:
+            raise ImproperlyConfigured(f"{field.field_name}: only ISO 8601 datetimes are supported")
+        return datetime_to_representation
+    if isinstance(field, serializers.DateField):
+        if getattr(field, "format", api_settings.DATE_FORMAT) != ISO_8601:
+            raise ImproperlyConfigured(f"{field.field_name}: only ISO 8601 dates are supported")
+        return date_to_representation
+    if isinstance(field, PLAIN_FIELDS):
+        return None
+    raise ImproperlyConfigured(f"{field.field_name}: {type(field).__name__} is not supported")
+
+
+class RowSerializer:
+    """
+    Read-only twin of a ModelSerializer that builds its output straight from ``.values()`` rows.
+
+    The field order, sources and value conversions are read once from the serializer's fields, so a
+    row is turned into the same dict the serializer would render, without instantiating a model or
+    running DRF field machinery per value. Nested serializers (``user``) are flattened into ``__``
+    lookups and rebuilt as nested dicts, or, when listed in ``sideload``, replaced by their ``<name>_id``
+    so the related objects can be sent once per page by ``load_sideloads``.
+    """
+
+    serializer_class: Type[serializers.ModelSerializer]
+
+    def __init__(self, sideload: Tuple[str, ...] = ()) -> None:
+
+        self.plan: List[Tuple[str, Any]] = []
+        self.columns: List[str] = []
+        self.sideloads: Dict[str, Tuple[str, Type[RowSerializer]]] = {}
+        for name, field in self.serializer_class().fields.items():
+            if field.write_only:
+                continue
+            if isinstance(field, serializers.Serializer) and name in sideload:
+                column: str = f"{field.source}_id"
+                self.plan.append((column, (column, None)))
+                self.columns.append(column)
+                self.sideloads[name] = column, type(f"{type(field).__name__}Rows", (RowSerializer,),
+                                                    {"serializer_class": type(field)})
+            elif isinstance(field, serializers.Serializer):
+                nested: List[Tuple[str, str, Converter]] = []
+                for sub_name, sub_field in field.fields.items():
+                    if sub_field.write_only:
+                        continue
+                    column = f"{field.source}__{sub_field.source}"
+                    nested.append((sub_name, column, get_converter(sub_field)))
+                    self.columns.append(column)
+                self.plan.append((name, nested))
+            else:
+                self.plan.append((name, (field.source, get_converter(field))))
+                self.columns.append(field.source)
+
+    def values(self, queryset: models.QuerySet) -> models.QuerySet:
+        """
+        Selects the serializer's columns only; annotations added for filtering or ordering, such as the
+        search rank, stay in the WHERE and ORDER BY clauses.
+        """
+        return queryset.values(*self.columns)
+
+    def to_representation(self, row: Dict[str, Any]) -> dict:
+
+        data: dict = {}
+        for name, spec in self.plan:
+            if isinstance(spec, list):
+                data[name] = {
+                    sub_name: row[column] if convert is None or row[column] is None else convert(row[column])
+                    for sub_name, column, convert in spec
+                }
+            else:
+                column, convert = spec
+                value: Any = row[column]
+                data[name] = value if convert is None or value is None else convert(value)
+        return data
+
+    def serialize(self, rows: List[Dict[str, Any]]) -> List[dict]:
+
+        return [self.to_representation(row) for row in rows]
+
+    def load_sideloads(self, data: List[dict]) -> Dict[str, Dict[int, dict]]:
+        """
+        Returns the sideloaded objects referenced by the serialized rows by field name, one query per
+        relation, each keyed by id.
+        """
+        return {
+            name: {row["id"]: row_serializer.to_representation(row) for row in rows}
+            for name, row_serializer, rows in self.sideload_querysets(data)
+        }
+
+    async def aload_sideloads(self, data: List[dict]) -> Dict[str, Dict[int, dict]]:
+
+        loaded: Dict[str, Dict[int, dict]] = {}
+        for name, row_serializer, rows in self.sideload_querysets(data):
+            loaded[name] = {row["id"]: row_serializer.to_representation(row) async for row in rows}
+        return loaded
+
+    def sideload_querysets(self, data: List[dict]) -> Iterator[Tuple[str, "RowSerializer", models.QuerySet]]:
+
+        for name, (column, row_serializer_class) in self.sideloads.items():
+            model: Type[models.Model] = row_serializer_class.serializer_class.Meta.model
+            ids: set = {item[column] for item in data if item[column] is not None}
+            row_serializer: RowSerializer = get_row_serializer(row_serializer_class)
+            yield name, row_serializer, row_serializer.values(model.objects.filter(pk__in=ids).order_by("pk"))
+
+
+class GoalRowSerializer(RowSerializer):
+
+    serializer_class = GoalSerializer
+
+
+class GoalActivityRowSerializer(RowSerializer):
+
+    serializer_class = GoalActivitySerializer
+
+
+class GoalCategoryRowSerializer(RowSerializer):
+
+    serializer_class = GoalCategorySerializer
+
+
+class GoalCommentRowSerializer(RowSerializer):
+
+    serializer_class = GoalCommentSerializer
+
+
+@lru_cache(maxsize=None)
+def get_row_serializer(row_serializer_class: Type[RowSerializer], sideload: Tuple[str, ...] = ()) -> RowSerializer:
+
+    return row_serializer_class(sideload)
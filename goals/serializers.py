@@ -1,11 +1,15 @@
-from typing import Tuple
+from typing import Dict, List, Optional, Tuple
 
 from rest_framework import serializers, exceptions
 from django.db import models, transaction
+from django.utils import timezone
 
 from core.models import User
 from core.serializers import UserSerializer
-from goals.models import GoalCategory, Goal, GoalComment, Board, BoardParticipant
+from goals.models import GoalCategory, Goal, GoalComment, Board, BoardParticipant, CascadeDeletion
+from goals import events
+from goals.cache import bump_board_generation
+from goals.roles import get_board_roles, invalidate_board_roles
 
 
 class GoalCategoryCreateSerializer(serializers.ModelSerializer):
@@ -23,13 +27,7 @@ class GoalCategoryCreateSerializer(serializers.ModelSerializer):
         if value.is_deleted:
             raise serializers.ValidationError("not allowed in deleted board")
 
-        try:
-            _user: BoardParticipant = BoardParticipant.objects.get(user=self.context["request"].user, board=value.id)
-
-        except BoardParticipant.DoesNotExist:
-            raise serializers.ValidationError("only users with the owner or writers role can create categories")
-
-        if _user.role not in [BoardParticipant.Role.owner, BoardParticipant.Role.writer]:
+        if not get_board_roles(self.context["request"]).can_write(value.id):
             raise serializers.ValidationError("only users with the owner or writers role can create categories")
 
         return value
@@ -54,27 +52,31 @@ class GoalCreateSerializer(serializers.ModelSerializer):
 
         model: models.Model = Goal
         read_only_fields: Tuple[str, ...] = ("id", "created", "updated", "user")
-        fields: str = "__all__"
+        exclude: Tuple[str, ...] = ("search_vector", "board")
 
     def validate_category(self, value: GoalCategory) -> GoalCategory:
 
         if value.is_deleted:
             raise serializers.ValidationError("not allowed in deleted category")
 
-        try:
-            _user: BoardParticipant = BoardParticipant.objects.get(user=self.context["request"].user, board=value.board)
-
-        except BoardParticipant.DoesNotExist:
-            raise exceptions.PermissionDenied("The user can create goals only in those categories in which "
-                                              "he is a member of the boards with the role of Owner or Editor")
-
-        if _user.role not in [BoardParticipant.Role.owner, BoardParticipant.Role.writer]:
+        if not get_board_roles(self.context["request"]).can_write(value.board_id):
             raise exceptions.PermissionDenied("The user can create goals only in those categories in which "
                                               "he is a member of the boards with the role of Owner or Editor")
 
         return value
 
 
+class GoalImportSerializer(serializers.ModelSerializer):
+    """
+    One row of a goal import; the category, author and dates are set by the importer.
+    """
+
+    class Meta:
+
+        model: models.Model = Goal
+        fields: Tuple[str, ...] = ("title", "description", "status", "priority", "due_date")
+
+
 class GoalSerializer(serializers.ModelSerializer):
 
     user = UserSerializer(read_only=True)
@@ -82,10 +84,158 @@ class GoalSerializer(serializers.ModelSerializer):
     class Meta:
 
         model: models.Model = Goal
-        fields: str = "__all__"
+        exclude: Tuple[str, ...] = ("search_vector", "board")
         read_only_fields: Tuple[str, ...] = ("id", "created", "updated", "user")
 
 
+class GoalActivitySerializer(GoalSerializer):
+    """
+    Goal with its comment activity, for querysets annotated by ``stats.with_comment_activity``.
+    """
+
+    comments_count = serializers.IntegerField(read_only=True)
+    last_comment_at = serializers.DateTimeField(read_only=True)
+
+
+class BoardSnapshotGoalSerializer(GoalSerializer):
+
+    comments_count = serializers.IntegerField(read_only=True)
+
+
+class PrefetchedPrimaryKeyRelatedField(serializers.PrimaryKeyRelatedField):
+    """
+    Resolves the pk from the objects a bulk list serializer loaded in one query, falls back to a
+    regular lookup otherwise.
+    """
+
+    def to_internal_value(self, data):
+
+        prefetched: Optional[dict] = self.context.get("prefetched", {}).get(self.get_queryset().model)
+        if prefetched is not None:
+            try:
+                return prefetched[int(data)]
+            except (KeyError, TypeError, ValueError):
+                pass
+        return super().to_internal_value(data)
+
+
+def prefetch_categories(context: dict, items: list) -> None:
+
+    ids: set = {item.get("category") for item in items if isinstance(item, dict)}
+    ids = {pk for pk in ids if isinstance(pk, int) or (isinstance(pk, str) and pk.isdigit())}
+    context.setdefault("prefetched", {})[GoalCategory] = GoalCategory.objects.in_bulk(ids)
+
+
+class GoalBulkCreateListSerializer(serializers.ListSerializer):
+
+    def to_internal_value(self, data: list) -> list:
+
+        if isinstance(data, list):
+            prefetch_categories(self.context, data)
+        return super().to_internal_value(data)
+
+    def create(self, validated_data: List[dict]) -> List[Goal]:
+
+        now = timezone.now()
+        goals: List[Goal] = [
+            Goal(**item, board_id=item["category"].board_id, created=now, updated=now) for item in validated_data
+        ]
+        with transaction.atomic():
+            goals = Goal.objects.bulk_create(goals)
+            bump_board_generation(*{goal.board_id for goal in goals})
+            events.board_changed(*{goal.board_id for goal in goals})
+        return goals
+
+
+class GoalBulkCreateSerializer(GoalCreateSerializer):
+
+    category = PrefetchedPrimaryKeyRelatedField(queryset=GoalCategory.objects.all())
+
+    class Meta(GoalCreateSerializer.Meta):
+
+        list_serializer_class = GoalBulkCreateListSerializer
+
+
+class GoalBulkUpdateListSerializer(serializers.ListSerializer):
+
+    def to_internal_value(self, data: list) -> list:
+
+        if isinstance(data, list):
+            prefetch_categories(self.context, data)
+            ids: set = {item.get("id") for item in data if isinstance(item, dict)}
+            ids = {pk for pk in ids if isinstance(pk, int) or (isinstance(pk, str) and pk.isdigit())}
+            self.context["prefetched"][Goal] = self.instance.filter(id__in=ids).in_bulk()
+        return super().to_internal_value(data)
+
+    def update(self, instance: models.QuerySet, validated_data: List[dict]) -> List[Goal]:
+
+        now = timezone.now()
+        goals: Dict[int, Goal] = {}
+        fields: set = {"updated"}
+        moved: Dict[int, List[int]] = {}
+        boards: set = set()
+
+        for item in validated_data:
+            goal: Goal = item.pop("goal")
+            for field, value in item.items():
+                setattr(goal, field, value)
+                fields.add(field)
+            boards.add(goal.board_id)
+            if "category" in item and goal.board_id != item["category"].board_id:
+                goal.board_id = item["category"].board_id
+                boards.add(goal.board_id)
+                fields.add("board")
+                moved.setdefault(goal.board_id, []).append(goal.id)
+            goal.updated = now
+            goals[goal.id] = goal
+
+        fields.discard("id")
+        with transaction.atomic():
+            Goal.objects.bulk_update(goals.values(), fields)
+            for board_id, goal_ids in moved.items():
+                GoalComment.objects.filter(goal_id__in=goal_ids).update(board_id=board_id, updated=now)
+            bump_board_generation(*boards)
+            events.board_changed(*boards)
+        return list(goals.values())
+
+
+class GoalBulkUpdateSerializer(serializers.Serializer):
+
+    id = serializers.IntegerField()
+    status = serializers.ChoiceField(choices=Goal.Status.choices, required=False)
+    priority = serializers.ChoiceField(choices=Goal.Priority.choices, required=False)
+    category = PrefetchedPrimaryKeyRelatedField(queryset=GoalCategory.objects.all(), required=False)
+    due_date = serializers.DateField(required=False, allow_null=True)
+
+    class Meta:
+
+        list_serializer_class = GoalBulkUpdateListSerializer
+
+    def validate_category(self, value: GoalCategory) -> GoalCategory:
+
+        if value.is_deleted:
+            raise serializers.ValidationError("not allowed in deleted category")
+
+        if not get_board_roles(self.context["request"]).can_write(value.board_id):
+            raise exceptions.PermissionDenied("The user can move goals only to those categories in which "
+                                              "he is a member of the boards with the role of Owner or Editor")
+
+        return value
+
+    def validate(self, attrs: dict) -> dict:
+
+        goal: Optional[Goal] = self.context["prefetched"][Goal].get(attrs["id"])
+        if goal is None:
+            raise serializers.ValidationError({"id": "goal not found"})
+
+        if not get_board_roles(self.context["request"]).can_write(goal.board_id):
+            raise exceptions.PermissionDenied("The user can edit goals only on those boards in which "
+                                              "he is a member with the role of Owner or Editor")
+
+        attrs["goal"] = goal
+        return attrs
+
+
 class GoalCommentCreateSerializer(serializers.ModelSerializer):
 
     user = serializers.HiddenField(default=serializers.CurrentUserDefault())
@@ -94,20 +244,14 @@ class GoalCommentCreateSerializer(serializers.ModelSerializer):
 
         model: models.Model = GoalComment
         read_only_fields: Tuple[str, ...] = ("id", "created", "updated", "user")
-        fields: str = "__all__"
+        exclude: Tuple[str, ...] = ("search_vector", "board")
 
     def validate_goal(self, value: Goal) -> Goal:
 
         if value.is_deleted:
             raise serializers.ValidationError("not allowed in deleted goal")
 
-        try:
-            _user = BoardParticipant.objects.get(user=self.context["request"].user, board__categories=value.category)
-        except BoardParticipant.DoesNotExist:
-            raise serializers.ValidationError("The user can create comments only for those goals in which "
-                                              "he is a member of the boards with the role of Owner or Editor")
-
-        if _user.role not in [BoardParticipant.Role.owner, BoardParticipant.Role.writer]:
+        if not get_board_roles(self.context["request"]).can_write(value.board_id):
             raise serializers.ValidationError("The user can create comments only for those goals in which "
                                               "he is a member of the boards with the role of Owner or Editor")
 
@@ -121,7 +265,7 @@ class GoalCommentSerializer(serializers.ModelSerializer):
     class Meta:
 
         model: models.Model = GoalComment
-        fields: str = "__all__"
+        exclude: Tuple[str, ...] = ("search_vector", "board")
         read_only_fields: Tuple[str, ...] = ("id", "created", "updated", "user")
 
 
@@ -143,16 +287,78 @@ class BoardCreateSerializer(serializers.ModelSerializer):
         return board
 
 
+class PrefetchedSlugRelatedField(serializers.SlugRelatedField):
+    """
+    Resolves the slug from the objects a bulk list serializer loaded in one query.
+    """
+
+    def to_internal_value(self, data):
+
+        prefetched: Optional[dict] = self.context.get("prefetched", {}).get(self.get_queryset().model)
+        if prefetched is not None and data in prefetched:
+            return prefetched[data]
+        return super().to_internal_value(data)
+
+
+class BoardParticipantListSerializer(serializers.ListSerializer):
+
+    def to_internal_value(self, data: list) -> list:
+
+        if isinstance(data, list):
+            usernames: set = {item.get("user") for item in data if isinstance(item, dict)}
+            self.context.setdefault("prefetched", {})[User] = User.objects.in_bulk(
+                {name for name in usernames if isinstance(name, str)}, field_name="username")
+        return super().to_internal_value(data)
+
+
 class BoardParticipantSerializer(serializers.ModelSerializer):
 
     role = serializers.ChoiceField(required=True, choices=BoardParticipant.Role)
-    user = serializers.SlugRelatedField(slug_field="username", queryset=User.objects.all())
+    user = PrefetchedSlugRelatedField(slug_field="username", queryset=User.objects.all())
 
     class Meta:
 
         model: models.Model = BoardParticipant
         fields: str = "__all__"
         read_only_fields: Tuple[str, ...] = ("id", "created", "updated", "board")
+        list_serializer_class = BoardParticipantListSerializer
+
+
+def sync_participants(board: Board, owner: User, participants: List[dict], remove_missing: bool = True) -> None:
+    """
+    Applies the participants list to the board with one bulk_create, one bulk_update and one
+    filtered delete. The owner's own membership is never touched.
+    """
+    now = timezone.now()
+    wanted: Dict[int, dict] = {part["user"].id: part for part in participants if part["user"].id != owner.id}
+    existing: Dict[int, BoardParticipant] = {
+        participant.user_id: participant for participant in board.participants.exclude(user=owner)
+    }
+
+    removed: List[int] = [user_id for user_id in existing if user_id not in wanted] if remove_missing else []
+    changed: List[BoardParticipant] = []
+    for user_id, part in wanted.items():
+        participant: Optional[BoardParticipant] = existing.get(user_id)
+        if participant is not None and participant.role != part["role"]:
+            participant.role = part["role"]
+            participant.updated = now
+            changed.append(participant)
+    added: List[BoardParticipant] = [
+        BoardParticipant(board=board, user=part["user"], role=part["role"], created=now, updated=now)
+        for user_id, part in wanted.items() if user_id not in existing
+    ]
+
+    with transaction.atomic():
+        if removed:
+            BoardParticipant.objects.filter(board=board, user_id__in=removed).delete()
+        if changed:
+            BoardParticipant.objects.bulk_update(changed, ["role", "updated"])
+        if added:
+            BoardParticipant.objects.bulk_create(added)
+
+    invalidate_board_roles(*[participant.user_id for participant in changed + added])
+    bump_board_generation(board.id)
+    events.board_changed(board.id)
 
 
 class BoardSerializer(serializers.ModelSerializer):
@@ -168,28 +374,25 @@ class BoardSerializer(serializers.ModelSerializer):
 
     def update(self, instance: Board, validated_data: dict) -> Board:
 
-        owner: User = validated_data.pop("user")
-        new_participants: list = validated_data.pop("participants")
-        new_by_id: dict = {part["user"].id: part for part in new_participants}
-
-        old_participants: list = instance.participants.exclude(user=owner)
+        # HiddenField defaults are skipped on partial updates
+        owner: User = validated_data.pop("user", self.context["request"].user)
         with transaction.atomic():
-            for old_participant in old_participants:
-                if old_participant.user_id not in new_by_id:
-                    old_participant.delete()
-                else:
-                    if old_participant.role != new_by_id[old_participant.user_id]["role"]:
-                        old_participant.role = new_by_id[old_participant.user_id]["role"]
-                        old_participant.save()
-                    new_by_id.pop(old_participant.user_id)
-            for new_part in new_by_id.values():
-                BoardParticipant.objects.create(board=instance, user=new_part["user"], role=new_part["role"])
-
-            instance.title = validated_data["title"]
+            if "participants" in validated_data:
+                sync_participants(instance, owner, validated_data.pop("participants"))
+
+            if "title" in validated_data:
+                instance.title = validated_data["title"]
             instance.save()
 
         return instance
 
+    def to_representation(self, instance: Board) -> dict:
+
+        if "participants" not in getattr(instance, "_prefetched_objects_cache", {}):
+            models.prefetch_related_objects([instance], models.Prefetch(
+                "participants", queryset=BoardParticipant.objects.select_related("user")))
+        return super().to_representation(instance)
+
 
 class BoardListSerializer(serializers.ModelSerializer):
 
@@ -197,3 +400,12 @@ class BoardListSerializer(serializers.ModelSerializer):
 
         model: models.Model = Board
         fields: str = "__all__"
+
+
+class CascadeDeletionSerializer(serializers.ModelSerializer):
+
+    class Meta:
+
+        model: models.Model = CascadeDeletion
+        fields: Tuple[str, ...] = ("id", "created", "updated", "board", "category", "stage", "total", "processed")
+        read_only_fields: Tuple[str, ...] = fields
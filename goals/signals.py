@@ -0,0 +1,74 @@
+from typing import Optional
+
+from django.conf import settings
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from core.models import User
+from core.serializers import UserSerializer
+from goals import events
+from goals.cache import bump_board_generation
+from goals.models import Board, BoardParticipant, Goal, GoalCategory, GoalComment
+from goals.roles import invalidate_board_roles
+
+
+@receiver([post_save, post_delete], sender=BoardParticipant)
+def reset_board_roles(sender, instance: BoardParticipant, **kwargs) -> None:
+
+    invalidate_board_roles(instance.user_id)
+
+
+@receiver([post_save, post_delete], sender=Board)
+def reset_board_responses(sender, instance: Board, **kwargs) -> None:
+
+    bump_board_generation(instance.id)
+
+
+@receiver([post_save, post_delete], sender=Goal)
+@receiver([post_save, post_delete], sender=GoalCategory)
+@receiver([post_save, post_delete], sender=GoalComment)
+@receiver([post_save, post_delete], sender=BoardParticipant)
+def reset_board_content_responses(sender, instance, **kwargs) -> None:
+
+    bump_board_generation(instance.board_id, getattr(instance, "previous_board_id", None))
+
+
+@receiver(post_save, sender=User)
+def reset_author_responses(sender, instance: User, created: bool, update_fields: Optional[frozenset] = None,
+                           **kwargs) -> None:
+
+    # lists nest their authors; last_login and password updates do not show up in them
+    if not settings.GOALS_RESPONSE_CACHE or created or \
+            update_fields is not None and not set(update_fields) & set(UserSerializer.Meta.fields):
+        return
+    boards = BoardParticipant.objects.filter(user=instance).values("board_id").union(
+        *[model.objects.filter(user=instance).values("board_id") for model in (GoalCategory, Goal, GoalComment)])
+    bump_board_generation(*[row["board_id"] for row in boards])
+
+
+EVENT_TYPES: dict = {Goal: "goal", GoalCategory: "category", GoalComment: "comment", BoardParticipant: "participant"}
+
+
+@receiver(post_save, sender=Board)
+def publish_board_saved(sender, instance: Board, **kwargs) -> None:
+
+    events.publish("board", "deleted" if instance.is_deleted else "saved", instance.id, instance.id)
+
+
+@receiver(post_save, sender=Goal)
+@receiver(post_save, sender=GoalCategory)
+@receiver(post_save, sender=GoalComment)
+@receiver(post_save, sender=BoardParticipant)
+def publish_saved(sender, instance, **kwargs) -> None:
+
+    events.publish(EVENT_TYPES[sender], "saved", instance.id, instance.board_id)
+    events.publish(EVENT_TYPES[sender], "deleted", instance.id, getattr(instance, "previous_board_id", None))
+
+
+@receiver(post_delete, sender=Goal)
+@receiver(post_delete, sender=GoalCategory)
+@receiver(post_delete, sender=GoalComment)
+@receiver(post_delete, sender=BoardParticipant)
+def publish_deleted(sender, instance, **kwargs) -> None:
+
+    events.publish(EVENT_TYPES[sender], "deleted", instance.id, instance.board_id)
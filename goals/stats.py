@@ -0,0 +1,98 @@
+from typing import Dict, Iterable, List, Optional
+
+from django.db import connection, models, transaction
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from goals.models import (BoardCommentCounter, BoardDueDateCounter, BoardGoalCounter, Goal, GoalComment,
+                          GoalCommentWithArchived, GoalWithArchived)
+
+
+def empty_stats(board_id: int) -> dict:
+
+    return {
+        "board": board_id,
+        "total": 0,
+        "by_status": {status.name: 0 for status in Goal.Status},
+        "by_priority": {priority.name: 0 for priority in Goal.Priority},
+        "overdue": 0,
+        "comments": 0,
+    }
+
+
+def board_stats(board_ids: Iterable[int]) -> Dict[int, dict]:
+    """
+    Reads the goal and comment statistics of the boards from the maintained counters, with three
+    queries whatever the number of goals. Overdue goals are open goals due before today.
+    """
+    board_ids = list(board_ids)
+    stats: Dict[int, dict] = {board_id: empty_stats(board_id) for board_id in board_ids}
+
+    for board_id, status, priority, count in BoardGoalCounter.objects.filter(
+            board_id__in=board_ids, count__gt=0).values_list("board_id", "status", "priority", "count"):
+        board: dict = stats[board_id]
+        board["total"] += count
+        board["by_status"][Goal.Status(status).name] += count
+        board["by_priority"][Goal.Priority(priority).name] += count
+
+    for board_id, overdue in BoardDueDateCounter.objects.filter(
+            board_id__in=board_ids, due_date__lt=timezone.localdate()).order_by().values("board_id").annotate(
+            overdue=models.Sum("count")).values_list("board_id", "overdue"):
+        stats[board_id]["overdue"] = overdue
+
+    for board_id, count in BoardCommentCounter.objects.filter(board_id__in=board_ids).values_list(
+            "board_id", "count"):
+        stats[board_id]["comments"] = count
+
+    return stats
+
+
+def with_comment_activity(goals: models.QuerySet) -> models.QuerySet:
+    """
+    Annotates the goals with ``comments_count`` and ``last_comment_at``: two correlated subqueries,
+    each answered from the (goal, -created) comment index, so a page of goals still costs one query.
+    Goals read with their archive (GoalWithArchived) count their archived comments too.
+    """
+    comment_model: type = GoalCommentWithArchived if goals.model is GoalWithArchived else GoalComment
+    comments: models.QuerySet = comment_model.objects.filter(goal=models.OuterRef("pk")).order_by().values("goal")
+    return goals.annotate(
+        comments_count=Coalesce(models.Subquery(
+            comments.annotate(count=models.Count("id")).values("count"), output_field=models.IntegerField(),
+        ), 0),
+        last_comment_at=models.Subquery(comments.annotate(last=models.Max("created")).values("last")),
+    )
+
+
+def rebuild_board_stats(board_ids: Optional[List[int]] = None) -> None:
+    """
+    Recomputes the counters of the given boards (all boards by default) from the goals and comments.
+    Writers of those tables wait for the rebuild, so the counters they update are never double counted.
+    """
+    goals: models.QuerySet = Goal.objects.filter(is_deleted=False).order_by()
+    comments: models.QuerySet = GoalComment.objects.order_by()
+    counters: List[models.QuerySet] = [
+        BoardGoalCounter.objects.all(), BoardDueDateCounter.objects.all(), BoardCommentCounter.objects.all(),
+    ]
+    if board_ids is not None:
+        goals = goals.filter(board_id__in=board_ids)
+        comments = comments.filter(board_id__in=board_ids)
+        counters = [queryset.filter(board_id__in=board_ids) for queryset in counters]
+
+    with transaction.atomic():
+        with connection.cursor() as cursor:
+            cursor.execute(f"LOCK TABLE {Goal._meta.db_table}, {GoalComment._meta.db_table} IN SHARE MODE")
+        for queryset in counters:
+            queryset.delete()
+
+        BoardGoalCounter.objects.bulk_create(
+            BoardGoalCounter(**row) for row in goals.values("board_id", "status", "priority").annotate(
+                count=models.Count("id"))
+        )
+        BoardDueDateCounter.objects.bulk_create(
+            BoardDueDateCounter(**row) for row in goals.filter(
+                due_date__isnull=False, status__in=[Goal.Status.to_do, Goal.Status.in_progress]).values(
+                "board_id", "due_date").annotate(count=models.Count("id"))
+        )
+        BoardCommentCounter.objects.bulk_create(
+            BoardCommentCounter(**row) for row in comments.values("board_id").annotate(count=models.Count("id"))
+        )
@@ -0,0 +1,103 @@
+import datetime
+from typing import Dict, List, Optional, Set, Tuple, Type
+
+from django.conf import settings
+from django.core import signing
+from django.db import models
+from django.utils import timezone
+from rest_framework.exceptions import ValidationError
+
+from core.models import User
+from goals.models import Board, BoardParticipant, Goal, GoalCategory, GoalComment, SyncTombstone
+from goals.row_serializers import (GoalCategoryRowSerializer, GoalCommentRowSerializer, GoalRowSerializer,
+                                   RowSerializer, get_row_serializer)
+from goals.serializers import BoardListSerializer, BoardParticipantSerializer
+
+
+SALT: str = "goals.sync"
+
+# section: model, row serializer (None for ModelSerializer sections), rows reported as removed
+SECTIONS: Dict[str, Tuple[Type[models.Model], Optional[Type[RowSerializer]], Optional[models.Q]]] = {
+    "categories": (GoalCategory, GoalCategoryRowSerializer, models.Q(is_deleted=True)),
+    "goals": (Goal, GoalRowSerializer, models.Q(is_deleted=True) | models.Q(status=Goal.Status.archived)),
+    "comments": (GoalComment, GoalCommentRowSerializer, None),
+    "participants": (BoardParticipant, None, None),
+}
+
+
+def make_token(user: User, started: datetime.datetime, board_ids: Set[int]) -> str:
+
+    return signing.dumps({"u": user.id, "t": started.timestamp(), "b": sorted(board_ids)}, salt=SALT)
+
+
+def read_token(user: User, token: str) -> Tuple[datetime.datetime, Set[int]]:
+
+    try:
+        payload: dict = signing.loads(token, salt=SALT, max_age=settings.GOALS_SYNC_TOKEN_MAX_AGE)
+    except signing.BadSignature:
+        raise ValidationError({"token": ["Invalid or expired sync token, sync from scratch"]})
+    if payload["u"] != user.id:
+        raise ValidationError({"token": ["Invalid or expired sync token, sync from scratch"]})
+    return datetime.datetime.fromtimestamp(payload["t"], tz=datetime.timezone.utc), set(payload["b"])
+
+
+def serialize(model: Type[models.Model], row_serializer_class: Optional[Type[RowSerializer]],
+              queryset: models.QuerySet) -> List[dict]:
+
+    if row_serializer_class is not None:
+        row_serializer: RowSerializer = get_row_serializer(row_serializer_class)
+        return row_serializer.serialize(row_serializer.values(queryset.order_by("id")))
+    return BoardParticipantSerializer(queryset.select_related("user").order_by("id"), many=True).data
+
+
+def build_changes(user: User, token: Optional[str]) -> dict:
+    """
+    Returns the rows of the user's boards changed since the token was issued, plus a new token.
+
+    Rows that became invisible (soft deleted, archived, hard deleted, moved away, or on a board the
+    user lost) are listed under ``removed``; clients apply removals before upserts. Without a token every
+    visible row is returned. The token window reaches GOALS_SYNC_OVERLAP seconds back, so a row committed
+    late by a long transaction is still seen; clients may receive a row twice and must upsert.
+    """
+    started: datetime.datetime = timezone.now()
+    boards: Dict[int, Board] = {board.id: board for board in Board.objects.filter(
+        participants__user=user, is_deleted=False)}
+    since: Optional[datetime.datetime] = None
+    known: Set[int] = set()
+    if token:
+        since, known = read_token(user, token)
+        since -= datetime.timedelta(seconds=settings.GOALS_SYNC_OVERLAP)
+
+    # Boards the client already has only need their changes, new boards are sent in full.
+    synced: Set[int] = known & set(boards)
+    changed: models.Q = models.Q(board_id__in=synced, updated__gt=since) if since else models.Q(pk__in=[])
+    fresh: models.Q = models.Q(board_id__in=set(boards) - synced)
+
+    data: dict = {
+        "boards": {
+            "upserted": BoardListSerializer(sorted(
+                (board for board in boards.values() if board.id not in synced or since < board.updated),
+                key=lambda board: board.id), many=True).data,
+            "removed": sorted(known - set(boards)),
+        },
+    }
+    tombstones: Dict[str, Set[int]] = {}
+    if since:
+        for section, object_id in SyncTombstone.objects.filter(board_id__in=synced, deleted__gt=since).values_list(
+                "section", "object_id"):
+            tombstones.setdefault(section, set()).add(object_id)
+
+    for section, (model, row_serializer_class, removed_when) in SECTIONS.items():
+        queryset: models.QuerySet = model.objects.filter(changed | fresh)
+        removed: Set[int] = tombstones.get(section, set())
+        if removed_when is not None:
+            removed |= set(model.objects.filter(changed).filter(removed_when).values_list("id", flat=True))
+            queryset = queryset.exclude(removed_when)
+        upserted: List[dict] = serialize(model, row_serializer_class, queryset)
+        data[section] = {
+            "upserted": upserted,
+            "removed": sorted(removed - {row["id"] for row in upserted}),
+        }
+
+    data["token"] = make_token(user, started, set(boards))
+    return data
@@ -1,19 +1,43 @@
+from django.conf import settings
 from django.urls import path
 
-from goals import views
+from goals import async_views, views
+
+
+app_name = "goals"
+
+
+def read_view(sync_view, async_view):
+
+    return (async_view if settings.GOALS_ASYNC_VIEWS else sync_view).as_view()
 
 
 urlpatterns = [
-    path("board/create", views.BoardCreateView.as_view()),
-    path("board/list", views.BoardListView.as_view()),
-    path("board/<pk>", views.BoardView.as_view()),
-    path("goal/create", views.GoalCreateView.as_view()),
-    path("goal/list", views.GoalListView.as_view()),
-    path("goal/<pk>", views.GoalView.as_view()),
-    path("goal_category/create", views.GoalCategoryCreateView.as_view()),
-    path("goal_category/list", views.GoalCategoryListView.as_view()),
-    path("goal_category/<pk>", views.GoalCategoryView.as_view()),
-    path("goal_comment/create", views.GoalCommentCreateView.as_view()),
-    path("goal_comment/list", views.GoalCommentListView.as_view()),
-    path("goal_comment/<pk>", views.GoalCommentView.as_view()),
-]
\ No newline at end of file
+    path("board/create", views.BoardCreateView.as_view(), name="create_board"),
+    path("board/list", read_view(views.BoardListView, async_views.BoardListAsyncView), name="board_list"),
+    path("board/stats", views.BoardStatsListView.as_view(), name="board_stats_list"),
+    path("board/<pk>", read_view(views.BoardView, async_views.BoardAsyncView), name="board_detail"),
+    path("board/<pk>/events", views.BoardEventsView.as_view(), name="board_events"),
+    path("board/<pk>/export", views.BoardExportView.as_view(), name="board_export"),
+    path("board/<pk>/stats", views.BoardStatsView.as_view(), name="board_stats"),
+    path("board/<pk>/participants", views.BoardParticipantsView.as_view(), name="board_participants"),
+    path("board/<pk>/snapshot", views.BoardSnapshotView.as_view(), name="board_snapshot"),
+    path("goal/create", views.GoalCreateView.as_view(), name="create_goal"),
+    path("goal/list", read_view(views.GoalListView, async_views.GoalListAsyncView), name="goal_list"),
+    path("goal/bulk", views.GoalBulkView.as_view(), name="goal_bulk"),
+    path("goal/<pk>", read_view(views.GoalView, async_views.GoalAsyncView), name="goal_detail"),
+    path("goal_category/create", views.GoalCategoryCreateView.as_view(), name="create_category"),
+    path("goal_category/list", read_view(views.GoalCategoryListView, async_views.GoalCategoryListAsyncView),
+         name="category_list"),
+    path("goal_category/<pk>/import", views.GoalImportView.as_view(), name="category_import"),
+    path("goal_category/<pk>", read_view(views.GoalCategoryView, async_views.GoalCategoryAsyncView),
+         name="category_detail"),
+    path("goal_comment/create", views.GoalCommentCreateView.as_view(), name="create_comment"),
+    path("goal_comment/list", read_view(views.GoalCommentListView, async_views.GoalCommentListAsyncView),
+         name="comment_list"),
+    path("goal_comment/<pk>", read_view(views.GoalCommentView, async_views.GoalCommentAsyncView),
+         name="comment_detail"),
+    path("sync", views.SyncView.as_view(), name="sync"),
+    path("cascade/<pk>", views.CascadeDeletionView.as_view(), name="cascade_detail"),
+    path("cache/stats", views.ResponseCacheStatsView.as_view(), name="cache_stats"),
+]
@@ -1,18 +1,45 @@
-from typing import List
+import asyncio
+import codecs
+import json
+from typing import AsyncIterator, Dict, List, Optional
 
 from django_filters.rest_framework import DjangoFilterBackend
-from rest_framework.generics import CreateAPIView, ListAPIView, RetrieveUpdateDestroyAPIView
-from rest_framework import permissions, filters
-from rest_framework.pagination import LimitOffsetPagination
+from django_filters.utils import translate_validation
+from rest_framework.generics import CreateAPIView, GenericAPIView, ListAPIView, RetrieveAPIView, \
+    RetrieveUpdateDestroyAPIView
+from rest_framework import exceptions, permissions, filters, status
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.views import APIView
 from rest_framework import serializers
-from django.db import models, transaction
-
-from goals.filters import GoalDateFilter
-from goals.models import GoalCategory, Goal, GoalComment, Board
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import models
+from django.db.models.functions import RowNumber
+from django.core.handlers.asgi import ASGIRequest
+from django.http import HttpRequest, HttpResponse, JsonResponse, StreamingHttpResponse
+from django.views import View
+
+from goals import events
+from goals.archive import comment_model, goal_model, include_archived
+from goals.export import CSVRenderer, Exporter, NDJSONRenderer
+from goals.filters import GoalDateFilter, GoalSearchFilter, GoalWithArchivedDateFilter
+from goals.imports import GoalImporter, read_rows
+from goals.cache import response_cache_stats
+from goals.cascade import delete_board, delete_category
+from goals.mixins import ConditionalListMixin, ResponseCacheMixin, RowListMixin
+from goals.models import GoalCategory, Goal, GoalComment, Board, BoardParticipant, CascadeDeletion
+from goals.pagination import KeysetPagination
+from goals.roles import get_board_roles
+from goals.stats import board_stats, with_comment_activity
+from goals.sync import build_changes
+from goals.row_serializers import GoalActivityRowSerializer, GoalCategoryRowSerializer, GoalCommentRowSerializer
 from goals.permissions import BoardPermissions, CategoryPermissions, GoalPermissions
 from goals.serializers import GoalCreateSerializer, GoalCategorySerializer, GoalCategoryCreateSerializer, GoalSerializer, \
-    BoardCreateSerializer, BoardSerializer, BoardListSerializer
-from goals.serializers import GoalCommentCreateSerializer, GoalCommentSerializer
+    GoalActivitySerializer, BoardCreateSerializer, BoardSerializer, BoardListSerializer
+from goals.serializers import GoalCommentCreateSerializer, GoalCommentSerializer, GoalBulkCreateSerializer, \
+    GoalBulkUpdateSerializer, BoardParticipantSerializer, BoardSnapshotGoalSerializer, sync_participants, \
+    CascadeDeletionSerializer
 
 
 class GoalCategoryCreateView(CreateAPIView):
@@ -22,12 +49,13 @@ class GoalCategoryCreateView(CreateAPIView):
     serializer_class: serializers.ModelSerializer = GoalCategoryCreateSerializer
 
 
-class GoalCategoryListView(ListAPIView):
+class GoalCategoryListView(ConditionalListMixin, ResponseCacheMixin, RowListMixin, ListAPIView):
 
     model: models.Model = GoalCategory
     permission_classes: list = [permissions.IsAuthenticated]
     serializer_class: serializers.ModelSerializer = GoalCategorySerializer
-    pagination_class = LimitOffsetPagination
+    row_serializer_class = GoalCategoryRowSerializer
+    pagination_class = KeysetPagination
     filter_backends: list = [
         filters.OrderingFilter,
         filters.SearchFilter,
@@ -54,13 +82,49 @@ class GoalCategoryView(RetrieveUpdateDestroyAPIView):
         return GoalCategory.objects.select_related('user').filter(
             board__participants__user=self.request.user).exclude(is_deleted=True)
 
+    def destroy(self, request: Request, *args, **kwargs) -> Response:
+
+        job: Optional[CascadeDeletion] = delete_category(self.get_object())
+        if job is None:
+            return Response(status=status.HTTP_204_NO_CONTENT)
+        return Response(CascadeDeletionSerializer(job).data, status=status.HTTP_202_ACCEPTED)
+
+
+class GoalImportView(GenericAPIView):
+    """
+    Imports goals into the category from a CSV (``text/csv``) or NDJSON (``application/x-ndjson``) body,
+    read as a stream. Answers with the number of imported and failed rows and the errors of each failed
+    row; ``?strict=true`` imports nothing unless every row is valid.
+    """
+
+    model: models.Model = GoalCategory
+    permission_classes: list = [permissions.IsAuthenticated, CategoryPermissions]
+    media_types: Dict[str, str] = {"text/csv": "csv", "application/x-ndjson": "ndjson"}
+
+    def get_queryset(self) -> List[GoalCategory]:
+
+        return GoalCategory.objects.filter(board__participants__user=self.request.user, is_deleted=False)
 
-    def perform_destroy(self, instance: GoalCategory) -> None:
+    def post(self, request: Request, *args, **kwargs) -> Response:
 
-        with transaction.atomic():
-            instance.is_deleted = True
-            instance.save(update_fields=('is_deleted',))
-            instance.goal_set.update(status=Goal.Status.archived)
+        category: GoalCategory = self.get_object()
+        media_type: str = request.content_type.split(";")[0].strip()
+        if media_type not in self.media_types:
+            raise exceptions.UnsupportedMediaType(media_type)
+
+        strict: bool = request.query_params.get("strict", "").lower() in ("1", "true")
+        importer: GoalImporter = GoalImporter(category, request.user, get_board_roles(request), strict=strict,
+                                              batch_size=settings.GOALS_IMPORT_BATCH_SIZE)
+        try:
+            # the body is read line by line, DRF's parsers would load it whole
+            report: dict = importer.run(read_rows(codecs.iterdecode(request._request, "utf-8-sig"),
+                                                  self.media_types[media_type]))
+        except UnicodeDecodeError:
+            raise exceptions.ParseError("The body is not valid UTF-8")
+
+        if strict and report["failed"]:
+            return Response(report, status=status.HTTP_400_BAD_REQUEST)
+        return Response(report)
 
 
 class GoalCreateView(CreateAPIView):
@@ -70,37 +134,57 @@ class GoalCreateView(CreateAPIView):
     serializer_class: serializers.ModelSerializer = GoalCreateSerializer
 
 
-class GoalListView(ListAPIView):
+class GoalListView(ConditionalListMixin, ResponseCacheMixin, RowListMixin, ListAPIView):
+    """
+    ``?include_archived=true`` also lists the goals moved to the archive tables. Every goal carries
+    its ``comments_count`` and ``last_comment_at``.
+    """
 
     model: models.Model = Goal
     permission_classes: list = [permissions.IsAuthenticated]
-    serializer_class: serializers.ModelSerializer = GoalSerializer
-    pagination_class = LimitOffsetPagination
+    serializer_class: serializers.ModelSerializer = GoalActivitySerializer
+    row_serializer_class = GoalActivityRowSerializer
+    pagination_class = KeysetPagination
     filter_backends: list = [
         DjangoFilterBackend,
-        filters.SearchFilter,
         filters.OrderingFilter,
+        GoalSearchFilter,
     ]
-    filterset_class = GoalDateFilter
     ordering_fields: List[str] = ["title", "created"]
     ordering: List[str] = ["title"]
     search_fields: List[str] = ["title", "description"]
 
+    @property
+    def filterset_class(self) -> type:
+
+        return GoalWithArchivedDateFilter if include_archived(self.request) else GoalDateFilter
+
+    def get_list_validators(self, queryset: models.QuerySet) -> dict:
+
+        # a new or deleted comment changes the list without touching any goal; one aggregate over the
+        # comments of the filtered goals instead of the per-goal activity subqueries
+        validators: dict = super().get_list_validators(queryset)
+        comments: models.QuerySet = comment_model(self.request).objects.filter(
+            goal__in=queryset.order_by().values("id"))
+        validators.update(comments.aggregate(last_comment_at=models.Max("created"), comments=models.Count("id")))
+        return validators
+
     def get_queryset(self) -> list:
 
-        return Goal.objects.select_related('user').filter(
-            category__board__participants__user=self.request.user).exclude(is_deleted=True)
+        return with_comment_activity(goal_model(self.request).objects.select_related('user').filter(
+            board__participants__user=self.request.user).exclude(is_deleted=True))
 
 
 class GoalView(RetrieveUpdateDestroyAPIView):
 
     model: models.Model = Goal
-    serializer_class: serializers.ModelSerializer = GoalSerializer
+    serializer_class: serializers.ModelSerializer = GoalActivitySerializer
     permission_classes: list = [permissions.IsAuthenticated, GoalPermissions]
 
     def get_queryset(self) -> list:
 
-        return Goal.objects.filter(category__board__participants__user=self.request.user, is_deleted=False)
+        return with_comment_activity(goal_model(self.request).objects.select_related('user').filter(
+            board__participants__user=self.request.user, is_deleted=False))
 
     def perform_destroy(self, instance: Goal) -> None:
 
@@ -108,6 +192,39 @@ class GoalView(RetrieveUpdateDestroyAPIView):
         instance.save(update_fields=('status',))
 
 
+class GoalBulkView(GenericAPIView):
+
+    model: models.Model = Goal
+    permission_classes: list = [permissions.IsAuthenticated]
+    max_items: int = 1000
+
+    def get_serializer_class(self) -> serializers.Serializer:
+
+        if self.request.method == "PATCH":
+            return GoalBulkUpdateSerializer
+        return GoalBulkCreateSerializer
+
+    def get_queryset(self) -> list:
+
+        return Goal.objects.select_related('user').filter(board__participants__user=self.request.user,
+                                                          is_deleted=False)
+
+    def post(self, request: Request, *args, **kwargs) -> Response:
+
+        serializer = self.get_serializer(data=request.data, many=True, allow_empty=False, max_length=self.max_items)
+        serializer.is_valid(raise_exception=True)
+        serializer.save()
+        return Response(serializer.data, status=status.HTTP_201_CREATED)
+
+    def patch(self, request: Request, *args, **kwargs) -> Response:
+
+        serializer = self.get_serializer(self.get_queryset(), data=request.data, many=True, allow_empty=False,
+                                         max_length=self.max_items)
+        serializer.is_valid(raise_exception=True)
+        goals: List[Goal] = serializer.save()
+        return Response(GoalSerializer(goals, many=True, context=self.get_serializer_context()).data)
+
+
 class GoalCommentCreateView(CreateAPIView):
 
     model: models.Model = GoalComment
@@ -115,20 +232,24 @@ class GoalCommentCreateView(CreateAPIView):
     serializer_class: serializers.ModelSerializer = GoalCommentCreateSerializer
 
 
-class GoalCommentListView(ListAPIView):
+class GoalCommentListView(ResponseCacheMixin, RowListMixin, ListAPIView):
+    """
+    ``?include_archived=true`` also lists the comments of archived goals.
+    """
 
     model: models.Model = GoalComment
     permission_classes: list = [permissions.IsAuthenticated]
     serializer_class: serializers.ModelSerializer = GoalCommentSerializer
-    pagination_class = LimitOffsetPagination
+    row_serializer_class = GoalCommentRowSerializer
+    pagination_class = KeysetPagination
     filter_backends: list = [DjangoFilterBackend, filters.OrderingFilter]
     ordering_fields: List[str] = ["text", "goal", "created", "updated"]
     filterset_fields: List[str] = ["goal"]
 
     def get_queryset(self) -> list:
 
-        return GoalComment.objects.select_related('user').filter(
-            goal__category__board__participants__user=self.request.user)
+        return comment_model(self.request).objects.select_related('user').filter(
+            board__participants__user=self.request.user)
 
 
 class GoalCommentView(RetrieveUpdateDestroyAPIView):
@@ -149,14 +270,15 @@ class BoardCreateView(CreateAPIView):
     serializer_class: serializers.ModelSerializer = BoardCreateSerializer
 
 
-class BoardListView(ListAPIView):
+class BoardListView(ConditionalListMixin, ListAPIView):
 
     model: models.Model = Board
     permission_classes: list = [permissions.IsAuthenticated]
     serializer_class: serializers.ModelSerializer = BoardListSerializer
-    pagination_class = LimitOffsetPagination
+    pagination_class = KeysetPagination
     filter_backends: list = [DjangoFilterBackend, filters.OrderingFilter]
     ordering_fields: List[str] = ["title", ]
+    author_field: Optional[str] = None
     filterset_fields: List[str] = ["title", ]
 
     def get_queryset(self) -> list:
@@ -170,16 +292,266 @@ class BoardView(RetrieveUpdateDestroyAPIView):
     permission_classes: list = [permissions.IsAuthenticated, BoardPermissions]
     serializer_class = BoardSerializer
 
+    def get_queryset(self) -> List[Board]:
+
+        return Board.objects.filter(participants__user=self.request.user, is_deleted=False).prefetch_related(
+            models.Prefetch("participants", queryset=BoardParticipant.objects.select_related("user")))
+
+    def destroy(self, request: Request, *args, **kwargs) -> Response:
+
+        job: Optional[CascadeDeletion] = delete_board(self.get_object())
+        if job is None:
+            return Response(status=status.HTTP_204_NO_CONTENT)
+        return Response(CascadeDeletionSerializer(job).data, status=status.HTTP_202_ACCEPTED)
+
+
+class BoardStatsView(RetrieveAPIView):
+
+    model: models.Model = Board
+    permission_classes: list = [permissions.IsAuthenticated, BoardPermissions]
+
+    def get_queryset(self) -> List[Board]:
+
+        return Board.objects.filter(participants__user=self.request.user, is_deleted=False)
+
+    def retrieve(self, request: Request, *args, **kwargs) -> Response:
+
+        board: Board = self.get_object()
+        return Response(board_stats([board.id])[board.id])
+
+
+class BoardExportView(RetrieveAPIView):
+    """
+    Streams the goals of a board, optionally followed by their comments (``?comments=true``), as
+    NDJSON (default) or CSV (``?format=csv`` or ``Accept: text/csv``). Goals accept the goal list filters.
+    """
+
+    model: models.Model = Board
+    permission_classes: list = [permissions.IsAuthenticated, BoardPermissions]
+    renderer_classes: list = [NDJSONRenderer, CSVRenderer]
+
     def get_queryset(self) -> List[Board]:
 
         return Board.objects.filter(participants__user=self.request.user, is_deleted=False)
 
-    def perform_destroy(self, instance: Board) -> None:
+    def get_goals(self, board: Board) -> models.QuerySet:
+
+        filterset: GoalDateFilter = GoalDateFilter(self.request.query_params, request=self.request,
+                                                   queryset=Goal.objects.filter(board=board, is_deleted=False))
+        if not filterset.is_valid():
+            raise translate_validation(filterset.errors)
+        return filterset.qs
+
+    def retrieve(self, request: Request, *args, **kwargs) -> StreamingHttpResponse:
+
+        board: Board = self.get_object()
+        export_format: str = request.accepted_renderer.format
+        with_comments: bool = request.query_params.get("comments", "").lower() in ("1", "true")
+        exporter: Exporter = Exporter(self.get_goals(board), export_format, with_comments,
+                                      settings.GOALS_EXPORT_CHUNK_SIZE)
+
+        # an ASGI server consumes the stream on its event loop, Django 4.2 would buffer a sync iterator there
+        chunks = exporter.achunks() if isinstance(request._request, ASGIRequest) else exporter.chunks()
+        response: StreamingHttpResponse = StreamingHttpResponse(
+            chunks, content_type=f"{request.accepted_renderer.media_type}; charset=utf-8")
+        response["Content-Disposition"] = f'attachment; filename="board-{board.id}.{export_format}"'
+        return response
+
+
+class BoardStatsListView(GenericAPIView):
+
+    model: models.Model = Board
+    permission_classes: list = [permissions.IsAuthenticated]
+
+    def get_queryset(self) -> List[Board]:
+
+        queryset: models.QuerySet = Board.objects.filter(participants__user=self.request.user, is_deleted=False)
+        ids: List[str] = [value for value in self.request.query_params.getlist("board") if value.isdigit()]
+        if ids:
+            queryset = queryset.filter(id__in=ids)
+        return queryset
+
+    def get(self, request: Request, *args, **kwargs) -> Response:
+
+        board_ids: List[int] = list(self.get_queryset().order_by("id").values_list("id", flat=True))
+        return Response(list(board_stats(board_ids).values()))
+
+
+class BoardParticipantsView(GenericAPIView):
+
+    model: models.Model = Board
+    permission_classes: list = [permissions.IsAuthenticated, BoardPermissions]
+    serializer_class = BoardParticipantSerializer
+    max_items: int = 1000
+
+    def get_queryset(self) -> List[Board]:
+
+        return Board.objects.filter(participants__user=self.request.user, is_deleted=False)
+
+    def post(self, request: Request, *args, **kwargs) -> Response:
+
+        board: Board = self.get_object()
+        serializer: serializers.ListSerializer = self.get_serializer(
+            data=request.data, many=True, max_length=self.max_items)
+        serializer.is_valid(raise_exception=True)
+        sync_participants(board, request.user, serializer.validated_data, remove_missing=False)
+
+        participants: models.QuerySet = board.participants.select_related("user").order_by("id")
+        return Response(self.get_serializer(participants, many=True).data)
+
+
+class BoardSnapshotView(RetrieveAPIView):
+
+    model: models.Model = Board
+    permission_classes: list = [permissions.IsAuthenticated, BoardPermissions]
+    serializer_class = BoardListSerializer
+    default_column_limit: int = 50
+    max_column_limit: int = 200
+
+    def get_queryset(self) -> List[Board]:
+
+        return Board.objects.filter(participants__user=self.request.user, is_deleted=False).prefetch_related(
+            models.Prefetch("participants", queryset=BoardParticipant.objects.select_related("user")),
+            models.Prefetch("categories", queryset=GoalCategory.objects.select_related("user").filter(
+                is_deleted=False).order_by("title")),
+        )
+
+    def get_column_limit(self) -> int:
+
+        try:
+            limit: int = int(self.request.query_params["limit"])
+        except (KeyError, ValueError):
+            return self.default_column_limit
+        return max(1, min(limit, self.max_column_limit))
+
+    def get_statuses(self) -> List[int]:
+
+        if self.request.query_params.get("archived", "").lower() in ("1", "true"):
+            return list(Goal.Status.values)
+        return [value for value in Goal.Status.values if value != Goal.Status.archived]
+
+    def retrieve(self, request: Request, *args, **kwargs) -> Response:
+
+        board: Board = self.get_object()
+        context: dict = self.get_serializer_context()
+        statuses: List[int] = self.get_statuses()
+
+        goals: models.QuerySet = with_comment_activity(Goal.objects.select_related("user").filter(
+            board=board, is_deleted=False, status__in=statuses,
+        )).annotate(
+            column_position=models.Window(RowNumber(), partition_by=[models.F("status")],
+                                          order_by=[models.F("title").asc(), models.F("id").asc()]),
+        ).filter(column_position__lte=self.get_column_limit()).order_by("status", "column_position")
+        totals: dict = dict(Goal.objects.filter(board=board, is_deleted=False, status__in=statuses).order_by(
+            ).values("status").annotate(total=models.Count("id")).values_list("status", "total"))
+
+        columns: dict = {
+            value: {"status": value, "title": Goal.Status(value).label, "total": totals.get(value, 0), "goals": []}
+            for value in statuses
+        }
+        for goal in goals:
+            columns[goal.status]["goals"].append(goal)
+        for column in columns.values():
+            column["goals"] = BoardSnapshotGoalSerializer(column["goals"], many=True, context=context).data
+
+        return Response({
+            "board": self.get_serializer(board).data,
+            "participants": BoardParticipantSerializer(board.participants.all(), many=True, context=context).data,
+            "categories": GoalCategorySerializer(board.categories.all(), many=True, context=context).data,
+            "columns": list(columns.values()),
+        })
+
+
+class CascadeDeletionView(RetrieveAPIView):
+
+    model: models.Model = CascadeDeletion
+    permission_classes: list = [permissions.IsAuthenticated]
+    serializer_class = CascadeDeletionSerializer
+
+    def get_queryset(self) -> List[CascadeDeletion]:
+
+        return CascadeDeletion.objects.filter(board__participants__user=self.request.user)
+
+
+class BoardEventsView(View):
+    """
+    Server-Sent Events stream of the changes of one board.
+
+    The view is async: a connected client is an idle coroutine waiting on its queue of the
+    in-process event bus, not a worker thread. Streams end after GOALS_EVENTS_MAX_AGE seconds (or when
+    the client falls behind) and EventSource reconnects on its own. Only the session cookie
+    authenticates: EventSource cannot send an Authorization header.
+
+    It needs an ASGI server: under WSGI Django 4.2 drains an async stream before sending anything.
+    Membership is checked again on participant and board events and on every keepalive, so a removed
+    participant's stream ends with a reset instead of running until its max age.
+    """
+
+    async def get(self, request: HttpRequest, pk: str) -> HttpResponse:
+
+        if not isinstance(request, ASGIRequest):
+            return JsonResponse({"detail": "Board events need an ASGI server."}, status=501)
+        user = await sync_to_async(lambda: request.user if request.user.is_authenticated else None)()
+        if user is None:
+            return JsonResponse({"detail": "Authentication credentials were not provided."}, status=403)
+        if not pk.isdigit() or not await self.has_access(int(pk), user.id):
+            return JsonResponse({"detail": "Not found."}, status=404)
+
+        response: StreamingHttpResponse = StreamingHttpResponse(self.stream(int(pk), user.id),
+                                                                content_type="text/event-stream")
+        response["Cache-Control"] = "no-cache"
+        response["X-Accel-Buffering"] = "no"
+        return response
+
+    @staticmethod
+    async def has_access(board_id: int, user_id: int) -> bool:
+
+        return await Board.objects.filter(pk=board_id, participants__user_id=user_id, is_deleted=False).aexists()
+
+    @classmethod
+    async def stream(cls, board_id: int, user_id: int) -> AsyncIterator[str]:
+
+        # Subscribed here rather than in get(), so the queue belongs to the loop consuming the stream.
+        subscription: events.Subscription = events.bus.subscribe(board_id)
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        deadline: float = loop.time() + settings.GOALS_EVENTS_MAX_AGE
+        try:
+            yield "retry: 3000\n\n"
+            while loop.time() < deadline:
+                timeout: float = min(settings.GOALS_EVENTS_KEEPALIVE, deadline - loop.time())
+                try:
+                    event = await asyncio.wait_for(subscription.get(), timeout=max(timeout, 0))
+                except asyncio.TimeoutError:
+                    event = None
+                if event is events.OVERFLOW:
+                    yield "event: reset\ndata: {}\n\n"
+                    return
+                # participant removals arrive as participant or (bulk) board events
+                if (event is None or event["type"] in ("board", "participant")) \
+                        and not await cls.has_access(board_id, user_id):
+                    yield "event: reset\ndata: {}\n\n"
+                    return
+                if event is None:
+                    yield ": keepalive\n\n"
+                    continue
+                yield f"event: {event['type']}\ndata: {json.dumps(event)}\n\n"
+        finally:
+            events.bus.unsubscribe(subscription)
+
+
+class SyncView(APIView):
+
+    permission_classes: list = [permissions.IsAuthenticated]
+
+    def get(self, request: Request, *args, **kwargs) -> Response:
+
+        return Response(build_changes(request.user, request.query_params.get("token")))
+
+
+class ResponseCacheStatsView(APIView):
+
+    permission_classes: list = [permissions.IsAdminUser]
+
+    def get(self, request: Request, *args, **kwargs) -> Response:
 
-        with transaction.atomic():
-            instance.is_deleted = True
-            instance.save()
-            instance.categories.update(is_deleted=True)
-            Goal.objects.filter(category__board=instance).update(
-                status=Goal.Status.archived
-            )
+        return Response(response_cache_stats())
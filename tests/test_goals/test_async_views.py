@@ -0,0 +1,91 @@
+import json
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.contrib.auth.models import AnonymousUser
+from django.test import AsyncRequestFactory
+from django.urls import reverse
+from rest_framework import status
+
+from goals import async_views
+from goals.models import Goal
+
+
+@pytest.mark.django_db()
+class TestAsyncViews:
+
+    @pytest.fixture(autouse=True)
+    def setup(self, user, board_factory, goal_category_factory, goal_factory, goal_comment_factory) -> None:
+        self.board = board_factory.create(with_owner=user)
+        self.category = goal_category_factory.create(board=self.board, user=user)
+        self.goals = [goal_factory.create(category=self.category, user=user) for _ in range(3)]
+        self.comment = goal_comment_factory.create(goal=self.goals[0], user=user)
+
+    @staticmethod
+    def call(view_class, user, method, path, data=None, **kwargs):
+        factory = AsyncRequestFactory()
+        if method == 'get':
+            request = factory.get(path, data)
+        else:
+            request = getattr(factory, method)(path, json.dumps(data), content_type='application/json')
+        request.user = user
+        request._dont_enforce_csrf_checks = True
+        return async_to_sync(view_class.as_view())(request, **kwargs)
+
+    @pytest.mark.parametrize('name, view_class, params', [
+        ('goals:goal_list', async_views.GoalListAsyncView, {'limit': 2}),
+        ('goals:goal_list', async_views.GoalListAsyncView, {'cursor': '', 'limit': 2, 'expand': 'users:sideload'}),
+        ('goals:goal_list', async_views.GoalListAsyncView, {'category': 0}),
+        ('goals:category_list', async_views.GoalCategoryListAsyncView, {}),
+        ('goals:comment_list', async_views.GoalCommentListAsyncView, {'count': 'estimate', 'limit': 10}),
+        ('goals:board_list', async_views.BoardListAsyncView, {'limit': 10}),
+    ])
+    def test_lists_match_sync_views(self, auth_client, user, name, view_class, params):
+        url = reverse(name)
+        expected = auth_client.get(url, params)
+
+        response = self.call(view_class, user, 'get', url, params)
+
+        assert response.status_code == expected.status_code
+        assert json.loads(response.content) == expected.json()
+
+    def test_details_match_sync_views(self, auth_client, user):
+        for name, view_class, pk in [
+            ('goals:goal_detail', async_views.GoalAsyncView, self.goals[0].pk),
+            ('goals:category_detail', async_views.GoalCategoryAsyncView, self.category.pk),
+            ('goals:comment_detail', async_views.GoalCommentAsyncView, self.comment.pk),
+            ('goals:board_detail', async_views.BoardAsyncView, self.board.pk),
+        ]:
+            url = reverse(name, args=[pk])
+            response = self.call(view_class, user, 'get', url, pk=pk)
+
+            assert response.status_code == status.HTTP_200_OK
+            assert json.loads(response.content) == auth_client.get(url).json()
+
+    def test_conditional_get(self, user):
+        url = reverse('goals:goal_list')
+        etag = self.call(async_views.GoalListAsyncView, user, 'get', url)['ETag']
+        request = AsyncRequestFactory().get(url, headers={'If-None-Match': etag})
+        request.user = user
+
+        assert async_to_sync(async_views.GoalListAsyncView.as_view())(request).status_code == 304
+
+    def test_permissions(self, client, another_user):
+        url = reverse('goals:goal_detail', args=[self.goals[0].pk])
+        view_class = async_views.GoalAsyncView
+
+        assert self.call(view_class, AnonymousUser(), 'get', url, pk=self.goals[0].pk).status_code == \
+            client.get(url).status_code
+        assert self.call(view_class, another_user, 'get', url, pk=self.goals[0].pk).status_code == 404
+        assert self.call(view_class, another_user, 'get', url, pk='x').status_code == 404
+        assert json.loads(self.call(async_views.GoalListAsyncView, another_user, 'get',
+                                    reverse('goals:goal_list')).content) == []
+
+    def test_writes_go_to_sync_view(self, user):
+        goal = self.goals[1]
+        url = reverse('goals:goal_detail', args=[goal.pk])
+
+        response = self.call(async_views.GoalAsyncView, user, 'patch', url, {'title': 'renamed'}, pk=goal.pk)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert Goal.objects.get(pk=goal.pk).title == 'renamed'
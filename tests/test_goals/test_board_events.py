@@ -0,0 +1,121 @@
+import asyncio
+import json
+
+import pytest
+from asgiref.sync import async_to_sync, sync_to_async
+from django.test import AsyncClient
+from django.urls import reverse
+
+from goals import events
+from goals.models import BoardParticipant
+
+
+@pytest.mark.django_db()
+class TestBoardEvents:
+
+    @pytest.fixture(autouse=True)
+    def setup(self, user, board_factory, goal_category_factory) -> None:
+        self.board = board_factory.create(with_owner=user)
+        self.category = goal_category_factory.create(board=self.board, user=user)
+
+    def test_stream_pushes_board_changes(self, user, goal_factory, django_capture_on_commit_callbacks):
+        client = AsyncClient()
+        client.force_login(user)
+
+        def create_goal():
+            with django_capture_on_commit_callbacks(execute=True):
+                return goal_factory.create(category=self.category, user=user)
+
+        async def consume():
+            response = await client.get(reverse('goals:board_events', args=[self.board.pk]))
+            assert response['Content-Type'] == 'text/event-stream'
+            stream = response.streaming_content.__aiter__()
+            try:
+                assert await stream.__anext__() == b'retry: 3000\n\n'
+                goal = await sync_to_async(create_goal)()
+                chunk = await asyncio.wait_for(stream.__anext__(), timeout=5)
+            finally:
+                await stream.aclose()
+            return goal, chunk.decode()
+
+        goal, chunk = async_to_sync(consume)()
+
+        name, data = chunk.strip().split('\n')
+        assert name == 'event: goal'
+        assert json.loads(data.removeprefix('data: ')) == {
+            'type': 'goal', 'action': 'saved', 'id': goal.id, 'board': self.board.id,
+        }
+        assert not events.bus.subscriptions
+
+    def test_removed_participant_stream_ends(self, user, another_user, django_capture_on_commit_callbacks):
+        participant = BoardParticipant.objects.create(board=self.board, user=another_user,
+                                                      role=BoardParticipant.Role.reader)
+        client = AsyncClient()
+        client.force_login(another_user)
+
+        def remove():
+            with django_capture_on_commit_callbacks(execute=True):
+                participant.delete()
+
+        async def consume():
+            response = await client.get(reverse('goals:board_events', args=[self.board.pk]))
+            stream = response.streaming_content.__aiter__()
+            try:
+                await stream.__anext__()
+                await sync_to_async(remove)()
+                chunk = await asyncio.wait_for(stream.__anext__(), timeout=5)
+                with pytest.raises(StopAsyncIteration):
+                    await asyncio.wait_for(stream.__anext__(), timeout=5)
+            finally:
+                await stream.aclose()
+            return chunk.decode()
+
+        assert async_to_sync(consume)() == 'event: reset\ndata: {}\n\n'
+
+    def test_wsgi_is_not_supported(self, client, user):
+        client.force_login(user)
+
+        assert client.get(reverse('goals:board_events', args=[self.board.pk])).status_code == 501
+
+    def test_requires_participant(self, another_user):
+        client = AsyncClient()
+
+        async def status_code():
+            return (await client.get(reverse('goals:board_events', args=[self.board.pk]))).status_code
+
+        assert async_to_sync(status_code)() == 403
+        client.force_login(another_user)
+        assert async_to_sync(status_code)() == 404
+
+    def test_slow_subscriber_is_reset(self, settings):
+        settings.GOALS_EVENTS_QUEUE_SIZE = 2
+
+        async def overflow():
+            subscription = events.bus.subscribe(self.board.id)
+            try:
+                for i in range(3):
+                    events.bus.deliver({'type': 'goal', 'action': 'saved', 'id': i, 'board': self.board.id})
+                await asyncio.sleep(0)
+                return await subscription.get()
+            finally:
+                events.bus.unsubscribe(subscription)
+
+        assert async_to_sync(overflow)() is events.OVERFLOW
+
+
+@pytest.mark.django_db(transaction=True)
+def test_postgres_backend_fans_out_through_notify(settings, board_factory):
+    settings.GOALS_EVENTS_BACKEND = 'postgres'
+    board = board_factory.create()
+
+    async def roundtrip():
+        subscription = events.bus.subscribe(board.id)
+        try:
+            await sync_to_async(events.bus.listening.wait)(5)
+            await sync_to_async(events.send)({'type': 'goal', 'action': 'deleted', 'id': 1, 'board': board.id})
+            return await asyncio.wait_for(subscription.get(), timeout=5)
+        finally:
+            events.bus.unsubscribe(subscription)
+            await sync_to_async(events.bus.stop_listener, thread_sensitive=False)()
+
+    assert async_to_sync(roundtrip)() == {'type': 'goal', 'action': 'deleted', 'id': 1, 'board': board.id}
@@ -0,0 +1,93 @@
+import csv
+import datetime
+import io
+import json
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.test import AsyncClient
+from django.urls import reverse
+from rest_framework import status
+
+from goals.models import Goal
+
+
+@pytest.mark.django_db()
+class TestBoardExport:
+
+    @pytest.fixture(autouse=True)
+    def setup(self, settings, user, board_factory, goal_category_factory, goal_factory, goal_comment_factory) -> None:
+        settings.GOALS_EXPORT_CHUNK_SIZE = 2
+        self.board = board_factory.create(with_owner=user)
+        self.category = goal_category_factory.create(board=self.board, user=user)
+        self.goals = [goal_factory.create(category=self.category, user=user) for _ in range(3)]
+        self.goals[0].due_date = datetime.date(2030, 1, 31)
+        self.goals[0].save()
+        self.goals[2].status = Goal.Status.done
+        self.goals[2].save()
+        self.comments = [goal_comment_factory.create(goal=goal, user=user) for goal in self.goals]
+        other = goal_category_factory.create(board=board_factory.create(with_owner=user), user=user)
+        goal_factory.create(category=other, user=user)
+        self.url = reverse('goals:board_export', args=[self.board.pk])
+
+    @staticmethod
+    def content(response):
+        assert response.streaming
+        return b''.join(response.streaming_content).decode()
+
+    def test_ndjson(self, auth_client, user):
+        response = auth_client.get(self.url, {'comments': 'true'})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response['Content-Type'] == 'application/x-ndjson; charset=utf-8'
+        records = [json.loads(line) for line in self.content(response).splitlines()]
+        assert [(record['type'], record['id']) for record in records] == \
+            [('goal', goal.id) for goal in self.goals] + [('comment', comment.id) for comment in self.comments]
+        assert records[0] == {
+            'type': 'goal', 'id': self.goals[0].id, 'category': self.category.id, 'title': self.goals[0].title,
+            'description': self.goals[0].description, 'status': self.goals[0].status,
+            'priority': self.goals[0].priority, 'due_date': '2030-01-31',
+            'user': user.username, 'created': self.goals[0].created.isoformat(),
+            'updated': self.goals[0].updated.isoformat(),
+        }
+        assert records[-1]['goal'] == self.goals[2].id
+
+    def test_csv_with_goal_filters(self, auth_client):
+        response = auth_client.get(self.url, {'format': 'csv', 'status__in': '1,2', 'comments': '1'})
+
+        assert response['Content-Disposition'] == f'attachment; filename="board-{self.board.id}.csv"'
+        rows = list(csv.DictReader(io.StringIO(self.content(response))))
+        assert [(row['type'], row['id']) for row in rows] == \
+            [('goal', str(goal.id)) for goal in self.goals[:2]] + \
+            [('comment', str(comment.id)) for comment in self.comments[:2]]
+        assert rows[0]['text'] == '' and rows[-1]['title'] == ''
+
+        accepted = auth_client.get(self.url, HTTP_ACCEPT='text/csv')
+        assert self.content(accepted).splitlines()[0].startswith('type,id,category')
+
+    def test_csv_escapes_formulas(self, auth_client):
+        Goal.objects.filter(pk=self.goals[0].pk).update(title='=HYPERLINK("http://example.com")', description='-1')
+        self.comments[0].text = '@SUM(A1:A2)'
+        self.comments[0].save()
+
+        response = auth_client.get(self.url, {'format': 'csv', 'comments': '1'})
+        rows = list(csv.DictReader(io.StringIO(self.content(response))))
+        assert (rows[0]['title'], rows[0]['description']) == ('\'=HYPERLINK("http://example.com")', "'-1")
+        assert rows[3]['text'] == "'@SUM(A1:A2)"
+        assert json.loads(self.content(auth_client.get(self.url)).splitlines()[0])['description'] == '-1'
+
+    def test_rejects_strangers_and_bad_filters(self, auth_client, client, another_user):
+        assert auth_client.get(self.url, {'due_date__gte': 'never'}).status_code == status.HTTP_400_BAD_REQUEST
+
+        client.force_login(another_user)
+        assert client.get(self.url).status_code == status.HTTP_404_NOT_FOUND
+
+    def test_streams_through_async_orm_under_asgi(self, auth_client, user):
+        client = AsyncClient()
+        client.force_login(user)
+
+        async def export():
+            response = await client.get(self.url, {'comments': 'true'})
+            return b''.join([chunk async for chunk in response.streaming_content]).decode()
+
+        assert async_to_sync(export)() == self.content(auth_client.get(self.url, {'comments': 'true'}))
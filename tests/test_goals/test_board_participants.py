@@ -0,0 +1,64 @@
+import pytest
+from django.urls import reverse
+from rest_framework import status
+
+from goals.models import BoardParticipant
+
+
+@pytest.mark.django_db()
+class TestBoardParticipantsSync:
+
+    @pytest.fixture(autouse=True)
+    def setup(self, user, board_factory, user_factory) -> None:
+        self.board = board_factory.create(with_owner=user)
+        self.users = [user_factory.create(username=f'member{i}') for i in range(30)]
+        for member in self.users[:20]:
+            BoardParticipant.objects.create(board=self.board, user=member, role=BoardParticipant.Role.reader)
+
+    def test_update_uses_constant_queries(self, auth_client, django_assert_max_num_queries):
+        participants = [{'user': member.username, 'role': BoardParticipant.Role.writer} for member in self.users[10:]]
+
+        with django_assert_max_num_queries(18):
+            response = auth_client.put(reverse('goals:board_detail', args=[self.board.pk]),
+                                       data={'title': 'renamed', 'participants': participants}, format='json')
+
+        assert response.status_code == status.HTTP_200_OK
+        roles = dict(BoardParticipant.objects.filter(board=self.board).values_list('user__username', 'role'))
+        assert roles == {
+            **{member.username: BoardParticipant.Role.writer for member in self.users[10:]},
+            self.board.participants.get(role=BoardParticipant.Role.owner).user.username: BoardParticipant.Role.owner,
+        }
+        assert len(response.json()['participants']) == 21
+
+    def test_owner_cannot_be_demoted(self, auth_client, user):
+        participants = [{'user': user.username, 'role': BoardParticipant.Role.reader}]
+
+        auth_client.put(reverse('goals:board_detail', args=[self.board.pk]),
+                        data={'title': 'renamed', 'participants': participants}, format='json')
+
+        assert BoardParticipant.objects.get(board=self.board, user=user).role == BoardParticipant.Role.owner
+
+    def test_bulk_invite_keeps_existing(self, auth_client):
+        data = [{'user': member.username, 'role': BoardParticipant.Role.writer} for member in self.users[15:]]
+
+        response = auth_client.post(reverse('goals:board_participants', args=[self.board.pk]), data=data,
+                                    format='json')
+
+        assert response.status_code == status.HTTP_200_OK
+        assert len(response.json()) == 31
+        assert BoardParticipant.objects.filter(board=self.board, role=BoardParticipant.Role.writer).count() == 15
+
+    def test_bulk_invite_unknown_user(self, auth_client):
+        response = auth_client.post(reverse('goals:board_participants', args=[self.board.pk]),
+                                    data=[{'user': 'nobody', 'role': BoardParticipant.Role.reader}], format='json')
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_bulk_invite_requires_owner(self, client, board_factory):
+        client.force_login(self.users[0])
+
+        response = client.post(reverse('goals:board_participants', args=[self.board.pk]),
+                               data=[{'user': self.users[25].username, 'role': BoardParticipant.Role.reader}],
+                               format='json')
+
+        assert response.status_code == status.HTTP_403_FORBIDDEN
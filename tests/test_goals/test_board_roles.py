@@ -0,0 +1,84 @@
+import pytest
+from django.core.cache import cache
+from django.urls import reverse
+from rest_framework import status
+
+from goals.checks import check_board_roles_cache_backend
+from goals.models import BoardParticipant
+from goals.roles import BoardRoles
+
+
+@pytest.mark.django_db()
+class TestBoardRoles:
+
+    def test_roles_loaded_with_single_query(self, user, board_factory, django_assert_num_queries):
+        boards = [board_factory.create(with_owner=user) for _ in range(3)]
+        roles = BoardRoles(user)
+
+        with django_assert_num_queries(1):
+            assert all(roles.is_owner(board.id) for board in boards)
+            assert roles.can_write(boards[0].id)
+            assert not roles.is_participant(boards[-1].id + 1)
+
+    def test_shared_cache_invalidated_on_participant_change(self, settings, user, board,
+                                                            django_capture_on_commit_callbacks):
+        settings.BOARD_ROLES_CACHE_TIMEOUT = 60
+        cache.clear()
+        with django_capture_on_commit_callbacks(execute=True):
+            participant = BoardParticipant.objects.create(board=board, user=user, role=BoardParticipant.Role.reader)
+        assert BoardRoles(user).role(board.id) == BoardParticipant.Role.reader
+
+        with django_capture_on_commit_callbacks(execute=True):
+            participant.role = BoardParticipant.Role.writer
+            participant.save()
+        assert BoardRoles(user).role(board.id) == BoardParticipant.Role.writer
+
+        with django_capture_on_commit_callbacks(execute=True):
+            participant.delete()
+            # a request running before the commit may still cache the old roles, the delete comes after it
+            cache.set(f'goals:board_roles:{user.id}', {board.id: BoardParticipant.Role.writer})
+        assert not BoardRoles(user).is_participant(board.id)
+
+    def test_per_process_backend_fails_the_check(self, settings):
+        settings.BOARD_ROLES_CACHE_TIMEOUT = 0
+        assert check_board_roles_cache_backend(None) == []
+
+        settings.BOARD_ROLES_CACHE_TIMEOUT = 60
+        assert [error.id for error in check_board_roles_cache_backend(None)] == ['goals.E002']
+
+
+@pytest.mark.django_db()
+class TestGoalPermissions:
+
+    @pytest.fixture(autouse=True)
+    def setup(self, goal, board_participant, user) -> None:
+        board_participant.user = user
+        board_participant.board = goal.category.board
+        board_participant.save()
+        self.participant = board_participant
+        self.url = reverse('goals:goal_detail', kwargs={'pk': goal.pk})
+
+    def test_reader_can_retrieve_goal(self, auth_client):
+        self.participant.role = BoardParticipant.Role.reader
+        self.participant.save(update_fields=['role'])
+
+        response = auth_client.get(self.url)
+
+        assert response.status_code == status.HTTP_200_OK
+
+    def test_reader_cannot_update_goal(self, auth_client):
+        self.participant.role = BoardParticipant.Role.reader
+        self.participant.save(update_fields=['role'])
+
+        response = auth_client.patch(self.url, data={'title': 'new title'})
+
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+
+    def test_writer_can_update_goal(self, auth_client):
+        self.participant.role = BoardParticipant.Role.writer
+        self.participant.save(update_fields=['role'])
+
+        response = auth_client.patch(self.url, data={'title': 'new title'})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()['title'] == 'new title'
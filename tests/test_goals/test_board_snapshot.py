@@ -0,0 +1,56 @@
+import pytest
+from django.urls import reverse
+from rest_framework import status
+
+from goals.models import BoardParticipant, Goal
+
+
+@pytest.mark.django_db()
+class TestBoardSnapshotView:
+
+    @pytest.fixture(autouse=True)
+    def setup(self, user, board_factory, goal_category_factory) -> None:
+        self.board = board_factory.create(with_owner=user)
+        self.category = goal_category_factory.create(board=self.board, user=user)
+        self.url = reverse('goals:board_snapshot', kwargs={'pk': self.board.pk})
+
+    def seed(self, goal_factory, goal_comment_factory, user, count: int) -> None:
+        for i in range(count):
+            goal = goal_factory.create(category=self.category, user=user, title=f'goal {i:03}',
+                                       status=Goal.Status.values[i % 4])
+            goal_comment_factory.create(goal=goal, user=user)
+
+    def test_not_participant(self, client, another_user):
+        client.force_login(another_user)
+
+        response = client.get(self.url)
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_columns_limited_and_grouped(self, auth_client, goal_factory, goal_comment_factory, user):
+        self.seed(goal_factory, goal_comment_factory, user, 12)
+
+        response = auth_client.get(self.url, {'limit': 2})
+
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert data['board']['id'] == self.board.id
+        assert data['participants'] == [{**data['participants'][0], 'user': user.username,
+                                         'role': BoardParticipant.Role.owner}]
+        assert [category['id'] for category in data['categories']] == [self.category.id]
+        assert [column['status'] for column in data['columns']] == [1, 2, 3]
+        for column in data['columns']:
+            assert column['total'] == 3
+            assert len(column['goals']) == 2
+            assert all(goal['status'] == column['status'] and goal['comments_count'] == 1
+                       for goal in column['goals'])
+
+    def test_query_count_does_not_grow(self, auth_client, goal_factory, goal_comment_factory, user,
+                                       django_assert_max_num_queries):
+        self.seed(goal_factory, goal_comment_factory, user, 4)
+        with django_assert_max_num_queries(10) as small:
+            auth_client.get(self.url)
+
+        self.seed(goal_factory, goal_comment_factory, user, 40)
+        with django_assert_max_num_queries(len(small.captured_queries)):
+            auth_client.get(self.url)
@@ -0,0 +1,95 @@
+import datetime
+
+import pytest
+from django.core.management import call_command
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+
+from goals.models import BoardGoalCounter, Goal, GoalComment
+from goals.stats import board_stats
+
+
+@pytest.mark.django_db()
+class TestBoardStats:
+
+    @pytest.fixture(autouse=True)
+    def setup(self, user, board_factory, goal_category_factory, goal_factory, goal_comment_factory) -> None:
+        yesterday = timezone.localdate() - datetime.timedelta(days=1)
+        self.boards = [board_factory.create(with_owner=user) for _ in range(2)]
+        self.categories = [goal_category_factory.create(board=board, user=user) for board in self.boards]
+        self.overdue = goal_factory.create(category=self.categories[0], user=user, due_date=yesterday)
+        self.done = goal_factory.create(category=self.categories[0], user=user, due_date=yesterday,
+                                        status=Goal.Status.done, priority=Goal.Priority.high)
+        self.other = goal_factory.create(category=self.categories[1], user=user)
+        goal_comment_factory.create(goal=self.overdue, user=user)
+        goal_comment_factory.create(goal=self.other, user=user)
+
+    def expected(self):
+        stats = {board.id: {'total': 0, 'status': {}, 'priority': {}, 'overdue': 0, 'comments': 0}
+                 for board in self.boards}
+        for goal in Goal.objects.filter(is_deleted=False):
+            board = stats[goal.board_id]
+            board['total'] += 1
+            status_name, priority_name = Goal.Status(goal.status).name, Goal.Priority(goal.priority).name
+            board['status'][status_name] = board['status'].get(status_name, 0) + 1
+            board['priority'][priority_name] = board['priority'].get(priority_name, 0) + 1
+            if goal.due_date and goal.due_date < timezone.localdate() and goal.status in (1, 2):
+                board['overdue'] += 1
+        for comment in GoalComment.objects.all():
+            stats[comment.board_id]['comments'] += 1
+        return stats
+
+    def assert_counters_match(self):
+        actual = board_stats(board.id for board in self.boards)
+        for board_id, expected in self.expected().items():
+            board = actual[board_id]
+            assert board['total'] == expected['total']
+            assert {key: value for key, value in board['by_status'].items() if value} == expected['status']
+            assert {key: value for key, value in board['by_priority'].items() if value} == expected['priority']
+            assert (board['overdue'], board['comments']) == (expected['overdue'], expected['comments'])
+
+    def test_counters_follow_writes(self, auth_client, user, goal_factory):
+        self.assert_counters_match()
+
+        self.overdue.status = Goal.Status.done
+        self.overdue.save()
+        self.other.category = self.categories[0]
+        self.other.save()
+        auth_client.patch(reverse('goals:goal_bulk'), data=[{'id': self.done.id, 'priority': Goal.Priority.low}],
+                          format='json')
+        auth_client.post(reverse('goals:goal_bulk'), data=[{'category': self.categories[1].id, 'title': 'new'}],
+                         format='json')
+        goal_factory.create(category=self.categories[1], user=user).delete()
+        Goal.objects.filter(pk=self.done.pk).update(is_deleted=True)
+        GoalComment.objects.filter(goal=self.overdue).delete()
+
+        self.assert_counters_match()
+
+    def test_endpoints(self, auth_client, another_user, client):
+        response = auth_client.get(reverse('goals:board_stats', args=[self.boards[0].pk]))
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == {
+            'board': self.boards[0].id, 'total': 2, 'overdue': 1, 'comments': 1,
+            'by_status': {'to_do': 1, 'in_progress': 0, 'done': 1, 'archived': 0},
+            'by_priority': {'low': 0, 'medium': 1, 'high': 1, 'critical': 0},
+        }
+        stats = auth_client.get(reverse('goals:board_stats_list'), {'board': self.boards[1].id}).json()
+        assert [(board['board'], board['total']) for board in stats] == [(self.boards[1].id, 1)]
+        assert len(auth_client.get(reverse('goals:board_stats_list')).json()) == 2
+
+        client.force_login(another_user)
+        assert client.get(reverse('goals:board_stats', args=[self.boards[0].pk])).status_code == 404
+        assert client.get(reverse('goals:board_stats_list')).json() == []
+
+    def test_reads_do_not_scan_goals(self, auth_client, django_assert_max_num_queries):
+        with django_assert_max_num_queries(7):
+            auth_client.get(reverse('goals:board_stats_list'))
+
+    def test_rebuild(self):
+        BoardGoalCounter.objects.filter(board=self.boards[0]).update(count=100)
+
+        call_command('rebuild_board_stats', self.boards[0].id)
+
+        self.assert_counters_match()
@@ -0,0 +1,63 @@
+import pytest
+from django.core.management import call_command
+from django.urls import reverse
+from rest_framework import status
+
+from goals.cascade import process_chunk
+from goals.models import CascadeDeletion, Goal, GoalCategory
+
+
+@pytest.mark.django_db()
+class TestCascadeDeletion:
+
+    @pytest.fixture(autouse=True)
+    def setup(self, settings, user, board_factory, goal_category_factory, goal_factory) -> None:
+        settings.GOALS_CASCADE_SYNC_LIMIT = 4
+        settings.GOALS_CASCADE_CHUNK_SIZE = 4
+        settings.GOALS_CASCADE_BACKGROUND = False
+        self.board = board_factory.create(with_owner=user)
+        self.categories = [goal_category_factory.create(board=self.board, user=user) for _ in range(2)]
+        self.goals = [goal_factory.create(category=self.categories[i % 2], user=user) for i in range(10)]
+
+    def test_small_board_is_archived_synchronously(self, auth_client, user, board_factory, goal_category_factory,
+                                                   goal_factory):
+        board = board_factory.create(with_owner=user)
+        goal = goal_factory.create(category=goal_category_factory.create(board=board, user=user), user=user)
+
+        response = auth_client.delete(reverse('goals:board_detail', args=[board.pk]))
+
+        assert response.status_code == status.HTTP_204_NO_CONTENT
+        assert Goal.objects.get(pk=goal.pk).status == Goal.Status.archived
+        assert not CascadeDeletion.objects.exists()
+
+    def test_large_board_is_archived_in_chunks(self, auth_client):
+        response = auth_client.delete(reverse('goals:board_detail', args=[self.board.pk]))
+
+        assert response.status_code == status.HTTP_202_ACCEPTED
+        job = CascadeDeletion.objects.get(pk=response.json()['id'])
+        assert (job.stage, job.total, job.processed) == (CascadeDeletion.Stage.categories, 12, 0)
+        assert not Goal.objects.filter(status=Goal.Status.archived).exists()
+
+        job = process_chunk(job.id)
+        assert job.stage == CascadeDeletion.Stage.goals
+        assert not GoalCategory.objects.filter(board=self.board, is_deleted=False).exists()
+        job = process_chunk(job.id)
+        assert (job.processed, Goal.objects.filter(status=Goal.Status.archived).count()) == (6, 4)
+
+        call_command('cascade')
+
+        job.refresh_from_db()
+        assert (job.stage, job.processed) == (CascadeDeletion.Stage.finished, 12)
+        assert Goal.objects.filter(status=Goal.Status.archived).count() == 10
+
+    def test_progress_endpoint(self, auth_client, client, another_user):
+        response = auth_client.delete(reverse('goals:category_detail', args=[self.categories[0].pk]))
+        url = reverse('goals:cascade_detail', args=[response.json()['id']])
+        call_command('cascade')
+
+        data = auth_client.get(url).json()
+        assert (data['category'], data['stage'], data['processed']) == (self.categories[0].id, 3, 5)
+        assert Goal.objects.filter(status=Goal.Status.archived).count() == 5
+
+        client.force_login(another_user)
+        assert client.get(url).status_code == status.HTTP_404_NOT_FOUND
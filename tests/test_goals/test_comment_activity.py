@@ -0,0 +1,61 @@
+import pytest
+from django.urls import reverse
+from rest_framework import status
+
+from goals.models import GoalComment
+
+
+@pytest.mark.django_db()
+class TestGoalCommentActivity:
+    url = reverse('goals:goal_list')
+
+    @pytest.fixture(autouse=True)
+    def setup(self, user, board_factory, goal_category_factory, goal_factory) -> None:
+        board = board_factory.create(with_owner=user)
+        self.category = goal_category_factory.create(board=board, user=user)
+        self.goal = goal_factory.create(category=self.category, user=user, title='a')
+        self.quiet = goal_factory.create(category=self.category, user=user, title='b')
+
+    def test_list_and_detail(self, auth_client, user, goal_comment_factory):
+        goal_comment_factory.create(goal=self.goal, user=user)
+        last = goal_comment_factory.create(goal=self.goal, user=user)
+        expected = {'comments_count': 2, 'last_comment_at': last.created.isoformat().replace('+00:00', 'Z')}
+
+        goals = {goal['id']: goal for goal in auth_client.get(self.url).json()}
+        assert {key: goals[self.goal.id][key] for key in expected} == expected
+        assert (goals[self.quiet.id]['comments_count'], goals[self.quiet.id]['last_comment_at']) == (0, None)
+
+        detail = auth_client.get(reverse('goals:goal_detail', args=[self.goal.pk])).json()
+        assert {key: detail[key] for key in expected} == expected
+
+    def test_query_count_does_not_grow(self, auth_client, user, goal_factory, goal_comment_factory,
+                                       django_assert_max_num_queries):
+        with django_assert_max_num_queries(10) as small:
+            auth_client.get(self.url)
+
+        for goal in goal_factory.create_batch(20, category=self.category, user=user):
+            goal_comment_factory.create_batch(2, goal=goal, user=user)
+        with django_assert_max_num_queries(len(small.captured_queries)):
+            auth_client.get(self.url)
+
+    def test_comment_changes_etag(self, auth_client, user, goal_comment_factory):
+        etag = auth_client.get(self.url).headers['ETag']
+        comment = goal_comment_factory.create(goal=self.goal, user=user)
+        response = auth_client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == status.HTTP_200_OK
+
+        etag = response.headers['ETag']
+        GoalComment.objects.filter(pk=comment.pk).delete()
+        assert auth_client.get(self.url, HTTP_IF_NONE_MATCH=etag).status_code == status.HTTP_200_OK
+
+    def test_not_modified_skips_activity_subqueries(self, auth_client, user, goal_comment_factory,
+                                                    django_assert_max_num_queries):
+        goal_comment_factory.create(goal=self.goal, user=user)
+        etag = auth_client.get(self.url).headers['ETag']
+
+        with django_assert_max_num_queries(5) as context:
+            response = auth_client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+        # the per-goal comments_count / last_comment_at subqueries group by goal
+        assert not any('GROUP BY' in query['sql'] for query in context.captured_queries)
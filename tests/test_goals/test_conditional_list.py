@@ -0,0 +1,84 @@
+import datetime
+
+import pytest
+from django.urls import reverse
+from django.utils import timezone
+from django.utils.http import http_date
+from rest_framework import status
+
+from goals.models import Goal
+
+
+@pytest.mark.django_db()
+class TestConditionalGoalList:
+    url = reverse('goals:goal_list')
+
+    @pytest.fixture(autouse=True)
+    def setup(self, user, board_factory, goal_category_factory, goal_factory) -> None:
+        board = board_factory.create(with_owner=user)
+        category = goal_category_factory.create(board=board, user=user)
+        self.goal = goal_factory.create(category=category, user=user)
+
+    def test_not_modified_by_etag(self, auth_client, django_assert_max_num_queries):
+        etag = auth_client.get(self.url).headers['ETag']
+
+        with django_assert_max_num_queries(4):
+            response = auth_client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+        assert response.content == b''
+        assert response.headers['ETag'] == etag
+
+    def test_changed_goal_invalidates_etag(self, auth_client):
+        etag = auth_client.get(self.url).headers['ETag']
+        self.goal.title = 'changed'
+        self.goal.save(update_fields=['title'])
+
+        response = auth_client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()[0]['title'] == 'changed'
+
+    def test_etag_depends_on_query(self, auth_client):
+        etag = auth_client.get(self.url).headers['ETag']
+
+        response = auth_client.get(self.url, {'ordering': '-created'}, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == status.HTTP_200_OK
+
+    def test_if_modified_since_is_ignored(self, auth_client):
+        response = auth_client.get(self.url, HTTP_IF_MODIFIED_SINCE=http_date(timezone.now().timestamp() + 60))
+
+        assert response.status_code == status.HTTP_200_OK
+        assert 'Last-Modified' not in response.headers
+
+    def test_soft_deleted_older_goal_invalidates_etag(self, auth_client, goal_factory, user):
+        older = goal_factory.create(category=self.goal.category, user=user)
+        Goal.objects.filter(pk=older.pk).update(updated=timezone.now() - datetime.timedelta(days=1))
+        etag = auth_client.get(self.url).headers['ETag']
+        Goal.objects.filter(pk=older.pk).update(is_deleted=True)
+
+        response = auth_client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert [goal['id'] for goal in response.json()] == [self.goal.id]
+
+    def test_renamed_author_invalidates_etag(self, auth_client, user):
+        etag = auth_client.get(self.url).headers['ETag']
+        user.username = 'renamed'
+        user.save(update_fields=['username'])
+
+        response = auth_client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()[0]['user']['username'] == 'renamed'
+
+    def test_board_delete_changes_category_list(self, auth_client):
+        url = reverse('goals:category_list')
+        etag = auth_client.get(url).headers['ETag']
+        auth_client.delete(reverse('goals:board_detail', kwargs={'pk': self.goal.board_id}))
+
+        response = auth_client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == []
@@ -0,0 +1,64 @@
+import datetime
+
+import pytest
+from django.core.management import call_command
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+
+from goals.models import ArchivedGoal, ArchivedGoalComment, Goal, GoalComment
+
+
+@pytest.mark.django_db()
+class TestGoalArchive:
+
+    @pytest.fixture(autouse=True)
+    def setup(self, user, board_factory, goal_category_factory, goal_factory, goal_comment_factory) -> None:
+        self.board = board_factory.create(with_owner=user)
+        category = goal_category_factory.create(board=self.board, user=user)
+        self.active, self.old, self.deleted, self.recent = [
+            goal_factory.create(category=category, user=user) for _ in range(4)
+        ]
+        self.comment = goal_comment_factory.create(goal=self.old, user=user)
+        self.active_comment = goal_comment_factory.create(goal=self.active, user=user)
+        Goal.objects.filter(pk__in=[self.old.pk, self.recent.pk]).update(status=Goal.Status.archived)
+        Goal.objects.filter(pk=self.deleted.pk).update(is_deleted=True)
+        long_ago = timezone.now() - datetime.timedelta(days=365)
+        Goal.objects.filter(pk__in=[self.active.pk, self.old.pk, self.deleted.pk]).update(updated=long_ago)
+
+    def test_moves_old_archived_goals_with_comments(self, settings):
+        settings.GOALS_ARCHIVE_BATCH_SIZE = 1
+
+        call_command('archive_goals')
+
+        assert set(Goal.objects.values_list('id', flat=True)) == {self.active.id, self.recent.id}
+        assert set(ArchivedGoal.objects.values_list('id', flat=True)) == {self.old.id, self.deleted.id}
+        assert list(GoalComment.objects.values_list('id', flat=True)) == [self.active_comment.id]
+        archived_comment = ArchivedGoalComment.objects.get()
+        assert (archived_comment.id, archived_comment.goal_id, archived_comment.text) == \
+            (self.comment.id, self.old.id, self.comment.text)
+
+    def test_include_archived_read_path(self, auth_client):
+        url = reverse('goals:goal_list')
+        before = {goal['id']: goal for goal in auth_client.get(url).json()}
+        comments_url = reverse('goals:comment_list')
+
+        call_command('archive_goals')
+
+        assert {goal['id'] for goal in auth_client.get(url).json()} == {self.active.id, self.recent.id}
+        archived = {goal['id']: goal for goal in auth_client.get(url, {'include_archived': 'true'}).json()}
+        assert archived == before
+        assert {comment['id'] for comment in auth_client.get(comments_url, {'include_archived': 'true'}).json()} == \
+            {self.comment.id, self.active_comment.id}
+
+        detail = reverse('goals:goal_detail', args=[self.old.pk])
+        assert auth_client.get(detail).status_code == status.HTTP_404_NOT_FOUND
+        assert auth_client.get(detail, {'include_archived': 'true'}).json() == before[self.old.id]
+        assert auth_client.patch(detail + '?include_archived=true', {'title': 'x'}).status_code == \
+            status.HTTP_404_NOT_FOUND
+
+    def test_dry_run(self, capsys):
+        call_command('archive_goals', dry_run=True)
+
+        assert '2 goals would be archived' in capsys.readouterr().out
+        assert not ArchivedGoal.objects.exists()
@@ -0,0 +1,58 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from goals.models import Goal, GoalComment
+
+
+@pytest.mark.django_db()
+class TestGoalBoard:
+
+    def test_board_copied_from_category(self, goal, goal_comment_factory):
+        comment = goal_comment_factory.create(goal=goal)
+
+        assert goal.board_id == goal.category.board_id
+        assert comment.board_id == goal.board_id
+
+    def test_moving_goal_moves_comments(self, goal, goal_category_factory, goal_comment_factory):
+        comment = goal_comment_factory.create(goal=goal)
+        new_category = goal_category_factory.create()
+
+        goal.category = new_category
+        goal.save(update_fields=['category'])
+
+        assert Goal.objects.get(pk=goal.pk).board_id == new_category.board_id
+        assert GoalComment.objects.get(pk=comment.pk).board_id == new_category.board_id
+
+    def test_save_without_parent_change_reads_no_parent(self, goal, goal_comment_factory):
+        comment = goal_comment_factory.create(goal=goal)
+        goal, comment = Goal.objects.get(pk=goal.pk), GoalComment.objects.get(pk=comment.pk)
+
+        with CaptureQueriesContext(connection) as context:
+            goal.status = Goal.Status.done
+            goal.save()
+            comment.text = 'edited'
+            comment.save(update_fields=['text'])
+
+        assert not any(table in query['sql'] for query in context.captured_queries
+                       for table in ('FROM "goals_goalcategory"', 'FROM "goals_goal" '))
+
+    def test_reassigned_parent_id_is_copied(self, goal, goal_category_factory):
+        goal = Goal.objects.get(pk=goal.pk)
+        new_category = goal_category_factory.create()
+
+        goal.category_id = new_category.id
+        goal.save()
+
+        assert Goal.objects.get(pk=goal.pk).board_id == new_category.board_id
+
+    def test_list_queries_join_participants_only(self, auth_client, user, goal, board_participant):
+        board_participant.user = user
+        board_participant.board = goal.board
+        board_participant.save()
+
+        for url in (reverse('goals:goal_list'), reverse('goals:comment_list')):
+            with CaptureQueriesContext(connection) as context:
+                assert auth_client.get(url).status_code == 200
+            assert not any('goals_goalcategory' in query['sql'] for query in context.captured_queries)
@@ -0,0 +1,61 @@
+import pytest
+from django.urls import reverse
+from rest_framework import status
+
+from goals.models import BoardParticipant, Goal, GoalComment
+
+
+@pytest.mark.django_db()
+class TestGoalBulkView:
+    url = reverse('goals:goal_bulk')
+
+    @pytest.fixture(autouse=True)
+    def setup(self, user, board_factory, goal_category_factory) -> None:
+        self.boards = [board_factory.create(with_owner=user) for _ in range(2)]
+        self.categories = [goal_category_factory.create(board=board, user=user) for board in self.boards]
+
+    def test_bulk_create(self, auth_client, django_assert_max_num_queries):
+        data = [{'category': self.categories[i % 2].id, 'title': f'goal {i}'} for i in range(20)]
+
+        with django_assert_max_num_queries(10):
+            response = auth_client.post(self.url, data=data, format='json')
+
+        assert response.status_code == status.HTTP_201_CREATED
+        assert len(response.json()) == 20
+        assert Goal.objects.filter(board=self.boards[1]).count() == 10
+
+    def test_bulk_create_requires_writer_role(self, auth_client, user, board_factory, goal_category_factory):
+        board = board_factory.create()
+        BoardParticipant.objects.create(board=board, user=user, role=BoardParticipant.Role.reader)
+        category = goal_category_factory.create(board=board)
+        data = [{'category': self.categories[0].id, 'title': 'ok'}, {'category': category.id, 'title': 'denied'}]
+
+        response = auth_client.post(self.url, data=data, format='json')
+
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+        assert not Goal.objects.exists()
+
+    def test_bulk_update_and_move(self, auth_client, user, goal_factory, goal_comment_factory):
+        goals = [goal_factory.create(category=self.categories[0], user=user) for _ in range(3)]
+        comment = goal_comment_factory.create(goal=goals[0], user=user)
+        data = [
+            {'id': goals[0].id, 'category': self.categories[1].id},
+            {'id': goals[1].id, 'status': Goal.Status.done, 'priority': Goal.Priority.high},
+            {'id': goals[2].id, 'due_date': '2030-01-01'},
+        ]
+
+        response = auth_client.patch(self.url, data=data, format='json')
+
+        assert response.status_code == status.HTTP_200_OK
+        assert [goal['id'] for goal in response.json()] == [goal.id for goal in goals]
+        moved = Goal.objects.get(pk=goals[0].id)
+        assert (moved.category_id, moved.board_id) == (self.categories[1].id, self.boards[1].id)
+        assert GoalComment.objects.get(pk=comment.pk).board_id == self.boards[1].id
+        assert Goal.objects.get(pk=goals[1].id).status == Goal.Status.done
+        assert str(Goal.objects.get(pk=goals[2].id).due_date) == '2030-01-01'
+
+    def test_bulk_update_unknown_goal(self, auth_client, goal):
+        response = auth_client.patch(self.url, data=[{'id': goal.id, 'status': Goal.Status.done}], format='json')
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.json() == [{'id': ['goal not found']}]
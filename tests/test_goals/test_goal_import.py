@@ -0,0 +1,91 @@
+import json
+
+import pytest
+from django.core.management import call_command
+from django.urls import reverse
+from rest_framework import status
+
+from goals.models import BoardParticipant, Goal
+from goals.stats import board_stats
+
+
+@pytest.mark.django_db()
+class TestGoalImport:
+
+    @pytest.fixture(autouse=True)
+    def setup(self, settings, user, board_factory, goal_category_factory) -> None:
+        settings.GOALS_IMPORT_BATCH_SIZE = 2
+        self.board = board_factory.create(with_owner=user)
+        self.category = goal_category_factory.create(board=self.board, user=user)
+        self.url = reverse('goals:category_import', args=[self.category.pk])
+
+    def post(self, client, body, content_type, **params):
+        url = self.url + ('?' + '&'.join(f'{key}={value}' for key, value in params.items()) if params else '')
+        return client.generic('POST', url, body.encode(), content_type=content_type)
+
+    def test_csv(self, auth_client, user):
+        body = ('title,description,status,priority,due_date\n'
+                'first,"multi\nline",2,4,2030-01-31\n'
+                'second,,,,\n'
+                ',missing title,,,\n'
+                'fourth,,9,,\n'
+                'fifth,tab\tand \\ backslash,3,1,\n')
+
+        response = self.post(auth_client, body, 'text/csv')
+
+        assert response.status_code == status.HTTP_200_OK
+        report = response.json()
+        assert (report['imported'], report['failed']) == (3, 2)
+        assert [(error['row'], list(error['errors'])) for error in report['errors']] == \
+            [(3, ['title']), (4, ['status'])]
+
+        goals = {goal.title: goal for goal in Goal.objects.filter(category=self.category)}
+        assert set(goals) == {'first', 'second', 'fifth'}
+        first, second, fifth = goals['first'], goals['second'], goals['fifth']
+        assert (first.description, first.status, first.priority, str(first.due_date)) == \
+            ('multi\nline', Goal.Status.in_progress, Goal.Priority.critical, '2030-01-31')
+        assert (second.description, second.status, second.priority, second.due_date) == \
+            (None, Goal.Status.to_do, Goal.Priority.medium, None)
+        assert fifth.description == 'tab\tand \\ backslash'
+        assert all(goal.user == user and goal.board_id == self.board.id and goal.created == goal.updated
+                   for goal in goals.values())
+        # triggers fire for COPY
+        assert Goal.objects.filter(search_vector='first').count() == 1
+        assert board_stats([self.board.id])[self.board.id]['total'] == 3
+
+    def test_ndjson_and_strict_mode(self, auth_client):
+        lines = [json.dumps({'title': 'one', 'priority': 3}), 'not json', '', json.dumps(['title']),
+                 json.dumps({'title': 'two', 'due_date': None})]
+        body = '\n'.join(lines) + '\n'
+
+        strict = self.post(auth_client, body, 'application/x-ndjson', strict='true')
+        assert strict.status_code == status.HTTP_400_BAD_REQUEST
+        assert strict.json()['imported'] == 0
+        assert not Goal.objects.exists()
+
+        report = self.post(auth_client, body, 'application/x-ndjson').json()
+        assert (report['imported'], report['failed']) == (2, 2)
+        assert [error['errors'] for error in report['errors']] == [
+            {'non_field_errors': ['invalid JSON']}, {'non_field_errors': ['expected a JSON object']},
+        ]
+        assert sorted(Goal.objects.values_list('title', flat=True)) == ['one', 'two']
+
+    def test_requires_writer_role_and_known_format(self, auth_client, another_user):
+        assert self.post(auth_client, 'title\nx\n', 'text/plain').status_code == \
+            status.HTTP_415_UNSUPPORTED_MEDIA_TYPE
+
+        BoardParticipant.objects.create(board=self.board, user=another_user, role=BoardParticipant.Role.reader)
+        auth_client.force_login(another_user)
+        assert self.post(auth_client, 'title\nx\n', 'text/csv').status_code == status.HTTP_403_FORBIDDEN
+        assert not Goal.objects.exists()
+
+    def test_command(self, tmp_path, user, capsys):
+        path = tmp_path / 'goals.csv'
+        path.write_text('﻿title,priority\nfrom file,2\nbad,7\n', encoding='utf-8')
+
+        call_command('import_goals', self.category.id, str(path), user=user.username)
+
+        assert list(Goal.objects.values_list('title', flat=True)) == ['from file']
+        captured = capsys.readouterr()
+        assert 'imported 1 goals, 1 rows failed' in captured.out
+        assert 'row 2: {"priority"' in captured.err
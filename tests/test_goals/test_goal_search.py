@@ -0,0 +1,74 @@
+import pytest
+from django.urls import reverse
+from rest_framework import status
+
+from goals.models import Goal
+
+
+@pytest.mark.django_db()
+class TestGoalSearch:
+    url = reverse('goals:goal_list')
+
+    @pytest.fixture(autouse=True)
+    def setup(self, user, board_factory, goal_category_factory, goal_factory) -> None:
+        board = board_factory.create(with_owner=user)
+        category = goal_category_factory.create(board=board, user=user)
+        self.title_match = goal_factory.create(category=category, user=user, title='Buy running shoes')
+        self.description_match = goal_factory.create(category=category, user=user, title='Marathon',
+                                                     description='Start running every morning')
+        self.other = goal_factory.create(category=category, user=user, title='Read a book')
+
+    def test_vector_maintained_by_trigger(self):
+        goal = Goal.objects.get(pk=self.other.pk)
+        assert goal.search_vector
+
+        goal.title = 'Write a book'
+        goal.save()
+
+        assert Goal.objects.filter(pk=goal.pk, search_vector='write').exists()
+
+    def test_search_ranks_title_before_description(self, auth_client):
+        response = auth_client.get(self.url, {'search': 'run'})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert [goal['id'] for goal in response.json()] == [self.title_match.id, self.description_match.id]
+        assert 'search_vector' not in response.json()[0]
+
+    def test_explicit_ordering_wins_over_rank(self, auth_client):
+        response = auth_client.get(self.url, {'search': 'run', 'ordering': 'title'})
+
+        assert [goal['title'] for goal in response.json()] == ['Buy running shoes', 'Marathon']
+
+    def test_keyset_pages_over_search_results(self, auth_client, goal_factory, user):
+        for title in ('Running club', 'Running plan', 'Go running'):
+            goal_factory.create(category=self.other.category, user=user, title=title)
+
+        ids, url, params = [], self.url, {'search': 'run', 'limit': 2, 'cursor': ''}
+        for _ in range(5):
+            data = auth_client.get(url, params).json()
+            ids += [goal['id'] for goal in data['results']]
+            url, params = data['next'], None
+            if url is None:
+                break
+
+        assert url is None
+        assert len(ids) == len(set(ids)) == 5
+        assert [Goal.objects.get(pk=pk).title for pk in ids] == sorted(Goal.objects.get(pk=pk).title for pk in ids)
+
+    def test_comment_text_is_optional(self, auth_client, goal_comment_factory, user):
+        goal_comment_factory.create(goal=self.other, user=user, text='borrowed from the library')
+
+        assert auth_client.get(self.url, {'search': 'library'}).json() == []
+        response = auth_client.get(self.url, {'search': 'library', 'search_comments': 'true'})
+        assert [goal['id'] for goal in response.json()] == [self.other.id]
+
+    def test_comment_write_leaves_goal_vector(self, auth_client, goal_comment_factory, user):
+        vector = Goal.objects.values_list('search_vector', flat=True).get(pk=self.other.pk)
+        comment = goal_comment_factory.create(goal=self.other, user=user, text='borrowed from the library')
+        comment.text = 'returned to the shelf'
+        comment.save()
+
+        assert Goal.objects.values_list('search_vector', flat=True).get(pk=self.other.pk) == vector
+        response = auth_client.get(self.url, {'search': 'shelf', 'search_comments': 'true'})
+        assert [goal['id'] for goal in response.json()] == [self.other.id]
+        assert auth_client.get(self.url, {'search': 'library', 'search_comments': 'true'}).json() == []
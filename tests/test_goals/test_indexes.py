@@ -0,0 +1,40 @@
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.db import connection
+from django.utils import timezone
+
+from goals.models import Board, BoardParticipant
+
+
+@pytest.mark.django_db()
+class TestExplainLists:
+
+    def test_list_plans_use_goals_indexes(self, user, another_user, board_factory, goal_category_factory,
+                                          goal_factory, goal_comment_factory):
+        board = board_factory.create(with_owner=user)
+        category = goal_category_factory.create(board=board, user=user)
+        goal = goal_factory.create(category=category, user=user)
+        goal_comment_factory.create(goal=goal, user=user)
+        # other users' memberships make the user_id index the selective one; on near-empty tables every index
+        # costs the same and the planner's pick depends on what earlier tests left in the indexes
+        now = timezone.now()
+        BoardParticipant.objects.bulk_create([
+            BoardParticipant(board=other, user=another_user, created=now, updated=now)
+            for other in Board.objects.bulk_create([
+                Board(title=f'other {i}', created=now, updated=now) for i in range(200)
+            ])
+        ])
+        with connection.cursor() as cursor:
+            cursor.execute('ANALYZE goals_boardparticipant')
+        out = StringIO()
+
+        call_command('explain_lists', '--no-seqscan', '--user', user.username, stdout=out)
+
+        output = out.getvalue()
+        for url in ('board/list', 'goal/list', 'goal_category/list', 'goal_comment/list'):
+            assert url in output
+        # (user, board) and the user foreign key index cost the same for the membership lookup
+        assert 'participant_user_board_idx' in output or 'goals_boardparticipant_user_id_' in output
+        assert 'seq scans: goals_' not in output
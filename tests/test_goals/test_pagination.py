@@ -0,0 +1,91 @@
+import base64
+import json
+
+import pytest
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.exceptions import NotFound
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from goals.models import Goal
+from goals.pagination import KeysetPagination
+
+
+@pytest.mark.django_db()
+class TestGoalListPagination:
+    url = reverse('goals:goal_list')
+
+    @pytest.fixture(autouse=True)
+    def setup(self, user, board_factory, goal_category_factory, goal_factory) -> None:
+        board = board_factory.create(with_owner=user)
+        category = goal_category_factory.create(board=board, user=user)
+        self.goals = [goal_factory.create(category=category, user=user, title=title)
+                      for title in ['b', 'a', 'c', 'a', 'd']]
+
+    def test_offset_clients_keep_count(self, auth_client):
+        response = auth_client.get(self.url, {'limit': 2, 'offset': 2})
+
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert data['count'] == 5
+        assert [goal['title'] for goal in data['results']] == ['b', 'c']
+
+    def test_offset_without_count(self, auth_client):
+        response = auth_client.get(self.url, {'limit': 2, 'count': 'none'})
+
+        data = response.json()
+        assert 'count' not in data
+        assert data['next'] is not None
+
+    def test_only_keyset_pages_are_capped(self, auth_client, monkeypatch):
+        monkeypatch.setattr(KeysetPagination, 'keyset_max_limit', 2)
+
+        assert len(auth_client.get(self.url, {'limit': 4}).json()['results']) == 4
+        assert len(auth_client.get(self.url, {'limit': 4, 'cursor': ''}).json()['results']) == 2
+
+    def test_keyset_walks_all_pages_in_order(self, auth_client):
+        titles, ids = [], []
+        url, params = self.url, {'limit': 2, 'cursor': ''}
+        while url:
+            data = auth_client.get(url, params).json()
+            assert 'count' not in data
+            titles += [goal['title'] for goal in data['results']]
+            ids += [goal['id'] for goal in data['results']]
+            url, params = data['next'], None
+
+        assert titles == ['a', 'a', 'b', 'c', 'd']
+        assert sorted(ids) == sorted(goal.id for goal in self.goals)
+
+    def test_keyset_descending_ordering(self, auth_client):
+        first = auth_client.get(self.url, {'limit': 3, 'cursor': '', 'ordering': '-created'}).json()
+        second = auth_client.get(first['next']).json()
+
+        ids = [goal['id'] for goal in first['results'] + second['results']]
+        assert ids == [goal.id for goal in reversed(self.goals)]
+        assert second['next'] is None
+
+    def test_keyset_with_exact_count(self, auth_client):
+        response = auth_client.get(self.url, {'limit': 2, 'cursor': '', 'count': 'exact'})
+
+        assert response.json()['count'] == 5
+
+    @pytest.mark.parametrize('cursor', [
+        'garbage',
+        {'f': 'title', 'v': 'a', 'id': 'x'},
+        {'f': 'title', 'v': 'a', 'id': None},
+    ])
+    def test_invalid_cursor(self, auth_client, cursor):
+        if isinstance(cursor, dict):
+            cursor = base64.urlsafe_b64encode(json.dumps(cursor).encode()).decode()
+
+        response = auth_client.get(self.url, {'cursor': cursor})
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_invalid_pk_cursor(self):
+        cursor = base64.urlsafe_b64encode(json.dumps({'f': 'pk', 'v': 'x', 'id': 'x'}).encode()).decode()
+        request = Request(APIRequestFactory().get('/', {'cursor': cursor}))
+
+        with pytest.raises(NotFound):
+            KeysetPagination().decode_cursor(request, Goal, 'pk')
@@ -0,0 +1,73 @@
+import datetime
+
+import pytest
+from django.core.management import call_command
+from django.utils import timezone
+
+from goals.models import (ArchivedGoal, Board, BoardGoalCounter, BoardParticipant, CascadeDeletion, Goal,
+                          GoalCategory, GoalComment, SyncTombstone)
+from goals.stats import board_stats
+
+
+@pytest.mark.django_db()
+class TestPurgeDeleted:
+
+    @pytest.fixture(autouse=True)
+    def setup(self, settings, user, board_factory, goal_category_factory, goal_factory,
+              goal_comment_factory) -> None:
+        settings.GOALS_PURGE_BATCH_SIZE = 1
+        settings.GOALS_PURGE_PAUSE = 0
+        long_ago = timezone.now() - datetime.timedelta(days=365)
+
+        self.deleted_board = board_factory.create(with_owner=user)
+        category = goal_category_factory.create(board=self.deleted_board, user=user)
+        for goal in goal_factory.create_batch(2, category=category, user=user):
+            goal_comment_factory.create(goal=goal, user=user)
+        Goal.objects.filter(category=category).update(status=Goal.Status.archived, updated=long_ago)
+        call_command('archive_goals', days=1)
+        goal_comment_factory.create(goal=goal_factory.create(category=category, user=user), user=user)
+        Board.objects.filter(pk=self.deleted_board.pk).update(is_deleted=True, updated=long_ago)
+
+        self.board = board_factory.create(with_owner=user)
+        self.deleted_category = goal_category_factory.create(board=self.board, user=user, is_deleted=True)
+        goal_comment_factory.create(goal=goal_factory.create(category=self.deleted_category, user=user), user=user)
+        self.category = goal_category_factory.create(board=self.board, user=user)
+        self.deleted_goal = goal_factory.create(category=self.category, user=user, is_deleted=True)
+        self.goal = goal_factory.create(category=self.category, user=user)
+        self.comment = goal_comment_factory.create(goal=self.goal, user=user)
+        GoalCategory.objects.filter(pk=self.deleted_category.pk).update(updated=long_ago)
+        Goal.objects.filter(pk=self.deleted_goal.pk).update(updated=long_ago)
+        self.recent_category = goal_category_factory.create(board=self.board, user=user, is_deleted=True)
+
+        self.cascading_board = board_factory.create(with_owner=user)
+        CascadeDeletion.objects.create(board=self.cascading_board, stage=CascadeDeletion.Stage.goals)
+        Board.objects.filter(pk=self.cascading_board.pk).update(is_deleted=True, updated=long_ago)
+
+    def test_purges_old_deleted_trees(self, capsys):
+        assert ArchivedGoal.objects.filter(board=self.deleted_board).count() == 2
+
+        call_command('purge_deleted')
+
+        assert set(Board.objects.values_list('id', flat=True)) == {self.board.id, self.cascading_board.id}
+        assert set(GoalCategory.objects.values_list('id', flat=True)) == {self.category.id, self.recent_category.id}
+        assert list(Goal.objects.values_list('id', flat=True)) == [self.goal.id]
+        assert list(GoalComment.objects.values_list('id', flat=True)) == [self.comment.id]
+        assert not ArchivedGoal.objects.exists()
+        assert not BoardParticipant.objects.filter(board=self.deleted_board).exists()
+        assert not BoardGoalCounter.objects.filter(board=self.deleted_board).exists()
+        assert not SyncTombstone.objects.filter(board=self.deleted_board).exists()
+        assert SyncTombstone.objects.filter(board=self.board, section='goals').count() == 2
+        assert board_stats([self.board.id])[self.board.id]['total'] == 1
+
+        out = capsys.readouterr().out
+        assert 'archived goals: 2 rows' in out
+        assert 'boards: 1 rows' in out
+        assert 'reclaimed' in out
+
+    def test_dry_run(self, capsys):
+        call_command('purge_deleted', dry_run=True)
+
+        out = capsys.readouterr().out
+        assert 'goals: 3 rows would be purged' in out
+        assert 'boards: 1 rows would be purged' in out
+        assert Board.objects.filter(pk=self.deleted_board.pk).exists()
@@ -0,0 +1,86 @@
+import pytest
+from django.urls import reverse
+from rest_framework import status
+
+from goals.cache import get_cache, response_cache_stats
+from goals.checks import check_response_cache_backend
+
+
+@pytest.mark.django_db()
+class TestResponseCache:
+    url = reverse('goals:goal_list')
+
+    @pytest.fixture(autouse=True)
+    def setup(self, settings, user, board_factory, goal_category_factory, goal_factory,
+              django_capture_on_commit_callbacks) -> None:
+        settings.GOALS_RESPONSE_CACHE = True
+        get_cache().clear()
+        self.capture = django_capture_on_commit_callbacks
+        self.boards = [board_factory.create(with_owner=user) for _ in range(2)]
+        self.categories = [goal_category_factory.create(board=board, user=user) for board in self.boards]
+        self.goal = goal_factory.create(category=self.categories[0], user=user)
+
+    def test_second_request_is_a_hit(self, auth_client):
+        first = auth_client.get(self.url)
+        second = auth_client.get(self.url)
+
+        assert (first.headers['X-Cache'], second.headers['X-Cache']) == ('MISS', 'HIT')
+        assert first.content == second.content
+        assert response_cache_stats() == {'hits': 1, 'misses': 1}
+
+    def test_query_params_are_part_of_the_key(self, auth_client):
+        auth_client.get(self.url, {'limit': 1, 'offset': 0})
+
+        response = auth_client.get(self.url, {'offset': 0, 'limit': 1})
+        other = auth_client.get(self.url, {'limit': 2})
+
+        assert (response.headers['X-Cache'], other.headers['X-Cache']) == ('HIT', 'MISS')
+
+    def test_goal_write_invalidates_its_board(self, auth_client):
+        auth_client.get(self.url)
+        with self.capture(execute=True):
+            self.goal.title = 'changed'
+            self.goal.save()
+
+        response = auth_client.get(self.url)
+
+        assert response.headers['X-Cache'] == 'MISS'
+        assert response.json()[0]['title'] == 'changed'
+
+    def test_other_boards_keep_entries(self, client, another_user, goal_category_factory, user):
+        self.boards[1].participants.create(user=another_user)
+        client.force_login(another_user)
+        url = reverse('goals:category_list')
+        client.get(url)
+        with self.capture(execute=True):
+            goal_category_factory.create(board=self.boards[0], user=user)
+
+        assert client.get(url).headers['X-Cache'] == 'HIT'
+
+    def test_author_rename_invalidates_lists(self, auth_client, user):
+        auth_client.get(self.url)
+        with self.capture(execute=True):
+            user.save(update_fields=['last_login'])
+        assert auth_client.get(self.url).headers['X-Cache'] == 'HIT'
+
+        with self.capture(execute=True):
+            user.username = 'renamed'
+            user.save()
+        response = auth_client.get(self.url)
+
+        assert response.headers['X-Cache'] == 'MISS'
+        assert response.json()[0]['user']['username'] == 'renamed'
+
+    def test_per_process_backend_fails_the_check(self, settings):
+        assert [error.id for error in check_response_cache_backend(None)] == ['goals.E001']
+
+        settings.CACHES = {**settings.CACHES, 'goals': {'BACKEND': 'django.core.cache.backends.redis.RedisCache'}}
+        assert check_response_cache_backend(None) == []
+
+    def test_stats_for_admins_only(self, auth_client, user):
+        assert auth_client.get(reverse('goals:cache_stats')).status_code == status.HTTP_403_FORBIDDEN
+
+        user.is_staff = True
+        user.save()
+
+        assert auth_client.get(reverse('goals:cache_stats')).json() == {'hits': 0, 'misses': 0}
@@ -0,0 +1,95 @@
+import datetime
+
+import pytest
+from django.urls import reverse
+from rest_framework.renderers import JSONRenderer
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from goals.filters import GoalSearchFilter
+from goals.models import Goal, GoalCategory, GoalComment
+from goals.row_serializers import GoalCategoryRowSerializer, GoalCommentRowSerializer, GoalRowSerializer
+from goals.serializers import GoalCategorySerializer, GoalCommentSerializer, GoalSerializer
+from goals.views import GoalCategoryListView, GoalCommentListView, GoalListView
+
+
+@pytest.mark.django_db()
+class TestRowSerializers:
+
+    @pytest.fixture(autouse=True)
+    def setup(self, user, board_factory, goal_category_factory, goal_factory, goal_comment_factory) -> None:
+        board = board_factory.create(with_owner=user)
+        category = goal_category_factory.create(board=board, user=user)
+        goal_factory.create(category=category, user=user, title='Купить кроссовки', description=None)
+        goal_factory.create(category=category, user=user, title='Marathon', description='every "day"',
+                            due_date=datetime.date(2030, 1, 31), status=Goal.Status.in_progress)
+        for goal in Goal.objects.all():
+            goal_comment_factory.create(goal=goal, user=user, text=f'comment on {goal.title}')
+
+    @pytest.mark.parametrize('model, serializer_class, row_serializer_class', [
+        (Goal, GoalSerializer, GoalRowSerializer),
+        (GoalCategory, GoalCategorySerializer, GoalCategoryRowSerializer),
+        (GoalComment, GoalCommentSerializer, GoalCommentRowSerializer),
+    ])
+    def test_output_is_identical(self, model, serializer_class, row_serializer_class):
+        queryset = model.objects.select_related('user').order_by('id')
+        row_serializer = row_serializer_class()
+
+        expected = JSONRenderer().render(serializer_class(queryset, many=True).data)
+        assert JSONRenderer().render(row_serializer.serialize(row_serializer.values(queryset))) == expected
+
+    @pytest.mark.parametrize('view_class, url, params', [
+        (GoalListView, 'goals:goal_list', {}),
+        (GoalListView, 'goals:goal_list', {'limit': 1, 'cursor': ''}),
+        (GoalListView, 'goals:goal_list', {'search': 'marathon'}),
+        (GoalCategoryListView, 'goals:category_list', {}),
+        (GoalCommentListView, 'goals:comment_list', {'limit': 10}),
+    ])
+    def test_list_endpoints_match_serializer_path(self, auth_client, monkeypatch, view_class, url, params):
+        fast = auth_client.get(reverse(url), params)
+        monkeypatch.setattr(view_class, 'row_serializer_class', None)
+        slow = auth_client.get(reverse(url), params)
+
+        assert fast.status_code == 200
+        assert fast.content == slow.content
+
+    def test_values_select_serializer_columns_only(self):
+        request = Request(APIRequestFactory().get('/', {'search': 'marathon'}))
+        queryset = GoalSearchFilter().filter_queryset(request, Goal.objects.select_related('user'), GoalListView())
+        row_serializer = GoalRowSerializer()
+        rows = row_serializer.values(queryset)
+
+        assert [list(row) for row in rows] == [row_serializer.columns]
+        assert 'ts_rank' not in str(rows.query).split(' FROM ')[0]
+
+
+@pytest.mark.django_db()
+class TestSideloadedUsers:
+
+    @pytest.fixture(autouse=True)
+    def setup(self, user, another_user, board_factory, goal_category_factory, goal_factory,
+              board_participant_factory) -> None:
+        board = board_factory.create(with_owner=user)
+        board_participant_factory.create(board=board, user=another_user)
+        category = goal_category_factory.create(board=board, user=user)
+        self.goals = [goal_factory.create(category=category, user=[user, another_user][i % 2]) for i in range(6)]
+
+    @pytest.mark.parametrize('params', [{'limit': 10}, {}])
+    def test_rows_carry_user_id(self, auth_client, user, another_user, django_assert_max_num_queries, params):
+        nested = auth_client.get(reverse('goals:goal_list'), params)
+
+        with django_assert_max_num_queries(7):
+            response = auth_client.get(reverse('goals:goal_list'), {**params, 'expand': 'users:sideload'})
+
+        data = response.json()
+        results = data['results']
+        assert 'user' not in results[0]
+        assert {goal['user_id'] for goal in results} == {user.id, another_user.id}
+        assert data['users'] == {str(goal['user']['id']): goal['user'] for goal in
+                                 (nested.json()['results'] if params else nested.json())}
+        assert len(response.content) < len(nested.content)
+
+    def test_unknown_expand_is_ignored(self, auth_client):
+        response = auth_client.get(reverse('goals:comment_list'), {'expand': 'boards:sideload'})
+
+        assert response.json() == []
@@ -0,0 +1,88 @@
+import pytest
+from django.urls import reverse
+from rest_framework import status
+
+from goals.models import BoardParticipant, Goal
+
+
+@pytest.mark.django_db()
+class TestSyncFeed:
+    url = reverse('goals:sync')
+
+    @pytest.fixture(autouse=True)
+    def setup(self, settings, user, another_user, board_factory, goal_category_factory, goal_factory,
+              goal_comment_factory) -> None:
+        settings.GOALS_SYNC_OVERLAP = 0
+        self.board = board_factory.create(with_owner=user)
+        BoardParticipant.objects.create(board=self.board, user=another_user, role=BoardParticipant.Role.writer)
+        self.shared = board_factory.create(with_owner=another_user)
+        self.membership = BoardParticipant.objects.create(board=self.shared, user=user,
+                                                          role=BoardParticipant.Role.writer)
+        self.category = goal_category_factory.create(board=self.board, user=user)
+        self.goals = [goal_factory.create(category=self.category, user=user) for _ in range(3)]
+        self.comment = goal_comment_factory.create(goal=self.goals[0], user=user)
+        self.shared_goal = goal_factory.create(category=goal_category_factory.create(board=self.shared), user=user)
+
+    @staticmethod
+    def ids(section):
+        return sorted(row['id'] for row in section['upserted'])
+
+    def test_initial_sync_returns_everything(self, auth_client):
+        data = auth_client.get(self.url).json()
+
+        assert self.ids(data['boards']) == sorted([self.board.id, self.shared.id])
+        assert self.ids(data['goals']) == sorted([goal.id for goal in self.goals] + [self.shared_goal.id])
+        assert self.ids(data['comments']) == [self.comment.id]
+        assert len(data['participants']['upserted']) == 4
+        assert data['token']
+
+    def test_delta_contains_only_changes(self, auth_client, another_user, goal_comment_factory, user):
+        token = auth_client.get(self.url).json()['token']
+        unchanged = auth_client.get(self.url, {'token': token}).json()
+        assert all(not unchanged[section]['upserted'] and not unchanged[section]['removed']
+                   for section in ('boards', 'categories', 'goals', 'comments', 'participants'))
+
+        self.goals[0].title = 'renamed'
+        self.goals[0].save()
+        self.goals[1].status = Goal.Status.archived
+        self.goals[1].save()
+        comment_id = self.comment.id
+        self.comment.delete()
+        new_comment = goal_comment_factory.create(goal=self.goals[2], user=user)
+        BoardParticipant.objects.filter(board=self.board, user=another_user).delete()
+        self.membership.delete()
+
+        data = auth_client.get(self.url, {'token': unchanged['token']}).json()
+
+        assert (self.ids(data['boards']), data['boards']['removed']) == ([], [self.shared.id])
+        assert (self.ids(data['goals']), data['goals']['removed']) == ([self.goals[0].id], [self.goals[1].id])
+        assert (self.ids(data['comments']), data['comments']['removed']) == ([new_comment.id], [comment_id])
+        assert len(data['participants']['removed']) == 1
+
+    def test_goal_moved_between_visible_boards_is_upserted(self, auth_client, goal_category_factory, user):
+        token = auth_client.get(self.url).json()['token']
+        self.goals[0].category = goal_category_factory.create(board=self.shared, user=user)
+        self.goals[0].save()
+
+        data = auth_client.get(self.url, {'token': token}).json()
+
+        assert (self.ids(data['goals']), data['goals']['removed']) == ([self.goals[0].id], [])
+        assert (self.ids(data['comments']), data['comments']['removed']) == ([self.comment.id], [])
+
+    def test_bulk_moved_goal_comments_are_upserted(self, auth_client, goal_category_factory, user):
+        token = auth_client.get(self.url).json()['token']
+        category = goal_category_factory.create(board=self.shared, user=user)
+        response = auth_client.patch(reverse('goals:goal_bulk'), [{'id': self.goals[0].id, 'category': category.id}],
+                                     format='json')
+        assert response.status_code == status.HTTP_200_OK
+
+        data = auth_client.get(self.url, {'token': token}).json()
+
+        assert (self.ids(data['comments']), data['comments']['removed']) == ([self.comment.id], [])
+
+    def test_rejects_foreign_or_forged_tokens(self, auth_client, client, another_user):
+        token = auth_client.get(self.url).json()['token']
+        client.force_login(another_user)
+
+        assert client.get(self.url, {'token': token}).status_code == status.HTTP_400_BAD_REQUEST
+        assert auth_client.get(self.url, {'token': token + 'x'}).status_code == status.HTTP_400_BAD_REQUEST
@@ -0,0 +1,267 @@
+"""
+Query-count and latency regression suite.
+
+Every endpoint of goals, core and bot is called twice: against a small seeded world and against a
+much larger one (more boards, participants, categories, goals and comments, and request bodies with
+more items). The number of SQL queries must equal the endpoint's expected count and must not grow with
+the data, and the request must fit the time budget. A failure prints the captured SQL, grouped by
+statement with the repeated ones first, which is where an N+1 shows up.
+"""
+import csv
+import io
+import re
+import time
+import uuid
+from collections import Counter
+from typing import Callable, List, NamedTuple, Optional
+from unittest.mock import patch
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import URLResolver, get_resolver, reverse
+from django.utils import timezone
+from rest_framework import status
+
+from bot.models import TgUser
+from bot.tg.client import TgClient
+from core.models import User
+from goals.models import Board, BoardParticipant, CascadeDeletion, Goal, GoalCategory, GoalComment
+
+
+SMALL: int = 2
+# larger than every query_count below, so one query per board, participant, category or goal breaks the count
+LARGE: int = 16
+# seconds per request, generous enough for a loaded CI runner
+TIME_BUDGET: float = 1.0
+PASSWORD: str = 'Perf-suite-password-1'
+URLCONFS = ('goals.urls', 'core.urls', 'bot.urls')
+
+
+class World:
+    """
+    ``n`` boards owned by the user, each with ``n`` other participants, ``n`` categories and ``n`` goals
+    spread over them, one comment per goal; plus the odd rows some endpoints need.
+    """
+
+    def __init__(self, user: User, n: int) -> None:
+
+        now = timezone.now()
+        tag: str = uuid.uuid4().hex[:8]
+        self.n: int = n
+        self.user: User = user
+        self.members: List[User] = User.objects.bulk_create(
+            [User(username=f'perf-{tag}-{i}', password='!') for i in range(n)])
+        self.boards: List[Board] = Board.objects.bulk_create(
+            [Board(title=f'board {i}', created=now, updated=now) for i in range(n)])
+        BoardParticipant.objects.bulk_create(
+            [BoardParticipant(board=board, user=user, role=BoardParticipant.Role.owner, created=now, updated=now)
+             for board in self.boards]
+            + [BoardParticipant(board=board, user=member, role=BoardParticipant.Role.writer, created=now,
+                                updated=now)
+               for board in self.boards for member in self.members])
+        self.categories: List[GoalCategory] = GoalCategory.objects.bulk_create(
+            [GoalCategory(board=board, user=user, title=f'category {i}', created=now, updated=now)
+             for board in self.boards for i in range(n)])
+        self.goals: List[Goal] = Goal.objects.bulk_create(
+            [Goal(category=self.categories[b * n + i], board_id=board.id, user=user, title=f'goal {i}', created=now,
+                  updated=now)
+             for b, board in enumerate(self.boards) for i in range(n)])
+        self.comments: List[GoalComment] = GoalComment.objects.bulk_create(
+            [GoalComment(goal=goal, board_id=goal.board_id, user=self.members[i % n], text='comment', created=now,
+                         updated=now)
+             for i, goal in enumerate(self.goals)])
+        self.board: Board = self.boards[0]
+        self.category: GoalCategory = self.categories[0]
+        self.goal: Goal = self.goals[0]
+        self.comment: GoalComment = GoalComment.objects.create(goal=self.goal, user=user, text='own comment')
+        self.cascade: CascadeDeletion = CascadeDeletion.objects.create(
+            board=self.boards[-1], stage=CascadeDeletion.Stage.finished)
+        self.tg_user: TgUser = TgUser.objects.create(chat_id=abs(hash(tag)) % 10 ** 9 + 1, verification_code=tag)
+        self.login_user: User = User.objects.create_user(username=f'perf-{tag}-login', password=PASSWORD)
+
+
+class Endpoint(NamedTuple):
+
+    name: str
+    method: str
+    query_count: int
+    args: Callable[[World], list] = lambda world: []
+    data: Optional[Callable[[World], object]] = None
+    status: int = status.HTTP_200_OK
+    content_type: str = 'application/json'
+    budget: float = TIME_BUDGET
+    user: Callable[[World], Optional[User]] = lambda world: world.user
+
+
+def import_csv(world: World) -> str:
+
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(['title', 'priority'])
+    writer.writerows([f'imported {i}', 2] for i in range(world.n * 10))
+    return buffer.getvalue()
+
+
+ENDPOINTS: List[Endpoint] = [
+    Endpoint('goals:create_board', 'post', 4, data=lambda world: {'title': 'new board'},
+             status=status.HTTP_201_CREATED),
+    Endpoint('goals:board_list', 'get', 4),
+    Endpoint('goals:board_stats_list', 'get', 6),
+    Endpoint('goals:board_detail', 'get', 5, args=lambda world: [world.board.pk]),
+    Endpoint('goals:board_detail', 'put', 14, args=lambda world: [world.board.pk], data=lambda world: {
+        'title': 'renamed',
+        'participants': [{'user': member.username, 'role': BoardParticipant.Role.reader}
+                         for member in world.members],
+    }),
+    Endpoint('goals:board_detail', 'patch', 9, args=lambda world: [world.board.pk],
+             data=lambda world: {'title': 'patched'}),
+    Endpoint('goals:board_detail', 'delete', 11, args=lambda world: [world.boards[1].pk],
+             status=status.HTTP_204_NO_CONTENT),
+    Endpoint('goals:board_export', 'get', 5, args=lambda world: [world.board.pk]),
+    Endpoint('goals:board_stats', 'get', 7, args=lambda world: [world.board.pk]),
+    Endpoint('goals:board_participants', 'post', 10, args=lambda world: [world.board.pk], data=lambda world: [
+        {'user': member.username, 'role': BoardParticipant.Role.reader} for member in world.members
+    ]),
+    Endpoint('goals:board_snapshot', 'get', 8, args=lambda world: [world.board.pk]),
+    Endpoint('goals:create_goal', 'post', 7, data=lambda world: {'title': 'new goal', 'category': world.category.pk},
+             status=status.HTTP_201_CREATED),
+    Endpoint('goals:goal_list', 'get', 5),
+    Endpoint('goals:goal_bulk', 'post', 7, data=lambda world: [
+        {'title': f'bulk {i}', 'category': category.pk} for i, category in enumerate(world.categories)
+    ], status=status.HTTP_201_CREATED),
+    Endpoint('goals:goal_bulk', 'patch', 7, data=lambda world: [
+        {'id': goal.pk, 'status': Goal.Status.done} for goal in world.goals
+    ]),
+    Endpoint('goals:goal_detail', 'get', 4, args=lambda world: [world.goal.pk]),
+    Endpoint('goals:goal_detail', 'put', 8, args=lambda world: [world.goal.pk],
+             data=lambda world: {'title': 'put', 'category': world.category.pk}),
+    Endpoint('goals:goal_detail', 'patch', 7, args=lambda world: [world.goal.pk],
+             data=lambda world: {'title': 'patched'}),
+    Endpoint('goals:goal_detail', 'delete', 7, args=lambda world: [world.goals[1].pk],
+             status=status.HTTP_204_NO_CONTENT),
+    Endpoint('goals:create_category', 'post', 5, data=lambda world: {'title': 'new', 'board': world.board.pk},
+             status=status.HTTP_201_CREATED),
+    Endpoint('goals:category_list', 'get', 4),
+    Endpoint('goals:category_import', 'post', 7, args=lambda world: [world.category.pk], data=import_csv,
+             content_type='text/csv'),
+    Endpoint('goals:category_detail', 'get', 4, args=lambda world: [world.category.pk]),
+    Endpoint('goals:category_detail', 'patch', 5, args=lambda world: [world.category.pk],
+             data=lambda world: {'title': 'patched'}),
+    Endpoint('goals:category_detail', 'delete', 9, args=lambda world: [world.categories[1].pk],
+             status=status.HTTP_204_NO_CONTENT),
+    Endpoint('goals:create_comment', 'post', 5, data=lambda world: {'text': 'new', 'goal': world.goal.pk},
+             status=status.HTTP_201_CREATED),
+    Endpoint('goals:comment_list', 'get', 3),
+    Endpoint('goals:comment_detail', 'get', 4, args=lambda world: [world.comment.pk]),
+    Endpoint('goals:comment_detail', 'patch', 5, args=lambda world: [world.comment.pk],
+             data=lambda world: {'text': 'patched'}),
+    Endpoint('goals:comment_detail', 'delete', 4, args=lambda world: [world.comment.pk],
+             status=status.HTTP_204_NO_CONTENT),
+    Endpoint('goals:sync', 'get', 7),
+    Endpoint('goals:cascade_detail', 'get', 3, args=lambda world: [world.cascade.pk]),
+    Endpoint('goals:cache_stats', 'get', 2),
+    Endpoint('core:signup', 'post', 2, data=lambda world: {
+        'username': f'{world.login_user.username}-new', 'first_name': 'first', 'last_name': 'last',
+        'email': 'perf@example.com', 'password': PASSWORD, 'password_repeat': PASSWORD,
+    }, status=status.HTTP_201_CREATED, budget=3 * TIME_BUDGET, user=lambda world: None),
+    Endpoint('core:login', 'post', 11, data=lambda world: {
+        'username': world.login_user.username, 'password': PASSWORD,
+    }, budget=3 * TIME_BUDGET, user=lambda world: None),
+    Endpoint('core:profile', 'get', 2),
+    Endpoint('core:profile', 'patch', 3, data=lambda world: {'first_name': 'patched'}),
+    Endpoint('core:profile', 'delete', 4, status=status.HTTP_204_NO_CONTENT),
+    Endpoint('core:update_password', 'put', 3, data=lambda world: {
+        'old_password': PASSWORD, 'new_password': PASSWORD + '-changed',
+    }, budget=3 * TIME_BUDGET, user=lambda world: world.login_user),
+    Endpoint('Bot-verify', 'patch', 4, data=lambda world: {'verification_code': world.tg_user.verification_code},
+             user=lambda world: world.login_user),
+]
+
+# Endpoints a request/response round trip cannot measure.
+SKIPPED = {
+    'goals:board_events': 'Server-Sent Events stream, held open for GOALS_EVENTS_MAX_AGE seconds',
+}
+
+
+def url_names() -> List[str]:
+
+    names: List[str] = []
+    for include in get_resolver().url_patterns:
+        if isinstance(include, URLResolver) and getattr(include.urlconf_module, '__name__', None) in URLCONFS:
+            prefix: str = f'{include.namespace}:' if include.namespace else ''
+            names += [prefix + pattern.name for pattern in include.url_patterns if pattern.name]
+    return names
+
+
+def normalize(sql: str) -> str:
+
+    sql = re.sub(r"'(?:[^']|'')*'", '?', sql)
+    sql = re.sub(r'\b\d+\b', '?', sql)
+    return re.sub(r'\(\?(?:, \?)+\)', '(?, ...)', sql)
+
+
+def report(queries: List[dict]) -> str:
+    """
+    The captured SQL grouped by statement, most repeated first.
+    """
+    counts: Counter = Counter(normalize(query['sql']) for query in queries)
+    return '\n'.join(f'{count}x {sql}' for sql, count in counts.most_common())
+
+
+class Measurement(NamedTuple):
+
+    status_code: int
+    queries: List[dict]
+    elapsed: float
+
+
+def measure(client, endpoint: Endpoint, world: World) -> Measurement:
+
+    user: Optional[User] = endpoint.user(world)
+    client.logout()
+    if user is not None:
+        client.force_login(user)
+    url: str = reverse(endpoint.name, args=endpoint.args(world))
+    data = endpoint.data(world) if endpoint.data is not None else None
+    if endpoint.content_type == 'application/json':
+        kwargs: dict = {'data': data, 'format': 'json'}
+    else:
+        kwargs = {'data': data.encode(), 'content_type': endpoint.content_type}
+
+    with patch.object(TgClient, 'send_message'), CaptureQueriesContext(connection) as context:
+        started: float = time.perf_counter()
+        response = getattr(client, endpoint.method)(url, **kwargs)
+        if response.streaming:
+            b''.join(response.streaming_content)
+        elapsed: float = time.perf_counter() - started
+    return Measurement(response.status_code, context.captured_queries, elapsed)
+
+
+@pytest.mark.django_db()
+class TestEndpointPerformance:
+
+    @pytest.fixture(autouse=True)
+    def setup(self, settings, user) -> None:
+        settings.GOALS_EXPORT_CHUNK_SIZE = 50
+        User.objects.filter(pk=user.pk).update(is_staff=True)
+        user.refresh_from_db()
+
+    def test_every_endpoint_is_covered(self):
+        covered = {endpoint.name for endpoint in ENDPOINTS} | set(SKIPPED)
+
+        assert set(url_names()) == covered
+        assert LARGE > max(endpoint.query_count for endpoint in ENDPOINTS)
+
+    @pytest.mark.parametrize('endpoint', ENDPOINTS, ids=lambda endpoint: f'{endpoint.method}-{endpoint.name}')
+    def test_queries_do_not_grow(self, client, user, endpoint):
+        small: Measurement = measure(client, endpoint, World(user, SMALL))
+        large: Measurement = measure(client, endpoint, World(user, LARGE))
+
+        assert (small.status_code, large.status_code) == (endpoint.status, endpoint.status)
+        count: int = len(large.queries)
+        assert count == endpoint.query_count, \
+            f'{count} queries, {endpoint.query_count} expected:\n{report(large.queries)}'
+        assert count <= len(small.queries), \
+            f'{len(small.queries)} queries with n={SMALL}, {count} with n={LARGE}:\n{report(large.queries)}'
+        assert large.elapsed <= endpoint.budget, f'{large.elapsed:.3f}s, budget {endpoint.budget}s'
@@ -34,6 +34,7 @@ INSTALLED_APPS = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
+    'django.contrib.postgres',
     'rest_framework',
     'core',
     'goals',
@@ -92,6 +93,20 @@ DATABASES = {
     }
 }
 
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+    'goals': {
+        'BACKEND': os.environ.get("GOALS_CACHE_BACKEND", 'django.core.cache.backends.locmem.LocMemCache'),
+        'LOCATION': os.environ.get("GOALS_CACHE_LOCATION", 'goals'),
+        'TIMEOUT': int(os.environ.get("GOALS_CACHE_TIMEOUT", 300)),
+        'OPTIONS': {
+            'MAX_ENTRIES': int(os.environ.get("GOALS_CACHE_MAX_ENTRIES", 10000)),
+        },
+    },
+}
+
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': [
         'rest_framework.authentication.BasicAuthentication',
@@ -159,4 +174,50 @@ MEDIA_ROOT = os.path.join(BASE_DIR, "django_media")
 
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
-TG_TOKEN = os.environ.get("TG_TOKEN")
\ No newline at end of file
+TG_TOKEN = os.environ.get("TG_TOKEN")
+
+BOARD_ROLES_CACHE_TIMEOUT = int(os.environ.get("BOARD_ROLES_CACHE_TIMEOUT", 0))
+
+GOALS_SEARCH_INCLUDE_COMMENTS = os.environ.get("GOALS_SEARCH_INCLUDE_COMMENTS", "") == "1"
+
+GOALS_RESPONSE_CACHE = os.environ.get("GOALS_RESPONSE_CACHE", "") == "1"
+
+GOALS_CASCADE_SYNC_LIMIT = int(os.environ.get("GOALS_CASCADE_SYNC_LIMIT", 1000))
+
+GOALS_CASCADE_CHUNK_SIZE = int(os.environ.get("GOALS_CASCADE_CHUNK_SIZE", 500))
+
+GOALS_CASCADE_CHUNK_PAUSE = float(os.environ.get("GOALS_CASCADE_CHUNK_PAUSE", 0))
+
+GOALS_CASCADE_BACKGROUND = os.environ.get("GOALS_CASCADE_BACKGROUND", "1") == "1"
+
+GOALS_SYNC_OVERLAP = int(os.environ.get("GOALS_SYNC_OVERLAP", 5))
+
+GOALS_SYNC_TOKEN_MAX_AGE = int(os.environ.get("GOALS_SYNC_TOKEN_MAX_AGE", 30 * 24 * 60 * 60))
+
+# "local" fans events out within the process, "postgres" across processes through LISTEN/NOTIFY.
+GOALS_EVENTS_BACKEND = os.environ.get("GOALS_EVENTS_BACKEND", "local")
+
+GOALS_EVENTS_QUEUE_SIZE = int(os.environ.get("GOALS_EVENTS_QUEUE_SIZE", 100))
+
+GOALS_EVENTS_KEEPALIVE = int(os.environ.get("GOALS_EVENTS_KEEPALIVE", 15))
+
+GOALS_EVENTS_MAX_AGE = int(os.environ.get("GOALS_EVENTS_MAX_AGE", 300))
+
+# Serve list and detail GETs through goals.async_views (only worthwhile under ASGI).
+GOALS_ASYNC_VIEWS = os.environ.get("GOALS_ASYNC_VIEWS", "") == "1"
+
+GOALS_EXPORT_CHUNK_SIZE = int(os.environ.get("GOALS_EXPORT_CHUNK_SIZE", 2000))
+
+GOALS_IMPORT_BATCH_SIZE = int(os.environ.get("GOALS_IMPORT_BATCH_SIZE", 5000))
+
+# Archived and soft-deleted goals untouched for this long are moved to the archive tables by archive_goals.
+GOALS_ARCHIVE_AFTER_DAYS = int(os.environ.get("GOALS_ARCHIVE_AFTER_DAYS", 90))
+
+GOALS_ARCHIVE_BATCH_SIZE = int(os.environ.get("GOALS_ARCHIVE_BATCH_SIZE", 1000))
+
+# Boards, categories and goals soft deleted for this long are hard deleted by purge_deleted.
+GOALS_PURGE_AFTER_DAYS = int(os.environ.get("GOALS_PURGE_AFTER_DAYS", 30))
+
+GOALS_PURGE_BATCH_SIZE = int(os.environ.get("GOALS_PURGE_BATCH_SIZE", 500))
+
+GOALS_PURGE_PAUSE = float(os.environ.get("GOALS_PURGE_PAUSE", 0.1))